@@ -15,45 +15,82 @@ __author__ = "Vijay K S, Abhay Pratap Singh"
 __email__ = "ksvijay2005@gmail.com"
 __license__ = "MIT"
 
-# Core Classes
-from .auditor import FSAuditor, Auditor
-from .dataset_audit import DatasetAuditor
-from .model_audit import ModelAuditor
-from .bias_detection import BiasDetector, BiasDetectionResult
-from .report_generator import ReportGenerator, Report, generate_html_report
-from .dashboard_push import Dashboard #SAPHANAConnector
-from .explainability import ExplainabilityEngine, ExplainabilityResult, explain_with_shap, explain_with_lime
-from .fairness_metrics import FairnessEngine, FairnessMetrics
-from .utils import Utils, preprocess_data, calculate_privilege_groups
-from .data_fingerprint import DataFingerprintEngine, DuplicateRecord
-from .illegal_data import IllegalDataDetector
-from .reweighing import Reweighing
-
-# Tiered Access System
-from .auth import (
-    require_premium_access, 
-    is_premium_feature, 
-    get_feature_tier, 
-    list_premium_features, 
-    list_free_features,
-    FeatureTier,
-    TieredAccessError,
-    APIKeyVerificationError
-)
-
-# Convenience imports for quick access
-from .bias_detection import (
-    detect_dataset_bias,
-    detect_model_bias,
-    compute_disparate_impact,
-    compute_statistical_parity
-)
-
-from .fairness_metrics import (
-    compute_demographic_parity,
-    compute_equal_opportunity,
-    compute_predictive_parity
-)
+# Public names are resolved lazily (PEP 562) so that `import fairsight` does
+# not pull in torch, faiss, shap or matplotlib until they are actually used.
+_LAZY_ATTRIBUTES = {
+    # Core classes
+    "FSAuditor": ".auditor",
+    "Auditor": ".auditor",
+    "DatasetAuditor": ".dataset_audit",
+    "DataQualityAccumulator": ".dataset_audit",
+    "ModelAuditor": ".model_audit",
+    "BiasDetector": ".bias_detection",
+    "BiasDetectionResult": ".bias_detection",
+    "ReportGenerator": ".report_generator",
+    "Report": ".report_generator",
+    "generate_html_report": ".report_generator",
+    "Dashboard": ".dashboard_push",
+    "ExplainabilityEngine": ".explainability",
+    "ExplainabilityResult": ".explainability",
+    "explain_with_shap": ".explainability",
+    "explain_with_lime": ".explainability",
+    "FairnessEngine": ".fairness_metrics",
+    "FairnessMetrics": ".fairness_metrics",
+    "FairnessAccumulator": ".fairness_metrics",
+    "ThresholdCurves": ".fairness_metrics",
+    "Utils": ".utils",
+    "preprocess_data": ".utils",
+    "calculate_privilege_groups": ".utils",
+    "DataFingerprintEngine": ".data_fingerprint",
+    "DuplicateRecord": ".data_fingerprint",
+    "IllegalDataDetector": ".illegal_data",
+    "detect_illegal_data": ".illegal_data",
+    "Reweighing": ".reweighing",
+    "GroupThresholdOptimizer": ".threshold_optimizer",
+    "MitigationSimulator": ".mitigation_simulator",
+    "PredictionCache": ".prediction_cache",
+    "CorrelationAccumulator": ".correlation",
+    "StratifiedSampler": ".sampling",
+    "EncoderRegistry": ".encoding",
+    "CategoryEncoder": ".encoding",
+    "DatasetProfile": ".profile",
+    "ColumnProfile": ".profile",
+    "column_profile": ".profile",
+
+    # Tiered access system
+    "require_premium_access": ".auth",
+    "is_premium_feature": ".auth",
+    "get_feature_tier": ".auth",
+    "list_premium_features": ".auth",
+    "list_free_features": ".auth",
+    "FeatureTier": ".auth",
+    "TieredAccessError": ".auth",
+    "APIKeyVerificationError": ".auth",
+
+    # Convenience functions
+    "detect_dataset_bias": ".bias_detection",
+    "detect_model_bias": ".bias_detection",
+    "compute_disparate_impact": ".bias_detection",
+    "compute_statistical_parity": ".bias_detection",
+    "compute_demographic_parity": ".fairness_metrics",
+    "compute_equal_opportunity": ".fairness_metrics",
+    "compute_predictive_parity": ".fairness_metrics",
+}
+
+
+def __getattr__(name):
+    """Import the submodule that defines `name` on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 # Main API Classes
 __all__ = [
@@ -61,6 +98,7 @@ __all__ = [
     "FSAuditor",
     "Auditor", 
     "DatasetAuditor",
+    "DataQualityAccumulator",
     "ModelAuditor",
     
     # Bias detection
@@ -74,6 +112,8 @@ __all__ = [
     # Fairness metrics
     "FairnessEngine",
     "FairnessMetrics", 
+    "FairnessAccumulator",
+    "ThresholdCurves",
     "compute_demographic_parity",
     "compute_equal_opportunity",
     "compute_predictive_parity",
@@ -90,6 +130,14 @@ __all__ = [
     
     # Utilities
     "Utils",
+    "PredictionCache",
+    "CorrelationAccumulator",
+    "StratifiedSampler",
+    "EncoderRegistry",
+    "CategoryEncoder",
+    "DatasetProfile",
+    "ColumnProfile",
+    "column_profile",
 
     #Data Fingerprint
     "DataFingerprintEngine",
@@ -100,6 +148,8 @@ __all__ = [
     "detect_illegal_data",
     # Bias mitigation
     "Reweighing",
+    "GroupThresholdOptimizer",
+    "MitigationSimulator",
     # Standalone utilities
     "explain_with_shap",
     "explain_with_lime",
@@ -0,0 +1,405 @@
+"""
+Fairsight Toolkit - Audit Frame
+===============================
+
+Shared, read-only dataset context for a single audit. The data is loaded (or
+parsed from CSV) once and every auditor works on views of it instead of its
+own copy. Derived columns such as model predictions are attached to views as
+side arrays, leaving the shared frame untouched.
+
+Besides CSV, Parquet and Feather / Arrow IPC files (memory-mapped) are read
+through pyarrow with column projection and row-filter pushdown.
+
+``estimate_memory`` predicts the in-memory size of a dataset from a small
+sample of rows, so callers can stream it in chunks instead when it would not
+fit a memory budget.
+"""
+
+import operator
+import os
+import re
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, Tuple
+import logging
+from .utils import MEMORY_OPTIMIZATION_ATTR, Utils
+
+logger = logging.getLogger(__name__)
+
+# File extensions read through pyarrow instead of pd.read_csv
+COLUMNAR_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "arrow",
+    ".arrow": "arrow",
+    ".ipc": "arrow",
+}
+
+# Row filters use the pyarrow/pandas DNF convention: a list of
+# (column, op, value) tuples is ANDed, a list of such lists is ORed.
+Filters = Sequence[Union[Tuple[str, str, Any], Sequence[Tuple[str, str, Any]]]]
+
+_FILTER_OPS = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda values, target: values.isin(target),
+    "not in": lambda values, target: ~values.isin(target),
+}
+
+
+def _filter_groups(filters: Filters) -> List[List[Tuple[str, str, Any]]]:
+    """Normalize filters to a list of AND-groups."""
+    if filters and isinstance(filters[0], tuple):
+        return [list(filters)]
+    return [list(group) for group in filters]
+
+
+def _filter_columns(filters: Optional[Filters]) -> List[str]:
+    """Columns referenced by the row filters."""
+    if not filters:
+        return []
+    return [column for group in _filter_groups(filters) for column, _, _ in group]
+
+
+def filter_mask(df: pd.DataFrame, filters: Filters) -> np.ndarray:
+    """
+    Evaluate DNF row filters against a DataFrame.
+
+    Args:
+        df: Data to filter
+        filters: List of (column, op, value) tuples, or a list of such lists
+
+    Returns:
+        Boolean mask of rows to keep
+    """
+    mask = np.zeros(len(df), dtype=bool)
+    for group in _filter_groups(filters):
+        group_mask = np.ones(len(df), dtype=bool)
+        for column, op, value in group:
+            if op not in _FILTER_OPS:
+                raise ValueError(f"Unsupported filter operator '{op}'")
+            group_mask &= np.asarray(_FILTER_OPS[op](df[column], value), dtype=bool)
+        mask |= group_mask
+    return mask
+
+
+def _project(columns: Optional[Sequence[str]], available: Sequence[str]) -> Optional[List[str]]:
+    """Requested columns that exist, in file order (None keeps everything)."""
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return [column for column in available if column in wanted]
+
+
+def read_table(path: str, columns: Optional[Sequence[str]] = None,
+               filters: Optional[Filters] = None) -> pd.DataFrame:
+    """
+    Read a CSV, Parquet or Feather/Arrow IPC file with projection and filters.
+
+    Columnar files only materialize the projected columns and let pyarrow
+    apply the row filters; Arrow IPC files are memory-mapped. CSV input is
+    parsed with ``usecols`` and filtered afterwards.
+
+    Args:
+        path: File path; the format is chosen from the extension
+        columns: Columns to load (all if None; unknown names are ignored)
+        filters: Row filters in DNF form, see ``filter_mask``
+
+    Returns:
+        DataFrame with the selected rows and columns
+    """
+    file_format = COLUMNAR_FORMATS.get(os.path.splitext(path)[1].lower(), "csv")
+    filter_columns = _filter_columns(filters)
+
+    if file_format == "csv":
+        projected = usecols = None
+        if columns is not None:
+            header = pd.read_csv(path, nrows=0).columns
+            projected = _project(columns, header)
+            usecols = _project(set(projected) | set(filter_columns), header)
+        df = pd.read_csv(path, usecols=usecols)
+        if filters:
+            df = df[filter_mask(df, filters)].reset_index(drop=True)
+        return df if projected is None else df[projected]
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required to read Parquet/Arrow files: pip install 'fairsight[columnar]'")
+
+    if file_format == "parquet":
+        projected = _project(columns, pq.read_schema(path).names)
+        table = pq.read_table(path, columns=projected, filters=filters or None, memory_map=True)
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+        projected = _project(columns, reader.schema.names)
+        table = reader.read_all()
+        if filters:
+            table = table.filter(pq.filters_to_expression(filters))
+        if projected is not None:
+            table = table.select(projected)
+
+    logger.info(f"📄 Read {table.num_rows} rows × {table.num_columns} columns from {path}")
+    return table.to_pandas()
+
+
+def iter_chunks(dataset: Union[str, pd.DataFrame], chunksize: int,
+                columns: Optional[Sequence[str]] = None,
+                filters: Optional[Filters] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream a dataset in row batches without materializing it.
+
+    CSV files are parsed with ``chunksize``, Parquet files are read row group
+    by row group and Arrow IPC files batch by batch from a memory map.
+    DataFrames are sliced, which is handy for bounding peak memory of
+    downstream per-chunk work.
+
+    Args:
+        dataset: File path or DataFrame
+        chunksize: Rows per batch (Parquet/Arrow batches may be smaller)
+        columns: Columns to read (all if None)
+        filters: Row filters in DNF form, applied to every batch
+
+    Yields:
+        DataFrame batches
+    """
+    def _finish(chunk: pd.DataFrame, projected: Optional[List[str]]) -> pd.DataFrame:
+        if filters:
+            chunk = chunk[filter_mask(chunk, filters)]
+        return chunk if projected is None else chunk[projected]
+
+    if not isinstance(dataset, str):
+        projected = _project(columns, dataset.columns)
+        for start in range(0, len(dataset), chunksize):
+            yield _finish(dataset.iloc[start:start + chunksize], projected)
+        return
+
+    file_format = COLUMNAR_FORMATS.get(os.path.splitext(dataset)[1].lower(), "csv")
+    filter_columns = _filter_columns(filters)
+
+    if file_format == "csv":
+        header = pd.read_csv(dataset, nrows=0).columns
+        projected = _project(columns, header)
+        usecols = None if projected is None else _project(set(projected) | set(filter_columns), header)
+        for chunk in pd.read_csv(dataset, usecols=usecols, chunksize=chunksize):
+            yield _finish(chunk, projected)
+        return
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required to read Parquet/Arrow files: pip install 'fairsight[columnar]'")
+
+    if file_format == "parquet":
+        parquet_file = pq.ParquetFile(dataset, memory_map=True)
+        projected = _project(columns, parquet_file.schema_arrow.names)
+        read_columns = None if projected is None else _project(
+            set(projected) | set(filter_columns), parquet_file.schema_arrow.names)
+        batches = parquet_file.iter_batches(batch_size=chunksize, columns=read_columns)
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(dataset, "r"))
+        projected = _project(columns, reader.schema.names)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+
+    for batch in batches:
+        for start in range(0, batch.num_rows, chunksize):
+            yield _finish(batch.slice(start, chunksize).to_pandas(), projected)
+
+
+_MEMORY_UNITS = {"": 1, "B": 1, "KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30, "TB": 1 << 40}
+
+
+def parse_memory(size: Union[int, float, str]) -> int:
+    """
+    Parse a memory size such as 2_000_000, "512MB" or "4 GB" into bytes.
+
+    Args:
+        size: Bytes as a number, or a string with a B/KB/MB/GB/TB suffix (binary units)
+
+    Returns:
+        Size in bytes
+    """
+    if isinstance(size, (int, float)):
+        return int(size)
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?B?)\s*", size.upper())
+    if not match:
+        raise ValueError(f"Cannot parse memory size '{size}'")
+    number, unit = match.groups()
+    unit = unit if unit.endswith("B") or not unit else unit + "B"
+    return int(float(number) * _MEMORY_UNITS[unit])
+
+
+def estimate_memory(dataset: Union[str, pd.DataFrame, "AuditFrame"],
+                    columns: Optional[Sequence[str]] = None,
+                    sample_rows: int = 10_000) -> Tuple[int, int]:
+    """
+    Estimate the pandas memory footprint of a dataset without loading it.
+
+    The bytes per row of the first ``sample_rows`` rows are scaled by the
+    row count, which Parquet and Arrow files store in their metadata. For
+    CSV the row count is extrapolated from the file size. Row filters are
+    ignored, so the estimate is an upper bound for filtered loads.
+
+    Args:
+        dataset: File path, DataFrame or AuditFrame
+        columns: Columns that would be loaded (all if None)
+        sample_rows: Rows read to measure the bytes per row
+
+    Returns:
+        Tuple of (estimated bytes, estimated rows)
+    """
+    if not isinstance(dataset, str):
+        df = dataset.frame if isinstance(dataset, AuditFrame) else dataset
+        projected = _project(columns, df.columns)
+        df = df if projected is None else df[projected]
+        return int(df.memory_usage(index=False, deep=True).sum()), len(df)
+
+    sample = next(iter_chunks(dataset, sample_rows, columns=columns), None)
+    if sample is None or len(sample) == 0:
+        return 0, 0
+    bytes_per_row = sample.memory_usage(index=False, deep=True).sum() / len(sample)
+
+    file_format = COLUMNAR_FORMATS.get(os.path.splitext(dataset)[1].lower(), "csv")
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+        n_rows = pq.ParquetFile(dataset).metadata.num_rows
+    elif file_format == "arrow":
+        import pyarrow as pa
+        reader = pa.ipc.open_file(pa.memory_map(dataset, "r"))
+        n_rows = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+    else:
+        with open(dataset, "rb") as fp:
+            head = [len(line) for _, line in zip(range(len(sample) + 1), fp)]
+        data_bytes = sum(head[1:])
+        n_rows = len(sample) if len(sample) < sample_rows else int(
+            (os.path.getsize(dataset) - head[0]) / max(data_bytes, 1) * len(sample))
+    return int(bytes_per_row * n_rows), n_rows
+
+
+class AuditFrame:
+    """
+    Immutable dataset context shared by the auditors of one audit run.
+
+    ``frame`` is the single underlying DataFrame and must not be modified.
+    ``view()`` returns shallow copies: they share the column data, and
+    assigning a column on a view replaces it in that view only.
+    """
+
+    def __init__(self, df: pd.DataFrame, source: Optional[str] = None):
+        """
+        Initialize AuditFrame.
+
+        Args:
+            df: DataFrame to share (not copied)
+            source: Path the data was read from, if any
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(f"AuditFrame expects a DataFrame, got {type(df).__name__}")
+        self._df = df
+        self.source = source
+
+    @classmethod
+    def load(cls, dataset: Union[str, pd.DataFrame, "AuditFrame", Any],
+             columns: Optional[Sequence[str]] = None,
+             filters: Optional[Filters] = None,
+             optimize_memory: bool = False,
+             categorical_columns: Optional[Sequence[str]] = None) -> "AuditFrame":
+        """
+        Wrap a dataset, reading files only once.
+
+        Args:
+            dataset: CSV/Parquet/Feather/Arrow path, DataFrame, pyarrow Table
+                or an existing AuditFrame
+            columns: Columns to keep (all if None; unknown names are ignored)
+            filters: Row filters in DNF form, pushed down to columnar readers
+            optimize_memory: Downcast numeric columns and convert low-cardinality
+                strings to category, see Utils.optimize_dtypes()
+            categorical_columns: Columns always converted to category when
+                optimizing (e.g. protected attributes)
+
+        Returns:
+            AuditFrame (the same object if one was passed in unchanged)
+        """
+        if isinstance(dataset, str):
+            logger.info(f"📄 Loading shared audit frame from {dataset}")
+            return cls(read_table(dataset, columns, filters), source=dataset)._optimized(
+                optimize_memory, categorical_columns)
+
+        if isinstance(dataset, AuditFrame):
+            if columns is None and not filters:
+                return dataset._optimized(optimize_memory, categorical_columns)
+            source, df = dataset.source, dataset.frame
+        else:
+            source = None
+            df = dataset.to_pandas() if hasattr(dataset, "to_pandas") and hasattr(dataset, "schema") else dataset
+
+        if filters:
+            df = df[filter_mask(df, filters)]
+        projected = _project(columns, df.columns)
+        if projected is not None:
+            df = df[projected]
+        return cls(df, source=source)._optimized(optimize_memory, categorical_columns)
+
+    def _optimized(self, optimize_memory: bool,
+                   categorical_columns: Optional[Sequence[str]] = None) -> "AuditFrame":
+        """This frame with compact dtypes (itself if not requested or already optimized)."""
+        if not optimize_memory or MEMORY_OPTIMIZATION_ATTR in self._df.attrs:
+            return self
+        categorical_columns = [col for col in categorical_columns or [] if col in self._df.columns]
+        return AuditFrame(Utils.optimize_dtypes(self._df, categorical_columns), source=self.source)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The shared DataFrame; treat as read-only."""
+        return self._df
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._df.shape
+
+    @property
+    def columns(self) -> pd.Index:
+        return self._df.columns
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def array(self, column: str) -> np.ndarray:
+        """
+        Column values as a NumPy array, without copying where pandas allows.
+
+        Args:
+            column: Column name
+
+        Returns:
+            Array backed by the shared frame
+        """
+        return self._df[column].to_numpy()
+
+    def view(self, columns: Optional[List[str]] = None,
+             extra: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
+        """
+        Shallow view of the shared frame.
+
+        Args:
+            columns: Columns to keep (all if None)
+            extra: Side arrays attached to this view only, e.g. predictions
+
+        Returns:
+            DataFrame sharing column data with the audit frame
+        """
+        df = self._df if columns is None else self._df[columns]
+        df = df.copy(deep=False)
+        for name, values in (extra or {}).items():
+            values = np.asarray(values)
+            if len(values) != len(df):
+                raise ValueError(f"Side array '{name}' has {len(values)} rows, expected {len(df)}")
+            df[name] = values
+        return df
@@ -8,13 +8,15 @@ fairness and bias auditing for both datasets and machine learning models.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
 from datetime import datetime
 import json
 import warnings
 from .auth import verify, APIKeyVerificationError, require_premium_access, TieredAccessError
 from .registry_client import FairsightRegistryClient
+from .prediction_cache import PredictionCache
+from .audit_frame import AuditFrame, Filters, estimate_memory, iter_chunks, parse_memory
 
 logger = logging.getLogger(__name__)
 
@@ -43,12 +45,17 @@ class FSAuditor:
                  enable_sap_integration: bool = True,
                  user_api_key: Optional[str] = None,
                  api_base_url: str = "http://localhost:5000",
-                 registry_api_url: str = "http://localhost:3000"):
+                 registry_api_url: str = "http://localhost:3000",
+                 prediction_cache_dir: Optional[str] = None,
+                 columns: Optional[List[str]] = None,
+                 filters: Optional[Filters] = None,
+                 optimize_memory: bool = False,
+                 max_memory: Optional[Union[int, str]] = None):
         """
         Initialize FSAuditor.
 
         Args:
-            dataset: Dataset path or DataFrame
+            dataset: Dataset path (CSV/Parquet/Feather/Arrow) or DataFrame
             model: Trained model for auditing
             X_test: Test features (if separate from dataset)
             y_test: Test targets (if separate from dataset)  
@@ -61,6 +68,15 @@ class FSAuditor:
             user_api_key: API key for premium features
             api_base_url: Base URL for API verification backend (port 5000)
             registry_api_url: Base URL for registry API backend (port 3000)
+            prediction_cache_dir: Directory to persist model predictions across audits
+            columns: Columns to load from ``dataset`` (all if None)
+            filters: Row filters pushed down to the reader, e.g. [("year", ">=", 2020)]
+            optimize_memory: Load the dataset with compact dtypes (downcast
+                numerics, low-cardinality strings and sensitive features as category)
+            max_memory: Memory budget for the dataset, in bytes or as "4GB". When
+                the estimated footprint exceeds it, the dataset audit and bias
+                detection stream the data in chunks instead of loading it, and
+                the model audit reads only its hold-out split
         """
         # Core parameters
         self.dataset = dataset
@@ -77,6 +93,16 @@ class FSAuditor:
         self.api_base_url = api_base_url
         self.registry_api_url = registry_api_url
 
+        # Every stage that runs the model shares one prediction cache, and
+        # every stage reads the dataset through one shared AuditFrame
+        self.prediction_cache = PredictionCache(cache_dir=prediction_cache_dir)
+        self.columns = columns
+        self.filters = filters
+        self.optimize_memory = optimize_memory
+        self.max_memory = parse_memory(max_memory) if max_memory is not None else None
+        self._audit_frame = None
+        self._chunksize = None
+
         # Results storage
         self.audit_results = {}
         self.session_id = None
@@ -101,6 +127,66 @@ class FSAuditor:
         if self.model is None and self.dataset is None:
             raise ValueError("At least one of dataset or model must be provided")
 
+    @property
+    def audit_frame(self) -> Optional[AuditFrame]:
+        """Dataset loaded once and shared by all audit stages (None without a dataset)."""
+        if self._audit_frame is None and self.dataset is not None:
+            self._audit_frame = AuditFrame.load(self.dataset, columns=self.columns, filters=self.filters,
+                                                optimize_memory=self.optimize_memory,
+                                                categorical_columns=self.sensitive_features)
+        return self._audit_frame
+
+    @property
+    def chunksize(self) -> Optional[int]:
+        """
+        Rows per chunk when the dataset is estimated to exceed max_memory,
+        None when it is loaded whole. Chunks take a quarter of the budget.
+        """
+        if self.max_memory is None or self.dataset is None:
+            return None
+        if self._chunksize is None:
+            footprint, n_rows = estimate_memory(self._audit_frame or self.dataset, columns=self.columns)
+            self._chunksize = 0
+            if footprint > self.max_memory and n_rows:
+                self._chunksize = max(1_000, int(n_rows * (self.max_memory / 4) / footprint))
+                logger.warning(f"⚠️ Estimated dataset footprint {footprint / 1024 / 1024:.1f} MB exceeds "
+                               f"max_memory {self.max_memory / 1024 / 1024:.1f} MB; "
+                               f"streaming in chunks of {self._chunksize} rows")
+        return self._chunksize or None
+
+    def _dataset_source(self) -> Union[str, pd.DataFrame, AuditFrame]:
+        """The dataset to stream when over budget, otherwise the shared AuditFrame."""
+        return (self._audit_frame or self.dataset) if self.chunksize else self.audit_frame
+
+    def _streamed_test_split(self) -> Optional[Tuple[pd.DataFrame, pd.Series]]:
+        """
+        ModelAuditor's hold-out split (the last 20% of rows), read in chunks.
+
+        Only the model's features, the target and the sensitive features are
+        read, so the over-budget dataset is never loaded whole. Returns None
+        when the model does not record ``feature_names_in_`` or no target is
+        set, as the columns to keep are then unknown.
+        """
+        feature_names = getattr(self.model, 'feature_names_in_', None)
+        if feature_names is None or not self.target:
+            return None
+        source = self._dataset_source()
+        source = source.frame if isinstance(source, AuditFrame) else source
+        columns = list(dict.fromkeys(list(feature_names) + [self.target] + self.sensitive_features))
+
+        # First pass counts the rows (target column only), second keeps the tail
+        n_rows = sum(len(chunk) for chunk in iter_chunks(source, self.chunksize, columns=[self.target],
+                                                         filters=self.filters))
+        start = n_rows - int(0.2 * n_rows)
+        kept, seen = [], 0
+        for chunk in iter_chunks(source, self.chunksize, columns=columns, filters=self.filters):
+            if seen + len(chunk) > start:
+                kept.append(chunk.iloc[max(start - seen, 0):])
+            seen += len(chunk)
+        df_test = pd.concat(kept, ignore_index=True) if kept else pd.DataFrame(columns=columns)
+        logger.info(f"📊 Streamed hold-out split for the model audit: {len(df_test)} of {n_rows} rows")
+        return df_test.drop(columns=[self.target]), df_test[self.target]
+
     def set_justified_attributes(self, attributes: List[str]):
         """
         Set attributes that are justified for discrimination.
@@ -111,10 +197,15 @@ class FSAuditor:
         self.justified_attributes = attributes
         logger.info(f"📋 Updated justified attributes: {attributes}")
 
-    def run_dataset_audit(self) -> Dict[str, Any]:
+    def run_dataset_audit(self, quick: bool = False,
+                          sample_fraction: Optional[float] = None) -> Dict[str, Any]:
         """
         Run comprehensive dataset audit.
 
+        Args:
+            quick: Audit a stratified sample, with confidence intervals
+            sample_fraction: Fraction sampled per stratum (implies quick)
+
         Returns:
             Dataset audit results
         """
@@ -129,13 +220,16 @@ class FSAuditor:
             from .dataset_audit import DatasetAuditor
 
             dataset_auditor = DatasetAuditor(
-                dataset=self.dataset,
+                dataset=self._dataset_source(),
                 protected_attributes=self.sensitive_features,
                 target_column=self.target,
-                justified_attributes=self.justified_attributes
+                justified_attributes=self.justified_attributes,
+                columns=self.columns if self.chunksize else None,
+                filters=self.filters if self.chunksize else None,
+                chunksize=self.chunksize
             )
 
-            dataset_results = dataset_auditor.audit()
+            dataset_results = dataset_auditor.audit(quick=quick, sample_fraction=sample_fraction)
             logger.info("✅ Dataset audit completed")
             return dataset_results
 
@@ -157,17 +251,32 @@ class FSAuditor:
         # Basic model audit is free - no API key required
         logger.info("🤖 Running model audit...")
 
+        X_test, y_test = self.X_test, self.y_test
+        has_test_data = X_test is not None and y_test is not None
+        if self.chunksize and not has_test_data:
+            split = self._streamed_test_split()
+            if split is None:
+                message = ("Dataset exceeds max_memory and the model does not record feature_names_in_ "
+                           "(or no target is set); pass X_test/y_test to audit the model without "
+                           "loading the full dataset")
+                logger.warning(f"⚠️ Skipping model audit: {message}")
+                return {'error': message}
+            X_test, y_test = split
+            has_test_data = True
+
         try:
             from .model_audit import ModelAuditor
 
             model_auditor = ModelAuditor(
                 model=self.model,
-                dataset=self.dataset,
-                X_test=self.X_test,
-                y_test=self.y_test,
+                # With test data the dataset is not needed, so it is not loaded either
+                dataset=None if self.chunksize and has_test_data else self.audit_frame,
+                X_test=X_test,
+                y_test=y_test,
                 protected_attributes=self.sensitive_features,
                 target_column=self.target,
-                justified_attributes=self.justified_attributes
+                justified_attributes=self.justified_attributes,
+                prediction_cache=self.prediction_cache
             )
 
             model_results = model_auditor.audit()
@@ -178,10 +287,15 @@ class FSAuditor:
             logger.error(f"❌ Model audit failed: {e}")
             return {'error': str(e)}
 
-    def run_comprehensive_bias_detection(self) -> Dict[str, Any]:
+    def run_comprehensive_bias_detection(self, quick: bool = False,
+                                         sample_fraction: Optional[float] = None) -> Dict[str, Any]:
         """
         Run comprehensive bias detection across dataset and model.
 
+        Args:
+            quick: Estimate the metrics from a stratified sample, with confidence intervals
+            sample_fraction: Fraction sampled per stratum (implies quick)
+
         Returns:
             Combined bias detection results
         """
@@ -192,17 +306,20 @@ class FSAuditor:
 
             # Initialize bias detector
             detector = BiasDetector(
-                dataset=self.dataset,
+                dataset=self._dataset_source(),
                 model=self.model,
                 sensitive_features=self.sensitive_features,
                 target=self.target,
                 privileged_values=self.privileged_groups,
                 justified_attributes=self.justified_attributes,
-                threshold=self.fairness_threshold
+                threshold=self.fairness_threshold,
+                prediction_cache=self.prediction_cache,
+                filters=self.filters if self.chunksize else None,
+                chunksize=self.chunksize
             )
 
             # Run detection
-            bias_results = detector.detect()
+            bias_results = detector.detect(quick=quick, sample_fraction=sample_fraction)
 
             # Generate summary report
             summary_report = detector.get_summary_report(bias_results)
@@ -338,7 +455,9 @@ class FSAuditor:
                   generate_report: bool = True,
                   push_to_dashboard: bool = True,
                   push_to_registry: bool = False,
-                  connection_params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                  connection_params: Optional[Dict[str, str]] = None,
+                  quick: bool = False,
+                  sample_fraction: Optional[float] = None) -> Dict[str, Any]:
         """
         Run comprehensive audit with all components.
 
@@ -350,6 +469,10 @@ class FSAuditor:
             push_to_dashboard: Whether to push to dashboard
             push_to_registry: Whether to push to registry (premium feature)
             connection_params: Dictionary with SAP HANA connection details (required if push_to_dashboard is True)
+            quick: Run the dataset audit and bias detection on a stratified
+                sample (protected attributes × target); results carry
+                bootstrap confidence intervals and the sample size
+            sample_fraction: Fraction sampled per stratum (implies quick; 0.1 by default)
 
         Returns:
             Complete audit results
@@ -381,13 +504,14 @@ class FSAuditor:
                 'model_provided': self.model is not None,
                 'sensitive_features': self.sensitive_features,
                 'justified_attributes': self.justified_attributes,
-                'fairness_threshold': self.fairness_threshold
+                'fairness_threshold': self.fairness_threshold,
+                'quick': quick or sample_fraction is not None
             }
         }
 
         # Dataset audit
         if include_dataset and self.dataset is not None:
-            dataset_results = self.run_dataset_audit()
+            dataset_results = self.run_dataset_audit(quick=quick, sample_fraction=sample_fraction)
             audit_results['dataset_audit'] = dataset_results
 
         # Model audit
@@ -397,7 +521,7 @@ class FSAuditor:
 
         # Comprehensive bias detection
         if include_bias_detection:
-            bias_results = self.run_comprehensive_bias_detection()
+            bias_results = self.run_comprehensive_bias_detection(quick=quick, sample_fraction=sample_fraction)
             audit_results['bias_detection'] = bias_results
 
         # Calculate overall ethical score
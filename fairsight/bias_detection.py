@@ -8,10 +8,13 @@ justified attributes that should not be flagged as discriminatory bias.
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import confusion_matrix
 from typing import List, Optional, Union, Dict, Any, Tuple
 import logging
 from .utils import Utils
+from .prediction_cache import PredictionCache
+from .audit_frame import AuditFrame, Filters, iter_chunks
+from .encoding import factorize_keep_na
+from .sampling import QUICK_SAMPLE_FRACTION, StratifiedSample, StratifiedSampler
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,37 @@ class BiasDetectionResult:
         status = "JUSTIFIED" if self.justified else ("BIASED" if self.biased else "FAIR")
         return f"BiasResult({self.attribute}.{self.metric_name}: {self.value:.3f} [{status}])"
 
+def _value_key(value: Any) -> Any:
+    """Dictionary key for an attribute value; all missing values share one key."""
+    return None if pd.isna(value) else value
+
+
+def _add_outcome_tables(tables: Dict[str, Dict[str, Any]], feature: str, table: Dict[str, Any]):
+    """Add a chunk's per-value outcome table to the running totals, growing them for new values."""
+    total = tables.setdefault(feature, {})
+    for key, values in table.items():
+        if key == "outcome_error":
+            total.setdefault(key, values)
+            continue
+        current = total.get(key, np.zeros(0, dtype=values.dtype))
+        grown = np.zeros(max(len(current), len(values)), dtype=np.result_type(current, values))
+        grown[:len(current)] += current
+        grown[:len(values)] += values
+        total[key] = grown
+
+
+def _collapse_outcome_table(table: Dict[str, Any], privileged_mask: np.ndarray) -> Dict[str, Any]:
+    """Reduce a per-value outcome table to [privileged, unprivileged] sums."""
+    collapsed = {}
+    for key, values in table.items():
+        if key == "outcome_error":
+            collapsed[key] = values
+            continue
+        values = np.concatenate([values, np.zeros(len(privileged_mask) - len(values), dtype=values.dtype)])
+        collapsed[key] = np.array([values[privileged_mask].sum(), values[~privileged_mask].sum()])
+    return collapsed
+
+
 class BiasDetector:
     """
     Enhanced bias detection with support for justified attributes.
@@ -56,32 +90,59 @@ class BiasDetector:
     """
 
     def __init__(self, 
-                 dataset: Optional[Union[str, pd.DataFrame]] = None,
+                 dataset: Optional[Union[str, pd.DataFrame, AuditFrame]] = None,
                  model: Optional[Any] = None,
                  sensitive_features: Optional[List[str]] = None,
                  target: Optional[str] = None,
                  privileged_values: Optional[Dict[str, Any]] = None,
                  justified_attributes: Optional[List[str]] = None,
-                 threshold: float = 0.8):
+                 threshold: float = 0.8,
+                 prediction_cache: Optional[PredictionCache] = None,
+                 filters: Optional[Filters] = None,
+                 chunksize: Optional[int] = None,
+                 optimize_memory: bool = False,
+                 sample_weight: Optional[Union[str, np.ndarray, pd.Series]] = None):
         """
         Initialize BiasDetector.
 
         Args:
-            dataset: Dataset path or DataFrame
+            dataset: Dataset path (CSV/Parquet/Feather/Arrow), DataFrame or shared AuditFrame
             model: Trained model for prediction-based bias detection
             sensitive_features: List of sensitive/protected attributes
             target: Target column name
             privileged_values: Dict mapping attributes to privileged values
             justified_attributes: List of attributes justified for discrimination
             threshold: Fairness threshold (default 0.8 for 80% rule)
+            prediction_cache: Cache shared with other auditors (a private one is created if None)
+            filters: Row filters applied while loading, e.g. [("year", ">=", 2020)]
+            chunksize: Stream the dataset in batches of this many rows instead
+                of loading it; detect() then makes a single pass over it
+            optimize_memory: Load the dataset with compact dtypes (see Utils.optimize_dtypes)
+            sample_weight: Row weights (e.g. survey or Reweighing weights), as a
+                column name of the dataset or an array aligned with its rows;
+                every rate becomes a weighted rate
         """
-        self.dataset = self._load_dataset(dataset) if dataset is not None else None
         self.model = model
+        self.sample_weight = sample_weight
         self.sensitive_features = sensitive_features or []
         self.target = target
         self.privileged_values = privileged_values or {}
         self.justified_attributes = justified_attributes or []
         self.threshold = threshold
+        self.prediction_cache = prediction_cache or PredictionCache()
+        self.chunksize = chunksize
+        self.dataset = None
+        if chunksize and dataset is not None:
+            # Privileged groups default to the most common value, found while streaming
+            self._chunk_source = dataset.frame if isinstance(dataset, AuditFrame) else dataset
+            self._chunk_filters = filters
+        elif dataset is not None:
+            self.dataset = self._load_dataset(dataset, filters, optimize_memory)
+
+        if (self.dataset is not None and sample_weight is not None and not isinstance(sample_weight, str)
+                and len(sample_weight) != len(self.dataset)):
+            raise ValueError(f"sample_weight has {len(sample_weight)} entries but the dataset has "
+                             f"{len(self.dataset)} rows")
 
         # Auto-determine privileged groups if not provided
         if self.dataset is not None and not self.privileged_values:
@@ -92,11 +153,53 @@ class BiasDetector:
         logger.info(f"🔍 BiasDetector initialized")
         logger.info(f"📋 Justified attributes: {self.justified_attributes}")
 
-    def _load_dataset(self, dataset: Union[str, pd.DataFrame]) -> pd.DataFrame:
-        """Load dataset from path or return DataFrame."""
-        if isinstance(dataset, str):
-            return pd.read_csv(dataset)
-        return dataset.copy()
+    def _load_dataset(self, dataset: Union[str, pd.DataFrame, AuditFrame],
+                      filters: Optional[Filters] = None,
+                      optimize_memory: bool = False) -> pd.DataFrame:
+        """
+        Load dataset from path, or return a view of the DataFrame / AuditFrame.
+
+        Without a model only the target, sensitive and justified attributes are
+        needed, so only those columns are read.
+        """
+        return AuditFrame.load(dataset, columns=self._needed_columns(), filters=filters,
+                               optimize_memory=optimize_memory,
+                               categorical_columns=self.sensitive_features).view()
+
+    def _needed_columns(self) -> Optional[List[str]]:
+        """Columns to read: all with a model, else target plus attributes."""
+        if self.model is None and self.target is not None and self.sensitive_features:
+            weight_column = [self.sample_weight] if isinstance(self.sample_weight, str) else []
+            return ([self.target] + self.sensitive_features + self.justified_attributes
+                    + list(self.privileged_values) + weight_column)
+        return None
+
+    def _row_weights(self, df: pd.DataFrame, offset: int = 0) -> Optional[np.ndarray]:
+        """Sample weights of df's rows, which start at row ``offset`` of the dataset."""
+        if self.sample_weight is None:
+            return None
+        if isinstance(self.sample_weight, str):
+            if self.sample_weight not in df.columns:
+                raise ValueError(f"Sample weight column '{self.sample_weight}' not found")
+            return df[self.sample_weight].to_numpy(dtype=float)
+        weights = np.asarray(self.sample_weight, dtype=float)[offset:offset + len(df)]
+        if len(weights) != len(df):
+            raise ValueError(f"sample_weight has {len(self.sample_weight)} entries, fewer than the "
+                             f"{offset + len(df)} rows seen")
+        return weights
+
+    def _checked_weights(self, df: pd.DataFrame, weights: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Explicit weights of df's rows, else the detector's sample weights."""
+        if weights is None:
+            return self._row_weights(df)
+        if len(weights) != len(df):
+            raise ValueError(f"weights has {len(weights)} entries but the DataFrame has {len(df)} rows")
+        return weights
+
+    def _features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Model inputs: every column but the target and a sample weight column."""
+        drop = [self.target] + ([self.sample_weight] if isinstance(self.sample_weight, str) else [])
+        return df.drop(columns=[col for col in drop if col in df.columns])
 
     def set_justified_attributes(self, attributes: List[str]):
         """Set attributes that are justified for discrimination."""
@@ -114,14 +217,87 @@ class BiasDetector:
         """Safely divide two numbers."""
         return Utils.safe_divide(a, b)
 
+    def _group_outcome_table(self, outcome: np.ndarray, privileged_mask: np.ndarray,
+                             label: Optional[np.ndarray] = None,
+                             weights: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Count everything the metric helpers need for both groups in one pass.
+
+        Every entry is an array of length 2: index 0 is the privileged group,
+        index 1 the unprivileged group.
+
+        Args:
+            outcome: Column whose mean is the favorable rate (target or predictions)
+            privileged_mask: Boolean mask of privileged rows
+            label: True labels, required for the prediction-quality metrics
+            weights: Row weights (e.g. sampling design weights); counts become weighted sums
+        """
+        group = (~np.asarray(privileged_mask, dtype=bool)).astype(np.int64)
+        return self._outcome_table_by_code(outcome, group, 2, label, weights)
+
+    def _outcome_table_by_code(self, outcome: np.ndarray, group: np.ndarray, n_groups: int,
+                               label: Optional[np.ndarray] = None,
+                               weights: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Group outcome table for any number of integer-coded groups."""
+        outcome = np.asarray(outcome)
+        weights = np.asarray(weights, dtype=float) if weights is not None else None
+        table = {"count": np.bincount(group, weights=weights, minlength=n_groups)}
+
+        try:
+            values = outcome.astype(float)
+            observed = ~np.isnan(values)  # NaNs are skipped by the mean, as in pandas
+            w = weights[observed] if weights is not None else None
+            table["outcome_sum"] = np.bincount(group[observed], weights=values[observed] * (w if w is not None else 1),
+                                               minlength=n_groups)
+            table["outcome_count"] = np.bincount(group[observed], weights=w, minlength=n_groups)
+        except (TypeError, ValueError) as e:
+            # Non-numeric outcomes only break the rate metrics, not the confusion counts
+            table["outcome_error"] = e
+
+        if label is not None:
+            label = np.asarray(label)
+            label_state = np.where(label == 1, 0, np.where(label == 0, 1, 2))
+            cells = np.bincount(
+                group * 6 + label_state * 2 + (outcome != 1), weights=weights, minlength=n_groups * 6
+            ).reshape(n_groups, 3, 2)  # (group, label 1/0/other, prediction 1/other)
+            table.update({
+                "true_positive": cells[:, 0, 0],
+                "false_positive": cells[:, 1, 0],
+                "actual_positive": cells[:, 0, :].sum(axis=1),
+                "actual_negative": cells[:, 1, :].sum(axis=1),
+                "predicted_positive": cells[:, :, 0].sum(axis=1)
+            })
+
+        return table
+
+    def _table_for(self, df: pd.DataFrame, outcome: str, feature: str, privileged_val: Any,
+                   label: Optional[str] = None, weights: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Build the group outcome table straight from DataFrame columns."""
+        privileged_mask, _ = self._get_binary_group_mask(df, feature, privileged_val)
+        return self._group_outcome_table(
+            df[outcome].to_numpy(),
+            privileged_mask.to_numpy(),
+            df[label].to_numpy() if label is not None else None,
+            weights
+        )
+
+    def _group_means(self, table: Dict[str, np.ndarray]) -> Tuple[float, float]:
+        """Mean outcome of the privileged and unprivileged groups."""
+        if "outcome_error" in table:
+            raise table["outcome_error"]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = table["outcome_sum"] / table["outcome_count"]
+        return means[0], means[1]
+
     def _compute_disparate_impact(self, df: pd.DataFrame, target: str, 
-                                 feature: str, privileged_val: Any) -> BiasDetectionResult:
+                                 feature: str, privileged_val: Any,
+                                 table: Optional[Dict[str, np.ndarray]] = None) -> BiasDetectionResult:
         """Compute disparate impact (80% rule)."""
         try:
-            privileged_mask, unprivileged_mask = self._get_binary_group_mask(df, feature, privileged_val)
+            if table is None:
+                table = self._table_for(df, target, feature, privileged_val)
 
-            favorable_rate_priv = df[privileged_mask][target].mean()
-            favorable_rate_unpriv = df[unprivileged_mask][target].mean()
+            favorable_rate_priv, favorable_rate_unpriv = self._group_means(table)
 
             di = self._safe_divide(favorable_rate_unpriv, favorable_rate_priv)
             biased = di < self.threshold
@@ -133,8 +309,8 @@ class BiasDetector:
                     "favorable_rate_privileged": favorable_rate_priv,
                     "favorable_rate_unprivileged": favorable_rate_unpriv,
                     "privileged_group": privileged_val,
-                    "privileged_count": privileged_mask.sum(),
-                    "unprivileged_count": unprivileged_mask.sum()
+                    "privileged_count": table["count"][0],
+                    "unprivileged_count": table["count"][1]
                 }
             )
         except Exception as e:
@@ -144,13 +320,14 @@ class BiasDetector:
             )
 
     def _compute_statistical_parity_difference(self, df: pd.DataFrame, target: str, 
-                                              feature: str, privileged_val: Any) -> BiasDetectionResult:
+                                              feature: str, privileged_val: Any,
+                                              table: Optional[Dict[str, np.ndarray]] = None) -> BiasDetectionResult:
         """Compute statistical parity difference."""
         try:
-            privileged_mask, unprivileged_mask = self._get_binary_group_mask(df, feature, privileged_val)
+            if table is None:
+                table = self._table_for(df, target, feature, privileged_val)
 
-            rate_priv = df[privileged_mask][target].mean()
-            rate_unpriv = df[unprivileged_mask][target].mean()
+            rate_priv, rate_unpriv = self._group_means(table)
 
             spd = rate_unpriv - rate_priv
             biased = abs(spd) > (1 - self.threshold)
@@ -171,22 +348,16 @@ class BiasDetector:
             )
 
     def _compute_equal_opportunity_difference(self, df: pd.DataFrame, prediction: str, 
-                                            target: str, feature: str, privileged_val: Any) -> BiasDetectionResult:
+                                            target: str, feature: str, privileged_val: Any,
+                                            table: Optional[Dict[str, np.ndarray]] = None) -> BiasDetectionResult:
         """Compute equal opportunity difference (TPR difference)."""
         try:
-            privileged_mask, unprivileged_mask = self._get_binary_group_mask(df, feature, privileged_val)
+            if table is None:
+                table = self._table_for(df, prediction, feature, privileged_val, label=target)
 
-            # True Positive Rate for privileged group
-            tp_rate_priv = self._safe_divide(
-                ((df[privileged_mask][prediction] == 1) & (df[privileged_mask][target] == 1)).sum(),
-                (df[privileged_mask][target] == 1).sum()
-            )
-
-            # True Positive Rate for unprivileged group  
-            tp_rate_unpriv = self._safe_divide(
-                ((df[unprivileged_mask][prediction] == 1) & (df[unprivileged_mask][target] == 1)).sum(),
-                (df[unprivileged_mask][target] == 1).sum()
-            )
+            # True Positive Rate for privileged and unprivileged groups
+            tp_rate_priv = self._safe_divide(table["true_positive"][0], table["actual_positive"][0])
+            tp_rate_unpriv = self._safe_divide(table["true_positive"][1], table["actual_positive"][1])
 
             eod = tp_rate_unpriv - tp_rate_priv
             biased = abs(eod) > (1 - self.threshold)
@@ -207,22 +378,16 @@ class BiasDetector:
             )
 
     def _compute_predictive_parity_difference(self, df: pd.DataFrame, prediction: str, 
-                                            target: str, feature: str, privileged_val: Any) -> BiasDetectionResult:
+                                            target: str, feature: str, privileged_val: Any,
+                                            table: Optional[Dict[str, np.ndarray]] = None) -> BiasDetectionResult:
         """Compute predictive parity difference (PPV difference)."""
         try:
-            privileged_mask, unprivileged_mask = self._get_binary_group_mask(df, feature, privileged_val)
+            if table is None:
+                table = self._table_for(df, prediction, feature, privileged_val, label=target)
 
-            # Positive Predictive Value for privileged group
-            ppv_priv = self._safe_divide(
-                ((df[privileged_mask][prediction] == 1) & (df[privileged_mask][target] == 1)).sum(),
-                (df[privileged_mask][prediction] == 1).sum()
-            )
-
-            # Positive Predictive Value for unprivileged group
-            ppv_unpriv = self._safe_divide(
-                ((df[unprivileged_mask][prediction] == 1) & (df[unprivileged_mask][target] == 1)).sum(),
-                (df[unprivileged_mask][prediction] == 1).sum()
-            )
+            # Positive Predictive Value for privileged and unprivileged groups
+            ppv_priv = self._safe_divide(table["true_positive"][0], table["predicted_positive"][0])
+            ppv_unpriv = self._safe_divide(table["true_positive"][1], table["predicted_positive"][1])
 
             ppd = ppv_unpriv - ppv_priv
             biased = abs(ppd) > (1 - self.threshold)
@@ -243,32 +408,22 @@ class BiasDetector:
             )
 
     def _compute_equalized_odds_difference(self, df: pd.DataFrame, prediction: str, 
-                                         target: str, feature: str, privileged_val: Any) -> List[BiasDetectionResult]:
+                                         target: str, feature: str, privileged_val: Any,
+                                         table: Optional[Dict[str, np.ndarray]] = None) -> List[BiasDetectionResult]:
         """Compute equalized odds (both TPR and FPR differences)."""
         results = []
 
         try:
-            privileged_mask, unprivileged_mask = self._get_binary_group_mask(df, feature, privileged_val)
+            if table is None:
+                table = self._table_for(df, prediction, feature, privileged_val, label=target)
 
             # True Positive Rates
-            tpr_priv = self._safe_divide(
-                ((df[privileged_mask][prediction] == 1) & (df[privileged_mask][target] == 1)).sum(),
-                (df[privileged_mask][target] == 1).sum()
-            )
-            tpr_unpriv = self._safe_divide(
-                ((df[unprivileged_mask][prediction] == 1) & (df[unprivileged_mask][target] == 1)).sum(),
-                (df[unprivileged_mask][target] == 1).sum()
-            )
+            tpr_priv = self._safe_divide(table["true_positive"][0], table["actual_positive"][0])
+            tpr_unpriv = self._safe_divide(table["true_positive"][1], table["actual_positive"][1])
 
             # False Positive Rates
-            fpr_priv = self._safe_divide(
-                ((df[privileged_mask][prediction] == 1) & (df[privileged_mask][target] == 0)).sum(),
-                (df[privileged_mask][target] == 0).sum()
-            )
-            fpr_unpriv = self._safe_divide(
-                ((df[unprivileged_mask][prediction] == 1) & (df[unprivileged_mask][target] == 0)).sum(),
-                (df[unprivileged_mask][target] == 0).sum()
-            )
+            fpr_priv = self._safe_divide(table["false_positive"][0], table["actual_negative"][0])
+            fpr_unpriv = self._safe_divide(table["false_positive"][1], table["actual_negative"][1])
 
             tpr_diff = tpr_unpriv - tpr_priv
             fpr_diff = fpr_unpriv - fpr_priv
@@ -296,13 +451,18 @@ class BiasDetector:
         return results
 
     def detect_bias_on_dataset(self, df: Optional[pd.DataFrame] = None, 
-                              target_col: Optional[str] = None) -> List[BiasDetectionResult]:
+                              target_col: Optional[str] = None,
+                              weights: Optional[np.ndarray] = None,
+                              verbose: bool = True) -> List[BiasDetectionResult]:
         """
         Detect bias on dataset (without model predictions).
 
         Args:
             df: DataFrame to analyze (uses self.dataset if None)
             target_col: Target column name (uses self.target if None)
+            weights: Optional row weights (the detector's sample_weight if None)
+            verbose: Log progress at INFO level (DEBUG if False, e.g. for
+                repeated bootstrap runs); warnings are always logged
 
         Returns:
             List of BiasDetectionResult objects
@@ -312,9 +472,11 @@ class BiasDetector:
 
         if df is None or target_col is None:
             raise ValueError("Dataset and target column must be provided")
+        weights = self._checked_weights(df, weights)
 
+        log = logger.info if verbose else logger.debug
         results = []
-        logger.info("🔍 Running dataset bias detection...")
+        log("🔍 Running dataset bias detection...")
 
         for feature, privileged_val in self.privileged_values.items():
             if feature not in df.columns or target_col not in df.columns:
@@ -324,16 +486,25 @@ class BiasDetector:
             # Check if this is a justified attribute
             is_justified = feature in self.justified_attributes
             if is_justified:
-                logger.info(f"📋 {feature} is a justified attribute - will be marked accordingly")
+                log(f"📋 {feature} is a justified attribute - will be marked accordingly")
 
-            results.append(self._compute_disparate_impact(df, target_col, feature, privileged_val))
-            results.append(self._compute_statistical_parity_difference(df, target_col, feature, privileged_val))
+            try:
+                table = self._table_for(df, target_col, feature, privileged_val, weights=weights)
+            except Exception:
+                if weights is not None:
+                    raise  # An unweighted rebuild would silently drop the weights
+                table = None  # Helpers rebuild it and report the error
+
+            results.append(self._compute_disparate_impact(df, target_col, feature, privileged_val, table))
+            results.append(self._compute_statistical_parity_difference(df, target_col, feature, privileged_val, table))
 
         return results
 
     def detect_bias_on_model_predictions(self, df: Optional[pd.DataFrame] = None, 
                                         prediction_col: str = "predictions", 
-                                        label_col: Optional[str] = None) -> List[BiasDetectionResult]:
+                                        label_col: Optional[str] = None,
+                                        weights: Optional[np.ndarray] = None,
+                                        verbose: bool = True) -> List[BiasDetectionResult]:
         """
         Detect bias on model predictions.
 
@@ -341,6 +512,9 @@ class BiasDetector:
             df: DataFrame with predictions (uses self.dataset if None)
             prediction_col: Column name containing predictions
             label_col: True label column name (uses self.target if None)
+            weights: Optional row weights (the detector's sample_weight if None)
+            verbose: Log progress at INFO level (DEBUG if False, e.g. for
+                repeated bootstrap runs); warnings are always logged
 
         Returns:
             List of BiasDetectionResult objects
@@ -350,61 +524,204 @@ class BiasDetector:
 
         if df is None or label_col is None:
             raise ValueError("Dataset and label column must be provided")
+        weights = self._checked_weights(df, weights)
 
+        log = logger.info if verbose else logger.debug
         results = []
-        logger.info("🔍 Running model prediction bias detection...")
+        log("🔍 Running model prediction bias detection...")
+
+        # Extract prediction and label columns once; each attribute then needs
+        # a single pass to build the counts shared by every metric
+        predictions = df[prediction_col].to_numpy() if prediction_col in df.columns else None
+        labels = df[label_col].to_numpy() if label_col in df.columns else None
 
         for feature, privileged_val in self.privileged_values.items():
-            if feature not in df.columns or prediction_col not in df.columns or label_col not in df.columns:
+            if feature not in df.columns or predictions is None or labels is None:
                 logger.warning(f"⚠️ Skipping {feature}: required columns not found")
                 continue
 
             is_justified = feature in self.justified_attributes
             if is_justified:
-                logger.info(f"📋 {feature} is a justified attribute - will be marked accordingly")
+                log(f"📋 {feature} is a justified attribute - will be marked accordingly")
 
-            results.append(self._compute_disparate_impact(df, prediction_col, feature, privileged_val))
-            results.append(self._compute_statistical_parity_difference(df, prediction_col, feature, privileged_val))
-            results.append(self._compute_equal_opportunity_difference(df, prediction_col, label_col, feature, privileged_val))
-            results.append(self._compute_predictive_parity_difference(df, prediction_col, label_col, feature, privileged_val))
-            results.extend(self._compute_equalized_odds_difference(df, prediction_col, label_col, feature, privileged_val))
+            try:
+                table = self._group_outcome_table(predictions, df[feature].to_numpy() == privileged_val,
+                                                  labels, weights)
+            except Exception:
+                if weights is not None:
+                    raise  # An unweighted rebuild would silently drop the weights
+                table = None  # Helpers rebuild it and report the error
+
+            results.append(self._compute_disparate_impact(df, prediction_col, feature, privileged_val, table))
+            results.append(self._compute_statistical_parity_difference(df, prediction_col, feature, privileged_val, table))
+            results.append(self._compute_equal_opportunity_difference(df, prediction_col, label_col, feature, privileged_val, table))
+            results.append(self._compute_predictive_parity_difference(df, prediction_col, label_col, feature, privileged_val, table))
+            results.extend(self._compute_equalized_odds_difference(df, prediction_col, label_col, feature, privileged_val, table))
 
         return results
 
-    def detect(self, include_model_predictions: bool = True) -> List[BiasDetectionResult]:
+    def detect(self, include_model_predictions: bool = True,
+               quick: bool = False,
+               sample_fraction: Optional[float] = None,
+               confidence_level: float = 0.95,
+               n_bootstrap: int = 200,
+               target_half_width: Optional[float] = None,
+               random_state: Optional[int] = None) -> List[BiasDetectionResult]:
         """
         Main detect method that runs comprehensive bias detection.
 
         Args:
             include_model_predictions: Whether to include model-based bias detection
+            quick: Estimate the metrics from a stratified sample (protected
+                attributes × target) instead of scanning every row
+            sample_fraction: Fraction sampled per stratum (implies quick; 0.1 by default)
+            confidence_level: Coverage of the bootstrap intervals in quick mode
+            n_bootstrap: Bootstrap replicates in quick mode
+            target_half_width: Stopping rule for quick mode: keep doubling the
+                sample until every interval's half-width is at most this
+            random_state: Seed for sampling and bootstrap
 
         Returns:
-            List of all bias detection results
+            List of all bias detection results; in quick mode each carries a
+            confidence interval and the sample size in its details
         """
+        if quick or sample_fraction is not None:
+            if self.sample_weight is not None:
+                raise ValueError("sample_weight is not supported in quick mode; the sample carries design weights")
+            return self._detect_quick(include_model_predictions, sample_fraction or QUICK_SAMPLE_FRACTION,
+                                      confidence_level, n_bootstrap, target_half_width, random_state)
+        if self.chunksize:
+            return self._detect_chunked(include_model_predictions)
+
         all_results = []
 
         # Dataset-level bias detection
+        weights = self._row_weights(self.dataset) if self.dataset is not None else None
         if self.dataset is not None and self.target is not None:
-            dataset_results = self.detect_bias_on_dataset()
+            dataset_results = self.detect_bias_on_dataset(weights=weights)
             all_results.extend(dataset_results)
 
         # Model prediction bias detection
         if include_model_predictions and self.model is not None and self.dataset is not None:
             try:
                 # Make predictions
-                X = self.dataset.drop(columns=[self.target])
-                predictions = self.model.predict(X)
+                X = self._features(self.dataset)
+                predictions = self.prediction_cache.predict(self.model, X)
 
-                # Add predictions to dataframe
-                df_with_preds = self.dataset.copy()
+                # Attach predictions to a shallow view instead of copying the data
+                df_with_preds = self.dataset.copy(deep=False)
                 df_with_preds['predictions'] = predictions
 
-                model_results = self.detect_bias_on_model_predictions(df_with_preds)
+                model_results = self.detect_bias_on_model_predictions(df_with_preds, weights=weights)
                 all_results.extend(model_results)
 
             except Exception as e:
                 logger.error(f"❌ Model prediction bias detection failed: {e}")
 
+        self._log_summary(all_results)
+        return all_results
+
+    def _detect_chunked(self, include_model_predictions: bool) -> List[BiasDetectionResult]:
+        """
+        Dataset and prediction bias in one streaming pass.
+
+        Outcome tables are summed per attribute value across chunks and only
+        collapsed to privileged / unprivileged at the end, so the privileged
+        group can default to the most common value without a second pass.
+        """
+        if self.target is None:
+            raise ValueError("Dataset and target column must be provided")
+
+        use_model = include_model_predictions and self.model is not None
+        features = list(self.privileged_values) or list(self.sensitive_features)
+        lookups = {feature: {} for feature in features}
+        dataset_tables: Dict[str, Dict[str, Any]] = {}
+        model_tables: Dict[str, Dict[str, Any]] = {}
+
+        logger.info(f"🌊 Streaming bias detection in chunks of {self.chunksize} rows...")
+        offset = 0
+        for chunk in self._dataset_chunks(use_model):
+            if len(chunk) == 0:
+                continue
+            weights = self._row_weights(chunk, offset)
+            offset += len(chunk)
+            predictions = None
+            if use_model:
+                try:
+                    predictions = self.prediction_cache.predict(self.model, self._features(chunk), memoize=False)
+                except Exception as e:
+                    logger.error(f"❌ Model prediction bias detection failed: {e}")
+                    use_model = False
+            labels = chunk[self.target].to_numpy()
+
+            for feature in features:
+                if feature not in chunk.columns:
+                    continue
+                codes = self._value_codes(chunk[feature], lookups[feature])
+                n_values = len(lookups[feature])
+                _add_outcome_tables(dataset_tables, feature,
+                                    self._outcome_table_by_code(labels, codes, n_values, weights=weights))
+                if predictions is not None:
+                    _add_outcome_tables(model_tables, feature,
+                                        self._outcome_table_by_code(predictions, codes, n_values, labels, weights))
+
+        if (self.sample_weight is not None and not isinstance(self.sample_weight, str)
+                and len(self.sample_weight) != offset):
+            raise ValueError(f"sample_weight has {len(self.sample_weight)} entries but the dataset has {offset} rows")
+
+        dataset_results, model_results = [], []
+        for feature in features:
+            if feature not in dataset_tables:
+                logger.warning(f"⚠️ Skipping {feature}: column not found")
+                continue
+            if feature in self.justified_attributes:
+                logger.info(f"📋 {feature} is a justified attribute - will be marked accordingly")
+            lookup = lookups[feature]
+            if feature not in self.privileged_values:
+                counts = dataset_tables[feature]["count"]
+                self.privileged_values[feature] = list(lookup)[int(np.argmax(counts))]
+                logger.info(f"🏷️ Privileged group for {feature}: {self.privileged_values[feature]}")
+            privileged_val = self.privileged_values[feature]
+            privileged_mask = np.zeros(len(lookup), dtype=bool)
+            if _value_key(privileged_val) in lookup:
+                privileged_mask[lookup[_value_key(privileged_val)]] = True
+
+            table = _collapse_outcome_table(dataset_tables[feature], privileged_mask)
+            dataset_results.append(self._compute_disparate_impact(None, self.target, feature, privileged_val, table))
+            dataset_results.append(self._compute_statistical_parity_difference(
+                None, self.target, feature, privileged_val, table))
+
+            if feature in model_tables:
+                table = _collapse_outcome_table(model_tables[feature], privileged_mask)
+                args = (None, "predictions", self.target, feature, privileged_val, table)
+                model_results.append(self._compute_disparate_impact(None, "predictions", feature, privileged_val, table))
+                model_results.append(self._compute_statistical_parity_difference(
+                    None, "predictions", feature, privileged_val, table))
+                model_results.append(self._compute_equal_opportunity_difference(*args))
+                model_results.append(self._compute_predictive_parity_difference(*args))
+                model_results.extend(self._compute_equalized_odds_difference(*args))
+
+        all_results = dataset_results + model_results
+        self._log_summary(all_results)
+        return all_results
+
+    def _dataset_chunks(self, with_features: bool = True):
+        """The loaded dataset as a single chunk, or the streamed chunks in chunked mode."""
+        if not self.chunksize:
+            return [self.dataset]
+        return iter_chunks(self._chunk_source, self.chunksize,
+                           columns=None if with_features else self._needed_columns(),
+                           filters=self._chunk_filters)
+
+    @staticmethod
+    def _value_codes(values: pd.Series, lookup: Dict[Any, int]) -> np.ndarray:
+        """Codes of a chunk's values in a lookup shared across chunks (extended in place)."""
+        local, uniques = factorize_keep_na(values)
+        mapping = np.array([lookup.setdefault(_value_key(value), len(lookup)) for value in uniques],
+                           dtype=np.int64)
+        return mapping[local]
+
+    def _log_summary(self, all_results: List[BiasDetectionResult]):
         # Log summary
         total_results = len(all_results)
         biased_results = sum(1 for r in all_results if r.biased and not r.justified)
@@ -415,7 +732,118 @@ class BiasDetector:
         logger.info(f"   - Biased (concerning): {biased_results}")
         logger.info(f"   - Justified attributes: {justified_results}")
 
-        return all_results
+    def stratification_columns(self, df: Optional[pd.DataFrame] = None) -> List[str]:
+        """Protected attributes, plus the target when it is categorical, to stratify samples on."""
+        df = df if df is not None else self.dataset
+        strata = [f for f in self.sensitive_features if f in df.columns]
+        if self.target in df.columns and Utils.is_classification_task(df[self.target]):
+            strata.append(self.target)
+        return strata
+
+    def _detect_quick(self, include_model_predictions: bool, sample_fraction: float,
+                      confidence_level: float, n_bootstrap: int,
+                      target_half_width: Optional[float],
+                      random_state: Optional[int]) -> List[BiasDetectionResult]:
+        """Stratified-sample estimates, growing the sample until the stopping rule holds."""
+        if (self.dataset is None and not self.chunksize) or self.target is None:
+            raise ValueError("Dataset and target column must be provided")
+        if random_state is None:
+            random_state = int(np.random.default_rng().integers(2**32))  # Fixed so samples nest
+
+        use_model = include_model_predictions and self.model is not None
+        strata = self.stratification_columns(next(iter(self._dataset_chunks(use_model))))
+        predicted: Dict[int, Any] = {}
+
+        while True:
+            sampler = StratifiedSampler(strata, sample_fraction, random_state=random_state)
+            for chunk in self._dataset_chunks(use_model):
+                sampler.update(chunk)
+            sample = sampler.sample()
+            df = sample.data
+            for feature in self.sensitive_features:
+                if feature not in self.privileged_values and feature in df.columns:
+                    # Most common value in the population, from the design weights
+                    counts = pd.Series(sample.weights).groupby(df[feature].to_numpy()).sum()
+                    self.privileged_values[feature] = counts.idxmax()
+            prediction_col = None
+            if use_model:
+                try:
+                    # Only rows new to this (larger) sample need inference
+                    new = np.array([p not in predicted for p in sample.positions], dtype=bool)
+                    if new.any():
+                        X_new = df[new].drop(columns=[self.target])
+                        predicted.update(zip(sample.positions[new],
+                                             self.prediction_cache.predict(self.model, X_new, memoize=False)))
+                    df = df.copy(deep=False)
+                    df['predictions'] = np.array([predicted[p] for p in sample.positions])
+                    prediction_col = 'predictions'
+                except Exception as e:
+                    logger.error(f"❌ Model prediction bias detection failed: {e}")
+
+            results = self.detect_on_sample(sample, df, prediction_col, confidence_level, n_bootstrap, random_state)
+            widths = [np.diff(r.details["confidence_interval"]["value"])[0] / 2
+                      for r in results if "confidence_interval" in r.details]
+            max_width = max(widths, default=0.0)
+            if target_half_width is None or sample_fraction >= 1 or max_width <= target_half_width:
+                break
+            logger.info(f"🎯 CI half-width {max_width:.4f} > {target_half_width}, "
+                        f"growing sample beyond {sample_fraction:.2%}")
+            sample_fraction = min(1.0, sample_fraction * 2)
+
+        self._log_summary(results)
+        return results
+
+    def detect_on_sample(self, sample: StratifiedSample, df: Optional[pd.DataFrame] = None,
+                         prediction_col: Optional[str] = None,
+                         confidence_level: float = 0.95, n_bootstrap: int = 200,
+                         random_state: Optional[int] = None) -> List[BiasDetectionResult]:
+        """
+        Design-weighted bias metrics on a stratified sample, with bootstrap intervals.
+
+        Args:
+            sample: Stratified sample of the dataset
+            df: Sample rows to use (sample.data if None), e.g. preprocessed or
+                with a predictions column
+            prediction_col: Predictions column for the model-based metrics (None to skip)
+            confidence_level: Coverage of the percentile intervals
+            n_bootstrap: Bootstrap replicates (within-stratum resampling)
+            random_state: Seed for the replicates
+
+        Returns:
+            Dataset (and prediction) bias results, each with 'confidence_interval',
+            'sample_size' and 'population_size' in its details
+        """
+        df = df if df is not None else sample.data
+        cell_keys = [df[self.target].to_numpy()]
+        if prediction_col is not None:
+            cell_keys.append(df[prediction_col].to_numpy())
+        cells, weights, replicates = sample.bootstrap_cells(cell_keys, n_bootstrap, random_state)
+        cells_df = df.iloc[cells]
+
+        def run(w, verbose=False):
+            results = self.detect_bias_on_dataset(cells_df, weights=w, verbose=verbose)
+            if prediction_col is not None:
+                results += self.detect_bias_on_model_predictions(cells_df, prediction_col, weights=w,
+                                                                 verbose=verbose)
+            return results
+
+        results = run(weights, verbose=True)
+        # Replicates repeat the same per-attribute log lines, so they log at DEBUG
+        replicate_values = np.array([[r.value for r in run(w)] for w in replicates], dtype=float)
+        tail = (1 - confidence_level) / 2 * 100
+
+        for i, result in enumerate(results):
+            result.details["sample_size"] = len(sample)
+            result.details["population_size"] = sample.population_size
+            if "error" in result.details:
+                continue
+            low, high = np.nanpercentile(replicate_values[:, i], [tail, 100 - tail])
+            result.details["confidence_interval"] = {
+                "n_bootstrap": n_bootstrap,
+                "confidence_level": confidence_level,
+                "value": [float(low), float(high)]
+            }
+        return results
 
     def get_summary_report(self, results: Optional[List[BiasDetectionResult]] = None) -> Dict[str, Any]:
         """
@@ -0,0 +1,349 @@
+"""
+Fairsight Toolkit - Correlation Engine
+======================================
+
+Blockwise Pearson correlation for wide feature tables. The matrix is built
+block by block in float32, and highly correlated pairs are found with a
+vectorized upper-triangle search. The full matrix never has to be converted
+to a nested dict or walked pair by pair in Python.
+
+Missing values are handled with pairwise-complete observations, matching
+``DataFrame.corr()``. CorrelationAccumulator keeps running co-moment sums so
+that correlations can be computed over chunks and merged across shards.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 1024
+
+
+def _as_matrix(X: Union[pd.DataFrame, np.ndarray], dtype: Any) -> np.ndarray:
+    if isinstance(X, pd.DataFrame):
+        return X.to_numpy(dtype=dtype, na_value=np.nan)
+    return np.asarray(X, dtype=dtype)
+
+
+def _pairwise_sums(Xi: np.ndarray, Mi: np.ndarray, Xj: np.ndarray, Mj: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Pairwise-complete sums between two column blocks.
+
+    Xi/Xj hold values with missing entries set to 0 and Mi/Mj the matching
+    presence masks. Returns (n, sum_x, sum_y, sum_xy, sum_xx, sum_yy), each of
+    shape (block_i, block_j) and restricted to rows where both columns are
+    present.
+    """
+    return (Mi.T @ Mj, Xi.T @ Mj, Mi.T @ Xj, Xi.T @ Xj, (Xi * Xi).T @ Mj, Mi.T @ (Xj * Xj))
+
+
+def _correlation_from_sums(n, sx, sy, sxy, sxx, syy) -> np.ndarray:
+    """Pearson correlation from pairwise sums (NaN where a column is constant)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = n * sxy - sx * sy
+        var = (n * sxx - sx * sx) * (n * syy - sy * sy)
+        r = cov / np.sqrt(var)
+    r[(n < 2) | ~(var > 0)] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
+
+class _BlockCorrelation:
+    """Column blocks of a centered matrix, ready for block-pair correlation."""
+
+    def __init__(self, X: np.ndarray, block_size: int):
+        self.block_size = block_size
+        mask = ~np.isnan(X)
+        self.complete = bool(mask.all())
+        with np.errstate(invalid='ignore'):
+            # Centering first keeps the float32 sums well conditioned
+            X = X - np.nanmean(X, axis=0) if X.size else X
+        if self.complete:
+            norms = np.sqrt(np.einsum('ij,ij->j', X, X))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.Z = X / norms
+            self.Z[:, ~(norms > 0)] = np.nan
+        else:
+            self.X0 = np.where(mask, X, 0).astype(X.dtype)
+            self.M = mask.astype(X.dtype)
+        self.p = X.shape[1]
+
+    def blocks(self):
+        """Yield (row offset, col offset, correlation block) for the upper triangle of blocks."""
+        b = self.block_size
+        for i in range(0, self.p, b):
+            for j in range(i, self.p, b):
+                yield i, j, self.block(slice(i, i + b), slice(j, j + b))
+
+    def block(self, rows: slice, cols: slice) -> np.ndarray:
+        if self.complete:
+            return np.clip(self.Z[:, rows].T @ self.Z[:, cols], -1.0, 1.0)
+        return _correlation_from_sums(*_pairwise_sums(self.X0[:, rows], self.M[:, rows],
+                                                      self.X0[:, cols], self.M[:, cols]))
+
+
+def _pairs_above(block: np.ndarray, row_offset: int, col_offset: int,
+                 threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Indices and values of strict upper-triangle entries with |r| > threshold."""
+    with np.errstate(invalid='ignore'):
+        hits = np.abs(block) > threshold
+    if row_offset == col_offset:
+        hits &= np.triu(np.ones(block.shape, dtype=bool), k=1)
+    rows, cols = np.nonzero(hits)
+    return rows + row_offset, cols + col_offset, block[rows, cols]
+
+
+def _collect_pairs(blocks, columns: Sequence[Any], threshold: float,
+                   top_k: Optional[int]) -> List[Dict[str, Any]]:
+    """Run the upper-triangle search over correlation blocks, keeping at most top_k pairs."""
+    found_i, found_j, found_r = [], [], []
+    kept = 0
+    for row_offset, col_offset, block in blocks:
+        i, j, r = _pairs_above(block, row_offset, col_offset, threshold)
+        found_i.append(i)
+        found_j.append(j)
+        found_r.append(r)
+        kept += len(r)
+        if top_k is not None and kept > 2 * top_k:
+            # Prune as we go so memory stays bounded by top_k
+            i, j, r = (np.concatenate(a) for a in (found_i, found_j, found_r))
+            keep = np.argpartition(-np.abs(r), top_k - 1)[:top_k]
+            found_i, found_j, found_r, kept = [i[keep]], [j[keep]], [r[keep]], top_k
+
+    if not found_r:
+        return []
+    i, j, r = (np.concatenate(a) for a in (found_i, found_j, found_r))
+    if top_k is not None:
+        order = np.argsort(-np.abs(r), kind='stable')[:top_k]
+    else:
+        order = np.lexsort((j, i))  # Same row-major order as a pair-by-pair walk
+    return [
+        {'feature1': columns[a], 'feature2': columns[b], 'correlation': float(value)}
+        for a, b, value in zip(i[order], j[order], r[order])
+    ]
+
+
+def correlation_matrix(X: Union[pd.DataFrame, np.ndarray],
+                       block_size: int = DEFAULT_BLOCK_SIZE,
+                       dtype: Any = np.float32) -> np.ndarray:
+    """
+    Pearson correlation matrix computed block by block.
+
+    Args:
+        X: Numeric data (rows × features); NaNs use pairwise-complete rows
+        block_size: Columns per block
+        dtype: Compute dtype (float32 halves memory and bandwidth)
+
+    Returns:
+        Square correlation matrix of the given dtype
+    """
+    engine = _BlockCorrelation(_as_matrix(X, dtype), block_size)
+    corr = np.empty((engine.p, engine.p), dtype=dtype)
+    for i, j, block in engine.blocks():
+        corr[i:i + block.shape[0], j:j + block.shape[1]] = block
+        corr[j:j + block.shape[1], i:i + block.shape[0]] = block.T
+    return corr
+
+
+def high_correlations(X: Union[pd.DataFrame, np.ndarray],
+                      columns: Optional[Sequence[Any]] = None,
+                      threshold: float = 0.8,
+                      top_k: Optional[int] = None,
+                      block_size: int = DEFAULT_BLOCK_SIZE,
+                      dtype: Any = np.float32) -> List[Dict[str, Any]]:
+    """
+    Find feature pairs with |correlation| above a threshold without keeping the matrix.
+
+    Args:
+        X: Numeric data (rows × features)
+        columns: Feature names (taken from X if it is a DataFrame)
+        threshold: Absolute correlation above which a pair is reported
+        top_k: Return only the k strongest pairs (all pairs if None)
+        block_size: Columns per block; peak memory is about block_size² values
+        dtype: Compute dtype
+
+    Returns:
+        List of {'feature1', 'feature2', 'correlation'} dictionaries
+    """
+    if columns is None:
+        columns = list(X.columns) if isinstance(X, pd.DataFrame) else list(range(np.shape(X)[1]))
+    engine = _BlockCorrelation(_as_matrix(X, dtype), block_size)
+    return _collect_pairs(engine.blocks(), list(columns), threshold, top_k)
+
+
+def correlation_with(X: Union[pd.DataFrame, np.ndarray], y: Union[pd.Series, np.ndarray],
+                     dtype: Any = np.float32) -> np.ndarray:
+    """
+    Correlation of every column of X with a single vector.
+
+    Args:
+        X: Numeric data (rows × features)
+        y: Vector to correlate against (e.g. the target)
+        dtype: Compute dtype
+
+    Returns:
+        Array with one correlation per column of X
+    """
+    X = _as_matrix(X, dtype)
+    y = np.asarray(y, dtype=dtype).reshape(-1, 1)
+    Mx, My = ~np.isnan(X), ~np.isnan(y)
+    sums = _pairwise_sums(np.where(Mx, X, 0).astype(dtype), Mx.astype(dtype),
+                          np.where(My, y, 0).astype(dtype), My.astype(dtype))
+    return _correlation_from_sums(*sums)[:, 0]
+
+
+def correlation_pairs(corr: np.ndarray, columns: Sequence[Any], threshold: float = 0.8,
+                      top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Vectorized upper-triangle search over an existing correlation matrix.
+
+    Args:
+        corr: Square correlation matrix
+        columns: Feature names matching the matrix rows
+        threshold: Absolute correlation above which a pair is reported
+        top_k: Return only the k strongest pairs (all pairs if None)
+
+    Returns:
+        List of {'feature1', 'feature2', 'correlation'} dictionaries
+    """
+    return _collect_pairs([(0, 0, np.asarray(corr))], list(columns), threshold, top_k)
+
+
+def sparse_correlations(pairs: List[Dict[str, Any]]) -> Dict[Any, Dict[Any, float]]:
+    """Nested {feature1: {feature2: r}} dict holding only the given pairs, both ways."""
+    sparse: Dict[Any, Dict[Any, float]] = {}
+    for pair in pairs:
+        sparse.setdefault(pair['feature1'], {})[pair['feature2']] = pair['correlation']
+        sparse.setdefault(pair['feature2'], {})[pair['feature1']] = pair['correlation']
+    return sparse
+
+
+class CorrelationAccumulator:
+    """
+    Streaming, mergeable pairwise-complete correlation.
+
+    Keeps the pairwise sums (n, Σx, Σxy, Σx²) of values shifted by a per-column
+    reference taken from the first chunk, so memory is four p × p matrices
+    regardless of the number of rows. Shards accumulated separately merge
+    exactly with merge().
+
+    Example:
+        acc = CorrelationAccumulator(numeric_columns)
+        for chunk in pd.read_csv("features.csv", chunksize=200_000):
+            acc.update(chunk)
+        pairs = acc.high_correlations(threshold=0.8, top_k=100)
+    """
+
+    def __init__(self, columns: Sequence[Any], dtype: Any = np.float64):
+        """
+        Initialize CorrelationAccumulator.
+
+        Args:
+            columns: Feature names, in the order chunk columns are read
+            dtype: Dtype of the running sums
+        """
+        self.columns = list(columns)
+        self.dtype = dtype
+        p = len(self.columns)
+        self.n_rows = 0
+        self.shift: Optional[np.ndarray] = None
+        self._n = np.zeros((p, p), dtype=dtype)
+        self._sx = np.zeros((p, p), dtype=dtype)
+        self._sxy = np.zeros((p, p), dtype=dtype)
+        self._sxx = np.zeros((p, p), dtype=dtype)
+
+    def update(self, chunk: Union[pd.DataFrame, np.ndarray]) -> "CorrelationAccumulator":
+        """
+        Add one chunk of rows to the running sums.
+
+        Args:
+            chunk: DataFrame holding self.columns, or an array in that column order
+
+        Returns:
+            self, to allow chaining
+        """
+        X = _as_matrix(chunk[self.columns] if isinstance(chunk, pd.DataFrame) else chunk, self.dtype)
+        if len(X) == 0:
+            return self
+        if self.shift is None:
+            with np.errstate(invalid='ignore'):
+                self.shift = np.nan_to_num(np.nanmean(X, axis=0))
+        mask = ~np.isnan(X)
+        X0 = np.where(mask, X - self.shift, 0).astype(self.dtype)
+        M = mask.astype(self.dtype)
+        n, sx, _, sxy, sxx, _ = _pairwise_sums(X0, M, X0, M)
+        self._n += n
+        self._sx += sx
+        self._sxy += sxy
+        self._sxx += sxx
+        self.n_rows += len(X)
+        return self
+
+    def _reshift(self, shift: np.ndarray):
+        """Re-express the sums relative to a different per-column reference."""
+        d = (self.shift - shift).astype(self.dtype)
+        di, dj = d[:, None], d[None, :]
+        sy = self._sx.T
+        self._sxy = self._sxy + di * sy + dj * self._sx + di * dj * self._n
+        self._sxx = self._sxx + 2 * di * self._sx + di * di * self._n
+        self._sx = self._sx + di * self._n
+        self.shift = shift
+
+    def merge(self, other: "CorrelationAccumulator") -> "CorrelationAccumulator":
+        """
+        Fold another accumulator's sums into this one.
+
+        Args:
+            other: Accumulator over the same columns
+
+        Returns:
+            self, to allow chaining
+        """
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge correlation accumulators over different columns.")
+        if other.n_rows == 0:
+            return self
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        if not np.array_equal(other.shift, self.shift):
+            other_sums = CorrelationAccumulator(other.columns, other.dtype)
+            other_sums.shift, other_sums.n_rows = other.shift, other.n_rows
+            other_sums._n, other_sums._sx = other._n, other._sx
+            other_sums._sxy, other_sums._sxx = other._sxy, other._sxx
+            other_sums._reshift(self.shift)
+            other = other_sums
+        self._n += other._n
+        self._sx += other._sx
+        self._sxy += other._sxy
+        self._sxx += other._sxx
+        self.n_rows += other.n_rows
+        return self
+
+    def correlation_matrix(self) -> np.ndarray:
+        """Correlation matrix of everything accumulated so far."""
+        return _correlation_from_sums(self._n, self._sx, self._sx.T, self._sxy, self._sxx, self._sxx.T)
+
+    def high_correlations(self, threshold: float = 0.8, top_k: Optional[int] = None,
+                          block_size: int = DEFAULT_BLOCK_SIZE) -> List[Dict[str, Any]]:
+        """
+        Feature pairs with |correlation| above the threshold.
+
+        Args:
+            threshold: Absolute correlation above which a pair is reported
+            top_k: Return only the k strongest pairs (all pairs if None)
+            block_size: Columns per block of the search
+
+        Returns:
+            List of {'feature1', 'feature2', 'correlation'} dictionaries
+        """
+        def blocks():
+            p = len(self.columns)
+            for i in range(0, p, block_size):
+                for j in range(i, p, block_size):
+                    rows, cols = slice(i, i + block_size), slice(j, j + block_size)
+                    yield i, j, _correlation_from_sums(
+                        self._n[rows, cols], self._sx[rows, cols], self._sx.T[rows, cols],
+                        self._sxy[rows, cols], self._sxx[rows, cols], self._sxx.T[rows, cols])
+        return _collect_pairs(blocks(), self.columns, threshold, top_k)
@@ -12,11 +12,17 @@ import numpy as np
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Union
 import logging
-from hdbcli import dbapi
 import warnings
 
 logger = logging.getLogger(__name__)
 
+
+def _dbapi():
+    """Import the SAP HANA client on first use; it is only needed to push results."""
+    from hdbcli import dbapi
+    return dbapi
+
+
 class Dashboard:
     """
     Dashboard integration class for pushing audit results to SAP HANA Cloud
@@ -48,7 +54,7 @@ class Dashboard:
         """
         try:
             params = self.connection_params
-            self.conn = dbapi.connect(
+            self.conn = _dbapi().connect(
                 address=params["host"],
                 port=params["port"],
                 user=params["user"],
@@ -83,7 +89,7 @@ class Dashboard:
             # Create schema (handle already exists error)
             try:
                 cursor.execute(f"CREATE SCHEMA {self.default_schema}")
-            except dbapi.Error as e:
+            except _dbapi().Error as e:
                 if "already exists" in str(e) or "SQL error code: 258" in str(e):
                     pass  # Schema already exists
                 else:
@@ -105,7 +111,7 @@ class Dashboard:
                         JUSTIFIED_ATTRIBUTES NCLOB
                     )
                 """)
-            except dbapi.Error as e:
+            except _dbapi().Error as e:
                 if "already exists" in str(e) or "SQL error code: 258" in str(e):
                     pass
                 else:
@@ -127,7 +133,7 @@ class Dashboard:
                         FOREIGN KEY (SESSION_ID) REFERENCES {self.default_schema}.AUDIT_SESSIONS(SESSION_ID)
                     )
                 """)
-            except dbapi.Error as e:
+            except _dbapi().Error as e:
                 if "already exists" in str(e) or "SQL error code: 258" in str(e):
                     pass
                 else:
@@ -148,7 +154,7 @@ class Dashboard:
                         FOREIGN KEY (SESSION_ID) REFERENCES {self.default_schema}.AUDIT_SESSIONS(SESSION_ID)
                     )
                 """)
-            except dbapi.Error as e:
+            except _dbapi().Error as e:
                 if "already exists" in str(e) or "SQL error code: 258" in str(e):
                     pass
                 else:
@@ -168,7 +174,7 @@ class Dashboard:
                         FOREIGN KEY (SESSION_ID) REFERENCES {self.default_schema}.AUDIT_SESSIONS(SESSION_ID)
                     )
                 """)
-            except dbapi.Error as e:
+            except _dbapi().Error as e:
                 if "already exists" in str(e) or "SQL error code: 258" in str(e):
                     pass
                 else:
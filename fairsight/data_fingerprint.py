@@ -15,13 +15,15 @@ flagged early in the pipeline.
 import hashlib
 import json
 from pathlib import Path
-from typing import List, Optional, Union, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Union, Dict, Any
 
-import faiss
 import numpy as np
 import pandas as pd
-from sentence_transformers import SentenceTransformer
-from tqdm import tqdm
+
+# faiss, sentence-transformers and tqdm are imported where they are used so
+# that importing fairsight does not pay for torch start-up.
+if TYPE_CHECKING:
+    import faiss
 
 __all__ = ["DataFingerprintEngine", "DuplicateRecord"]
 
@@ -46,9 +48,10 @@ class DataFingerprintEngine:
     ):
         self.use_embeddings = use_embeddings
         self._hashes: List[str] = []
-        self._index: Optional[faiss.IndexFlatIP] = None
+        self._index: Optional["faiss.IndexFlatIP"] = None
         self._embeddings: Optional[np.ndarray] = None
         if self.use_embeddings:
+            from sentence_transformers import SentenceTransformer
             self._encoder = SentenceTransformer(model_name)
             self._metric = ann_metric
         else:
@@ -82,6 +85,8 @@ class DataFingerprintEngine:
     #  Embedding-based fingerprinting
     # ------------------------------------------------------------------ #
     def _build_embedding_index(self, df: pd.DataFrame) -> None:
+        import faiss
+
         # Simple string representation of rows
         corpus = df.astype(str).agg(" ".join, axis=1).tolist()
         embeddings = self._encoder.encode(corpus, show_progress_bar=True)
@@ -99,6 +104,7 @@ class DataFingerprintEngine:
     ) -> List[DuplicateRecord]:
         if self._index is None or self._embeddings is None:
             raise RuntimeError("Embedding index is not built.")
+        import faiss
 
         vec = self._encoder.encode(" ".join(row.astype(str).tolist())).astype("float32")
         if self._metric == "cosine":
@@ -142,6 +148,8 @@ class DataFingerprintEngine:
 
         Returns a list of DuplicateRecord objects.
         """
+        from tqdm import tqdm
+
         duplicates: List[DuplicateRecord] = []
         for idx, row in tqdm(new_df.iterrows(), total=len(new_df), desc="Fingerprinting"):
             # Hash collision first (fast path)
@@ -180,6 +188,7 @@ class DataFingerprintEngine:
             json.dump(self._hashes, fp)
         # embeddings
         if self.use_embeddings and self._embeddings is not None:
+            import faiss
             np.save(path / "embeddings.npy", self._embeddings)
             faiss.write_index(self._index, str(path / "faiss.index"))
 
@@ -191,6 +200,7 @@ class DataFingerprintEngine:
         with open(path / "hashes.json", "r") as fp:
             self._hashes = json.load(fp)
         if (path / "embeddings.npy").exists():
+            import faiss
             self._embeddings = np.load(path / "embeddings.npy")
             self._index = faiss.read_index(str(path / "faiss.index"))
             self.use_embeddings = True
@@ -8,15 +8,441 @@ including bias detection, fairness analysis, and data quality assessment.
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.preprocessing import StandardScaler
 from typing import List, Dict, Any, Optional, Union, Tuple
 import logging
 import warnings
 from .utils import Utils
+from .audit_frame import AuditFrame, Filters, iter_chunks
+from .proxy_detection import scan_proxies
+from .encoding import EncoderRegistry
+from .profile import column_profile
+from .sampling import QUICK_SAMPLE_FRACTION, StratifiedSample, StratifiedSampler
+from .correlation import (CorrelationAccumulator, correlation_matrix, correlation_pairs,
+                          correlation_with, high_correlations, sparse_correlations)
 from .auth import verify, APIKeyVerificationError
 
 logger = logging.getLogger(__name__)
 
+# Values of correlation_output: full nested matrix, only the pairs above the
+# threshold (sparse), or no matrix at all
+CORRELATION_OUTPUTS = ("full", "sparse", "none")
+
+# Distinct target values tracked exactly in chunked mode; beyond this the
+# target is treated as continuous and only its moments are kept.
+MAX_TRACKED_TARGET_VALUES = 10_000
+
+
+class _HyperLogLog:
+    """
+    HyperLogLog distinct counter over 64-bit row hashes.
+
+    Uses 2**precision one-byte registers (16 KiB at the default precision)
+    with a standard error of about 1.04 / sqrt(2**precision), i.e. ~0.8%.
+    Sketches with the same precision merge exactly by taking register maxima.
+    """
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @staticmethod
+    def _bit_length(values: np.ndarray) -> np.ndarray:
+        """Bit length of unsigned 32-bit values (exact: they fit a float64 mantissa)."""
+        return np.frexp(values.astype(np.float64))[1]
+
+    def update(self, hashes: np.ndarray) -> "_HyperLogLog":
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.int64)
+        rest = hashes & np.uint64((1 << width) - 1)
+        high, low = rest >> np.uint64(32), rest & np.uint64(0xFFFFFFFF)
+        bit_length = np.where(high > 0, 32 + self._bit_length(high), self._bit_length(low))
+        rank = (width - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other: "_HyperLogLog") -> "_HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # Linear counting for small cardinalities
+        return int(round(estimate))
+
+
+class DataQualityAccumulator:
+    """
+    Single-pass, mergeable data quality statistics over chunks of a dataset.
+
+    Holds per-column missing counts, streaming moments of numeric columns,
+    target and protected-attribute distributions, per-group target sums for
+    the bias metrics and a FairnessAccumulator per protected attribute.
+    Duplicate rows are counted from 64-bit row hashes, either exactly (a set
+    of distinct hashes) or approximately with a HyperLogLog sketch whose
+    memory does not grow with the number of rows.
+
+    Example:
+        acc = DataQualityAccumulator("income", ["sex", "race"])
+        for chunk in pd.read_csv("census.csv", chunksize=500_000):
+            acc.update(chunk)
+        data_quality = acc.finalize()
+    """
+
+    def __init__(self, target_column: str, protected_attributes: Optional[List[str]] = None,
+                 duplicate_strategy: str = "exact", correlations: bool = True):
+        """
+        Initialize DataQualityAccumulator.
+
+        Args:
+            target_column: Target column name
+            protected_attributes: Protected attributes to profile
+            duplicate_strategy: "exact" (hash set) or "approximate" (HyperLogLog)
+            correlations: Keep running co-moment sums of the numeric columns
+                (four p × p matrices) for the correlation report
+        """
+        if duplicate_strategy not in ("exact", "approximate"):
+            raise ValueError(f"Unknown duplicate_strategy '{duplicate_strategy}'")
+        from .fairness_metrics import FairnessAccumulator
+
+        self.target_column = target_column
+        self.protected_attributes = list(protected_attributes or [])
+        self.duplicate_strategy = duplicate_strategy
+        self.n_rows = 0
+        self.columns: List[str] = []
+        self.memory_bytes = 0
+        self.missing = pd.Series(dtype=np.int64)
+        self.numeric_columns: Dict[str, bool] = {}
+        self.categorical_columns: Dict[str, bool] = {}
+        self.moments: Dict[str, np.ndarray] = {}  # column -> [count, mean, M2, min, max]
+        self.target_dtype = None
+        self.target_counts: Optional[pd.Series] = pd.Series(dtype=np.int64)
+        self.target_totals = np.zeros(3)  # rows, outcome sum, non-missing outcomes
+        self.target_error: Optional[str] = None
+        self.group_stats: Dict[str, pd.DataFrame] = {}
+        self.fairness = {attr: FairnessAccumulator() for attr in self.protected_attributes}
+        self._hashes: List[np.ndarray] = []
+        self._hash_count = 0
+        self._compacted_size = 0
+        self._hll = _HyperLogLog() if duplicate_strategy == "approximate" else None
+        self.track_correlations = correlations
+        self.correlation: Optional[CorrelationAccumulator] = None
+
+    @staticmethod
+    def _merge_moments(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Combine [count, mean, M2, min, max] summaries (Chan et al.)."""
+        if a[0] == 0:
+            return b.copy()
+        if b[0] == 0:
+            return a.copy()
+        count = a[0] + b[0]
+        delta = b[1] - a[1]
+        mean = a[1] + delta * b[0] / count
+        m2 = a[2] + b[2] + delta * delta * a[0] * b[0] / count
+        return np.array([count, mean, m2, min(a[3], b[3]), max(a[4], b[4])])
+
+    @staticmethod
+    def _promote(current: Any, dtype: Any) -> Any:
+        """Dtype a column would get if all chunks were read at once."""
+        if current is None or current == dtype:
+            return dtype
+        numeric = pd.api.types.is_numeric_dtype
+        if numeric(current) and numeric(dtype):
+            try:
+                return np.promote_types(current, dtype)
+            except TypeError:
+                return np.dtype(np.float64)  # Nullable extension dtypes
+        return np.dtype(object)
+
+    def _row_hashes(self, chunk: pd.DataFrame) -> np.ndarray:
+        """Hash rows so equal rows collide across chunks whatever dtype each chunk inferred."""
+        normalized = chunk.copy(deep=False)
+        for col in normalized.columns:
+            if pd.api.types.is_numeric_dtype(normalized[col]) and not pd.api.types.is_bool_dtype(normalized[col]):
+                normalized[col] = normalized[col].astype(np.float64)
+        return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+    def _add_hashes(self, hashes: np.ndarray):
+        if self._hll is not None:
+            self._hll.update(hashes)
+            return
+        self._hashes.append(np.unique(hashes))
+        self._hash_count += len(self._hashes[-1])
+        # Compact lazily so repeated rows never hold more than ~2x the distinct set
+        if self._hash_count > 2 * max(self._compacted_size, 1 << 16):
+            self._compact()
+
+    def _compact(self):
+        if len(self._hashes) > 1:
+            self._hashes = [np.unique(np.concatenate(self._hashes))]
+        self._hash_count = self._compacted_size = sum(len(h) for h in self._hashes)
+
+    def update(self, chunk: pd.DataFrame) -> "DataQualityAccumulator":
+        """
+        Add one chunk of rows to the running statistics.
+
+        Args:
+            chunk: DataFrame batch with the same columns as earlier batches
+
+        Returns:
+            self, to allow chaining
+        """
+        if not self.columns:
+            self.columns = list(chunk.columns)
+        elif list(chunk.columns) != self.columns:
+            raise ValueError("All chunks must have the same columns.")
+        if len(chunk) == 0:
+            return self
+
+        self.n_rows += len(chunk)
+        self.memory_bytes += int(chunk.memory_usage(deep=True).sum())
+        self.missing = self.missing.add(chunk.isnull().sum(), fill_value=0)
+
+        categorical = set(chunk.select_dtypes(include=['object', 'category']).columns)
+        for col in chunk.columns:
+            is_numeric = pd.api.types.is_numeric_dtype(chunk[col]) and not pd.api.types.is_bool_dtype(chunk[col])
+            self.numeric_columns[col] = self.numeric_columns.get(col, True) and is_numeric
+            self.categorical_columns[col] = self.categorical_columns.get(col, False) or col in categorical
+            if is_numeric:
+                values = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                values = values[~np.isnan(values)]
+                if len(values):
+                    summary = np.array([len(values), values.mean(), ((values - values.mean()) ** 2).sum(),
+                                        values.min(), values.max()])
+                    self.moments[col] = self._merge_moments(self.moments.get(col, np.zeros(5)), summary)
+
+        self._update_target(chunk)
+        self._update_correlation(chunk)
+        self._add_hashes(self._row_hashes(chunk))
+        return self
+
+    def _update_correlation(self, chunk: pd.DataFrame):
+        if not self.track_correlations:
+            return
+        if self.correlation is None:
+            numeric = [col for col in chunk.columns if self.numeric_columns[col]]
+            self.correlation = CorrelationAccumulator(numeric)
+        try:
+            self.correlation.update(chunk)
+        except (TypeError, ValueError) as e:
+            # A column that looked numeric in the first chunk is not numeric after all
+            logger.warning(f"⚠️ Streaming correlations disabled: {e}")
+            self.track_correlations = False
+            self.correlation = None
+
+    def _update_target(self, chunk: pd.DataFrame):
+        target = chunk[self.target_column]
+        self.target_dtype = self._promote(self.target_dtype, target.dtype)
+
+        if self.target_counts is not None:
+            self.target_counts = self.target_counts.add(target.value_counts(), fill_value=0)
+            if len(self.target_counts) > MAX_TRACKED_TARGET_VALUES:
+                self.target_counts = None
+
+        try:
+            outcome = target.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError) as e:
+            self.target_error = self.target_error or str(e)
+            outcome = np.full(len(target), np.nan)
+        observed = ~np.isnan(outcome)
+        self.target_totals += [len(outcome), outcome[observed].sum(), observed.sum()]
+
+        for attr in self.protected_attributes:
+            stats = pd.DataFrame({attr: chunk[attr].to_numpy(),
+                                  'outcome_sum': np.where(observed, outcome, 0.0),
+                                  'outcome_count': observed.astype(np.int64)})
+            stats = stats.groupby(attr).agg(count=('outcome_count', 'size'),
+                                            outcome_sum=('outcome_sum', 'sum'),
+                                            outcome_count=('outcome_count', 'sum'))
+            self.group_stats[attr] = stats.add(self.group_stats[attr], fill_value=0) if attr in self.group_stats else stats
+
+            known = chunk[attr].notna().to_numpy()
+            self.fairness[attr].update(target.to_numpy()[known], target.to_numpy()[known],
+                                       chunk[attr].to_numpy()[known])
+
+    def merge(self, other: "DataQualityAccumulator") -> "DataQualityAccumulator":
+        """
+        Fold another accumulator's statistics into this one.
+
+        Duplicates are counted across both shards, so a row present in each
+        counts once as distinct.
+
+        Args:
+            other: Accumulator over the same columns and duplicate strategy
+
+        Returns:
+            self, to allow chaining
+        """
+        if other.duplicate_strategy != self.duplicate_strategy:
+            raise ValueError("Cannot merge accumulators with different duplicate strategies.")
+        if other.n_rows == 0:
+            return self
+        if self.columns and other.columns != self.columns:
+            raise ValueError("Cannot merge accumulators over different columns.")
+
+        self.columns = self.columns or list(other.columns)
+        self.n_rows += other.n_rows
+        self.memory_bytes += other.memory_bytes
+        self.missing = self.missing.add(other.missing, fill_value=0)
+        for col in other.columns:
+            self.numeric_columns[col] = self.numeric_columns.get(col, True) and other.numeric_columns[col]
+            self.categorical_columns[col] = self.categorical_columns.get(col, False) or other.categorical_columns[col]
+        for col, summary in other.moments.items():
+            self.moments[col] = self._merge_moments(self.moments.get(col, np.zeros(5)), summary)
+
+        if other.target_dtype is not None:
+            self.target_dtype = self._promote(self.target_dtype, other.target_dtype)
+        if self.target_counts is not None and other.target_counts is not None:
+            self.target_counts = self.target_counts.add(other.target_counts, fill_value=0)
+            if len(self.target_counts) > MAX_TRACKED_TARGET_VALUES:
+                self.target_counts = None
+        else:
+            self.target_counts = None
+        self.target_totals += other.target_totals
+        self.target_error = self.target_error or other.target_error
+        for attr, stats in other.group_stats.items():
+            self.group_stats[attr] = stats.add(self.group_stats[attr], fill_value=0) if attr in self.group_stats else stats
+        for attr, acc in other.fairness.items():
+            self.fairness[attr].merge(acc)
+
+        if self.correlation is not None and other.correlation is not None:
+            self.correlation.merge(other.correlation)
+        elif other.correlation is not None and self.track_correlations:
+            self.correlation = other.correlation
+        elif other.n_rows and not other.track_correlations:
+            self.track_correlations, self.correlation = False, None
+
+        if self._hll is not None:
+            self._hll.merge(other._hll)
+        else:
+            self._hashes.extend(other._hashes)
+            self._compact()
+        return self
+
+    def distinct_rows(self) -> int:
+        """Number of distinct rows (estimated with the approximate strategy)."""
+        if self._hll is not None:
+            return min(self._hll.count(), self.n_rows)
+        self._compact()
+        return self._compacted_size
+
+    def task_type(self) -> str:
+        """Classification or regression, decided from the streamed target counts."""
+        n_unique = len(self.target_counts) if self.target_counts is not None else None
+        is_classification = Utils.is_classification_counts(
+            self.target_dtype if self.target_dtype is not None else np.dtype(object),
+            n_unique, int(self.target_totals[0] - self.missing.get(self.target_column, 0))
+        )
+        return 'classification' if is_classification else 'regression'
+
+    def privileged_group(self, attr: str) -> Any:
+        """Most common value of a protected attribute."""
+        counts = self.group_stats[attr]['count']
+        return counts.sort_values(ascending=False, kind='stable').index[0]
+
+    def group_outcome_table(self, attr: str, privileged_val: Any) -> Dict[str, Any]:
+        """
+        Privileged vs. unprivileged target counts in BiasDetector's table layout.
+
+        Rows with a missing attribute fall in the unprivileged group, as with
+        an equality mask over the full column.
+        """
+        privileged = self.group_stats[attr].loc[privileged_val, ['count', 'outcome_sum', 'outcome_count']].to_numpy()
+        totals = self.target_totals
+        table = {
+            "count": np.array([privileged[0], totals[0] - privileged[0]]).astype(np.int64),
+            "outcome_sum": np.array([privileged[1], totals[1] - privileged[1]]),
+            "outcome_count": np.array([privileged[2], totals[2] - privileged[2]]).astype(np.int64)
+        }
+        if self.target_error:
+            table["outcome_error"] = ValueError(self.target_error)
+        return table
+
+    def describe(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean, std, min and max of every numeric column."""
+        stats = {}
+        for col in self.columns:
+            if not self.numeric_columns.get(col) or col not in self.moments:
+                continue
+            count, mean, m2, minimum, maximum = self.moments[col]
+            stats[col] = {
+                'count': float(count),
+                'mean': float(mean),
+                'std': float(np.sqrt(m2 / (count - 1))) if count > 1 else np.nan,
+                'min': float(minimum),
+                'max': float(maximum)
+            }
+        return stats
+
+    def finalize(self, task_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the data quality report, in the schema of
+        DatasetAuditor.analyze_data_quality().
+
+        Args:
+            task_type: Task type used for the class imbalance check (inferred if None)
+
+        Returns:
+            Dictionary with data quality metrics
+        """
+        task_type = task_type or self.task_type()
+        n_rows = max(self.n_rows, 1)
+        missing = self.missing.reindex(self.columns, fill_value=0).astype(np.int64)
+        duplicate_rows = self.n_rows - self.distinct_rows()
+
+        target_counts = (self.target_counts.astype(np.int64).sort_values(ascending=False, kind='stable')
+                         if self.target_counts is not None else pd.Series(dtype=np.int64))
+
+        if task_type != 'classification':
+            class_imbalance = {'imbalanced': False, 'reason': 'Not a classification task'}
+        elif target_counts.empty:
+            class_imbalance = {'imbalanced': False, 'reason': 'Target has no observed values'}
+        else:
+            imbalance_ratio = target_counts.iloc[0] / target_counts.iloc[-1]
+            class_imbalance = {
+                'imbalanced': imbalance_ratio > 2.0,
+                'imbalance_ratio': imbalance_ratio,
+                'majority_class': target_counts.index[0],
+                'majority_class_size': target_counts.iloc[0],
+                'minority_class': target_counts.index[-1],
+                'minority_class_size': target_counts.iloc[-1],
+                'class_distribution': target_counts.to_dict()
+            }
+
+        return {
+            'basic_statistics': {
+                'rows': self.n_rows,
+                'columns': len(self.columns),
+                'missing_values': int(missing.sum()),
+                'numeric_columns': sum(self.numeric_columns.values()),
+                'categorical_columns': sum(self.categorical_columns.values()),
+                'memory_usage_mb': self.memory_bytes / 1024 / 1024
+            },
+            'missing_analysis': {
+                'columns_with_missing': missing[missing > 0].to_dict(),
+                'missing_percentage': (missing / n_rows * 100).to_dict()
+            },
+            'duplicate_analysis': {
+                'duplicate_rows': duplicate_rows,
+                'duplicate_percentage': duplicate_rows / n_rows * 100,
+                'method': self.duplicate_strategy
+            },
+            'protected_attribute_distributions': {
+                attr: stats['count'].astype(np.int64).sort_values(ascending=False, kind='stable').to_dict()
+                for attr, stats in self.group_stats.items()
+            },
+            'target_distribution': target_counts.to_dict(),
+            'class_imbalance': class_imbalance
+        }
+
+
 class DatasetAuditor:
     """
     Comprehensive dataset auditing class.
@@ -30,47 +456,128 @@ class DatasetAuditor:
     """
 
     def __init__(self, 
-                 dataset: Union[str, pd.DataFrame], 
+                 dataset: Union[str, pd.DataFrame, AuditFrame], 
                  protected_attributes: Optional[List[str]] = None, 
                  target_column: Optional[str] = None,
                  justified_attributes: Optional[List[str]] = None,
                  user_api_key: Optional[str] = None,
-                 api_base_url: str = "http://localhost:5000"):
+                 api_base_url: str = "http://localhost:5000",
+                 columns: Optional[List[str]] = None,
+                 filters: Optional[Filters] = None,
+                 chunksize: Optional[int] = None,
+                 duplicate_strategy: str = "exact",
+                 correlation_output: str = "full",
+                 correlation_threshold: float = 0.8,
+                 top_k_correlations: Optional[int] = None,
+                 encoders: Optional[EncoderRegistry] = None,
+                 optimize_memory: bool = False):
         """
         Initialize DatasetAuditor.
 
         Args:
-            dataset: Dataset path (CSV) or DataFrame
+            dataset: Dataset path (CSV/Parquet/Feather/Arrow), DataFrame or shared AuditFrame
             protected_attributes: List of protected/sensitive attributes
             target_column: Target column name (auto-inferred if None)
             justified_attributes: Attributes justified for discrimination
+            columns: Columns to load (all if None)
+            filters: Row filters applied while loading, e.g. [("year", ">=", 2020)]
+            chunksize: Audit out-of-core in batches of this many rows (in memory if None)
+            duplicate_strategy: Duplicate counting in chunked mode, "exact" or
+                "approximate" (HyperLogLog, fixed memory)
+            correlation_output: "full" correlation matrix, "sparse" (only pairs
+                above the threshold) or "none"
+            correlation_threshold: |r| above which feature pairs are reported
+            top_k_correlations: Report only the k strongest pairs (all if None)
+            encoders: Categorical encoders to reuse, e.g. loaded from an earlier
+                audit of the same schema; newly seen columns are added to it
+            optimize_memory: Load the dataset with compact dtypes (downcast
+                numerics, low-cardinality strings and protected attributes
+                as category); ignored in chunked mode
         """
-        self.dataset_path = dataset if isinstance(dataset, str) else None
+        if correlation_output not in CORRELATION_OUTPUTS:
+            raise ValueError(f"correlation_output must be one of {CORRELATION_OUTPUTS}")
+        self.dataset_path = dataset if isinstance(dataset, str) else (dataset.source if isinstance(dataset, AuditFrame) else None)
         self.protected_attributes = protected_attributes or []
         self.justified_attributes = justified_attributes or []
         self.df = None
         self.original_df = None
         self.target_column = target_column
+        self.encoders = encoders if encoders is not None else EncoderRegistry()
         self.label_encoders = {}
         self.task_type = None
         self.user_api_key = user_api_key
         self.api_base_url = api_base_url
+        self.chunksize = chunksize
+        self.duplicate_strategy = duplicate_strategy
+        self.correlation_output = correlation_output
+        self.correlation_threshold = correlation_threshold
+        self.top_k_correlations = top_k_correlations
+        self._profile = None
 
         # Load and preprocess dataset
-        self._load_dataset(dataset)
+        if chunksize:
+            self._open_chunked(dataset, columns, filters)
+        else:
+            self._load_dataset(dataset, columns, filters, optimize_memory)
         self._validate_inputs()
 
-    def _load_dataset(self, dataset: Union[str, pd.DataFrame]):
-        """Load dataset from path or DataFrame."""
+    def _open_chunked(self, dataset: Union[str, pd.DataFrame, AuditFrame],
+                      columns: Optional[List[str]] = None,
+                      filters: Optional[Filters] = None):
+        """
+        Prepare an out-of-core audit. Only the first non-empty chunk is kept
+        in memory (as self.df) for validation and target inference.
+        """
+        try:
+            self._chunk_source = dataset.frame if isinstance(dataset, AuditFrame) else dataset
+            self._chunk_columns, self._chunk_filters = columns, filters
+            first = None
+            for chunk in self._iter_chunks():
+                first = chunk
+                if len(chunk):
+                    break
+            self.audit_frame = None
+            self.df = self.original_df = first
+            logger.info(f"📄 Streaming dataset from {self.dataset_path or 'DataFrame'} "
+                        f"in chunks of {self.chunksize} rows")
+        except Exception as e:
+            raise ValueError(f"❌ Failed to load dataset: {e}")
+
+    def _iter_chunks(self):
+        return iter_chunks(self._chunk_source, self.chunksize,
+                           columns=self._chunk_columns, filters=self._chunk_filters)
+
+    def _streaming_profile(self) -> DataQualityAccumulator:
+        """Profile the whole dataset in one streaming pass (cached)."""
+        if self._profile is None:
+            logger.info("🌊 Profiling dataset in a single streaming pass...")
+            profile = DataQualityAccumulator(self.target_column, self.protected_attributes,
+                                             duplicate_strategy=self.duplicate_strategy,
+                                             correlations=self.correlation_output != "none")
+            for chunk in self._iter_chunks():
+                profile.update(chunk)
+            self._profile = profile
+            logger.info(f"📊 Dataset shape: {profile.n_rows} rows × {len(profile.columns)} columns")
+        return self._profile
+
+    def _load_dataset(self, dataset: Union[str, pd.DataFrame, AuditFrame],
+                      columns: Optional[List[str]] = None,
+                      filters: Optional[Filters] = None,
+                      optimize_memory: bool = False):
+        """Load dataset from path, DataFrame or shared AuditFrame."""
         try:
-            if isinstance(dataset, str):
-                self.df = pd.read_csv(dataset)
-                logger.info(f"📄 Loaded dataset from {dataset}")
+            self.audit_frame = AuditFrame.load(dataset, columns=columns, filters=filters,
+                                               optimize_memory=optimize_memory,
+                                               categorical_columns=self.protected_attributes)
+            if self.audit_frame.source:
+                logger.info(f"📄 Loaded dataset from {self.audit_frame.source}")
             else:
-                self.df = dataset.copy()
                 logger.info("📄 Loaded dataset from DataFrame")
 
-            self.original_df = self.df.copy()
+            # Preprocessing replaces columns on the view; the shared frame
+            # stays untouched and doubles as the original data
+            self.df = self.audit_frame.view()
+            self.original_df = self.audit_frame.frame
             logger.info(f"📊 Dataset shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns")
 
         except Exception as e:
@@ -111,6 +618,9 @@ class DatasetAuditor:
         Returns:
             Dictionary with preprocessing information
         """
+        if self.chunksize:
+            return self._preprocess_chunked()
+
         logger.info("🔄 Preprocessing dataset...")
 
         preprocessing_info = {
@@ -141,6 +651,23 @@ class DatasetAuditor:
         logger.info(f"✅ Preprocessing complete. Task type: {self.task_type}")
         return preprocessing_info
 
+    def _preprocess_chunked(self) -> Dict[str, Any]:
+        """Chunked mode audits the raw data: report it without imputation or encoding."""
+        profile = self._streaming_profile()
+        self.task_type = profile.task_type()
+        shape = (profile.n_rows, len(profile.columns))
+        missing_values = int(profile.missing.sum())
+        return {
+            'original_shape': shape,
+            'missing_values_before': missing_values,
+            'categorical_columns': [col for col, flag in profile.categorical_columns.items() if flag],
+            'encoded_columns': [],
+            'label_encoders': [],
+            'final_shape': shape,
+            'missing_values_after': missing_values,
+            'task_type': self.task_type
+        }
+
     def _handle_missing_values(self):
         """Handle missing values in the dataset."""
         missing_counts = self.df.isnull().sum()
@@ -164,22 +691,29 @@ class DatasetAuditor:
         """Encode categorical variables."""
         categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns.tolist()
         encoded_cols = []
+        unseen_categories = {}
+        memory_before = int(self.df[categorical_cols].memory_usage(index=False, deep=True).sum())
 
         logger.info(f"🏷️ Encoding {len(categorical_cols)} categorical columns...")
 
         for col in categorical_cols:
             if col != self.target_column or self.task_type == 'classification':
                 try:
-                    self.label_encoders[col] = LabelEncoder()
-                    self.df[col] = self.label_encoders[col].fit_transform(self.df[col].astype(str))
+                    self.df[col], unseen = self.encoders.encode(self.df[col], col)
+                    self.label_encoders[col] = self.encoders[col]
                     encoded_cols.append(col)
+                    if unseen:
+                        unseen_categories[col] = unseen
                 except Exception as e:
                     logger.warning(f"⚠️ Failed to encode column {col}: {e}")
 
+        memory_after = int(self.df[categorical_cols].memory_usage(index=False, deep=True).sum())
         return {
             'categorical_columns': categorical_cols,
             'encoded_columns': encoded_cols,
-            'label_encoders': list(self.label_encoders.keys())
+            'label_encoders': list(self.label_encoders.keys()),
+            'unseen_categories': unseen_categories,
+            'categorical_memory': {'before_bytes': memory_before, 'after_bytes': memory_after}
         }
 
     def _detect_task_type(self) -> str:
@@ -199,6 +733,9 @@ class DatasetAuditor:
         """
         logger.info("🔍 Analyzing data quality...")
 
+        if self.chunksize:
+            return self._streaming_profile().finalize(self.task_type)
+
         # Basic statistics
         basic_stats = Utils.create_summary_stats(self.df)
 
@@ -218,10 +755,10 @@ class DatasetAuditor:
         protected_distributions = {}
         for attr in self.protected_attributes:
             if attr in self.df.columns:
-                protected_distributions[attr] = self.df[attr].value_counts().to_dict()
+                protected_distributions[attr] = column_profile(self.df[attr]).value_counts.to_dict()
 
         # Target distribution
-        target_distribution = self.df[self.target_column].value_counts().to_dict()
+        target_distribution = column_profile(self.df[self.target_column]).value_counts.to_dict()
 
         return {
             'basic_statistics': basic_stats,
@@ -237,7 +774,7 @@ class DatasetAuditor:
         if self.task_type != 'classification':
             return {'imbalanced': False, 'reason': 'Not a classification task'}
 
-        value_counts = self.df[self.target_column].value_counts()
+        value_counts = column_profile(self.df[self.target_column]).value_counts
         total_samples = len(self.df)
 
         # Calculate imbalance ratio
@@ -267,6 +804,9 @@ class DatasetAuditor:
         """
         logger.info("🔍 Running bias detection on dataset...")
 
+        if self.chunksize:
+            return self._detect_bias_chunked()
+
         try:
             from .bias_detection import BiasDetector
 
@@ -288,6 +828,29 @@ class DatasetAuditor:
             logger.error(f"❌ Bias detection failed: {e}")
             return []
 
+    def _detect_bias_chunked(self) -> List[Dict[str, Any]]:
+        """Dataset bias metrics from the streamed per-group target sums."""
+        try:
+            from .bias_detection import BiasDetector
+
+            profile = self._streaming_profile()
+            detector = BiasDetector(sensitive_features=self.protected_attributes,
+                                    target=self.target_column,
+                                    justified_attributes=self.justified_attributes)
+            results = []
+            for attr in self.protected_attributes:
+                if attr not in profile.group_stats or profile.group_stats[attr].empty:
+                    continue
+                privileged_val = profile.privileged_group(attr)
+                table = profile.group_outcome_table(attr, privileged_val)
+                results.append(detector._compute_disparate_impact(None, self.target_column, attr, privileged_val, table))
+                results.append(detector._compute_statistical_parity_difference(None, self.target_column, attr, privileged_val, table))
+            return [result.to_dict() for result in results]
+
+        except Exception as e:
+            logger.error(f"❌ Bias detection failed: {e}")
+            return []
+
     def compute_fairness_metrics(self) -> Dict[str, Any]:
         """
         Compute fairness metrics for the dataset.
@@ -299,6 +862,17 @@ class DatasetAuditor:
 
         fairness_metrics = {}
 
+        if self.chunksize:
+            profile = self._streaming_profile()
+            for attr, acc in profile.fairness.items():
+                try:
+                    acc.privileged_group = profile.privileged_group(attr)
+                    fairness_metrics[attr] = acc.to_metrics().evaluate()
+                    fairness_metrics[attr]['is_justified'] = attr in self.justified_attributes
+                except Exception as e:
+                    logger.error(f"❌ Fairness metrics computation failed for {attr}: {e}")
+            return fairness_metrics
+
         try:
             from .fairness_metrics import FairnessMetrics
 
@@ -308,7 +882,7 @@ class DatasetAuditor:
                     continue
 
                 # Determine privileged group (most common value)
-                privileged_group = self.df[attr].mode().iloc[0]
+                privileged_group = column_profile(self.df[attr]).mode
 
                 # Create dummy predictions (use target for dataset-only analysis)
                 y_true = self.df[self.target_column].values
@@ -339,44 +913,55 @@ class DatasetAuditor:
         """
         logger.info("📊 Generating statistical report...")
 
+        if self.chunksize:
+            profile = self._streaming_profile()
+            correlations = profile.correlation
+            report = {
+                'descriptive_statistics': profile.describe(),
+                'correlation_matrix': {},
+                'high_correlations': [],
+                'feature_importance': {}
+            }
+            if correlations is not None and len(correlations.columns) > 1:
+                corr = correlations.correlation_matrix()
+                report.update(self._correlation_report(corr, correlations.columns))
+                if self.task_type == 'classification' and self.target_column in correlations.columns:
+                    target_corr = corr[correlations.columns.index(self.target_column)]
+                    report['feature_importance'] = self._feature_importance(correlations.columns, target_corr)
+            return report
+
         try:
             # Descriptive statistics
             numeric_cols = self.df.select_dtypes(include=[np.number]).columns
             descriptive_stats = self.df[numeric_cols].describe().to_dict()
 
-            # Correlation analysis (excluding target for correlation matrix)
-            correlation_matrix = {}
+            # Correlation analysis, blockwise in float32
+            correlation_report = {'correlation_matrix': {}, 'high_correlations': []}
             if len(numeric_cols) > 1:
-                corr_df = self.df[numeric_cols].corr()
-                correlation_matrix = corr_df.to_dict()
-
-                # Find highly correlated features (>0.8)
-                high_correlations = []
-                for i in range(len(corr_df.columns)):
-                    for j in range(i+1, len(corr_df.columns)):
-                        if abs(corr_df.iloc[i, j]) > 0.8:
-                            high_correlations.append({
-                                'feature1': corr_df.columns[i],
-                                'feature2': corr_df.columns[j],
-                                'correlation': corr_df.iloc[i, j]
-                            })
+                if self.correlation_output == "full":
+                    corr = correlation_matrix(self.df[numeric_cols])
+                    correlation_report = self._correlation_report(corr, list(numeric_cols))
+                else:
+                    pairs = high_correlations(self.df[numeric_cols], threshold=self.correlation_threshold,
+                                              top_k=self.top_k_correlations)
+                    correlation_report = {
+                        'correlation_matrix': sparse_correlations(pairs) if self.correlation_output == "sparse" else {},
+                        'high_correlations': pairs
+                    }
 
             # Feature importance (simple correlation with target)
             feature_importance = {}
-            if self.task_type == 'classification':
-                for col in numeric_cols:
-                    if col != self.target_column:
-                        try:
-                            corr = self.df[col].corr(self.df[self.target_column])
-                            if not np.isnan(corr):
-                                feature_importance[col] = abs(corr)
-                        except:
-                            pass
+            if self.task_type == 'classification' and self.target_column in self.df.columns:
+                features = [col for col in numeric_cols if col != self.target_column]
+                try:
+                    target_corr = correlation_with(self.df[features], self.df[self.target_column])
+                    feature_importance = self._feature_importance(features, target_corr)
+                except (TypeError, ValueError):
+                    pass  # Non-numeric target
 
             return {
                 'descriptive_statistics': descriptive_stats,
-                'correlation_matrix': correlation_matrix,
-                'high_correlations': high_correlations,
+                **correlation_report,
                 'feature_importance': feature_importance
             }
 
@@ -384,13 +969,107 @@ class DatasetAuditor:
             logger.error(f"❌ Statistical report generation failed: {e}")
             return {}
 
-    def audit(self) -> Dict[str, Any]:
+    def detect_proxies(self,
+                       features: Optional[List[str]] = None,
+                       method: str = "mutual_information",
+                       threshold: float = 0.3,
+                       n_bins: int = 10,
+                       sample_size: Optional[int] = None,
+                       n_bootstrap: int = 200,
+                       confidence_level: float = 0.95,
+                       random_state: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find features that act as proxies for the protected attributes.
+
+        Args:
+            features: Candidate columns (all but the protected attributes and target if None)
+            method: "mutual_information" (normalized by the protected attribute's
+                entropy) or "cramers_v"
+            threshold: Score at or above which a feature is flagged as a proxy
+            n_bins: Quantile bins for continuous numeric features
+            sample_size: Scan a uniform sample of this many rows, with bootstrap
+                error bounds. Chunked audits always sample (1,000,000 rows by default).
+            n_bootstrap: Bootstrap replicates in sampling mode
+            confidence_level: Confidence level of the error bounds
+            random_state: Seed for sampling and bootstrap
+
+        Returns:
+            List of per (feature, protected attribute) scores, strongest first
+        """
+        logger.info("🕵️ Scanning features for protected-attribute proxies...")
+
+        if features is None:
+            excluded = set(self.protected_attributes) | {self.target_column}
+            features = [col for col in self.df.columns if col not in excluded]
+
+        population_rows = None
+        df = self.df
+        if self.chunksize:
+            population_rows = self._streaming_profile().n_rows
+            df = self._stream_sample(sample_size or 1_000_000, random_state)
+            sample_size = None
+
+        results = scan_proxies(
+            df, self.protected_attributes, features, method=method, threshold=threshold,
+            n_bins=n_bins, sample_size=sample_size, n_bootstrap=n_bootstrap,
+            confidence_level=confidence_level, random_state=random_state,
+            population_rows=population_rows
+        )
+        for result in results:
+            result['is_justified'] = result['protected_attribute'] in self.justified_attributes
+
+        proxies = [r for r in results if r['is_proxy']]
+        if proxies:
+            logger.warning(f"⚠️ {len(proxies)} potential proxy feature(s) found, strongest: "
+                           f"{proxies[0]['feature']} → {proxies[0]['protected_attribute']}")
+        return results
+
+    def _stream_sample(self, sample_size: int, random_state: Optional[int] = None) -> pd.DataFrame:
+        """Uniform row sample of a chunked dataset, drawn in one pass."""
+        rate = min(1.0, sample_size / max(self._streaming_profile().n_rows, 1))
+        rng = np.random.default_rng(random_state)
+        parts = [chunk[rng.random(len(chunk)) < rate] for chunk in self._iter_chunks()]
+        sample = pd.concat(parts, ignore_index=True)
+        return sample.iloc[:sample_size]
+
+    def _correlation_report(self, corr: np.ndarray, columns: List[Any]) -> Dict[str, Any]:
+        """Correlation matrix in the configured output form, plus the high-correlation pairs."""
+        pairs = correlation_pairs(corr, columns, self.correlation_threshold, self.top_k_correlations)
+        if self.correlation_output == "full":
+            matrix = pd.DataFrame(corr, index=columns, columns=columns).astype(np.float64).to_dict()
+        elif self.correlation_output == "sparse":
+            matrix = sparse_correlations(pairs)
+        else:
+            matrix = {}
+        return {'correlation_matrix': matrix, 'high_correlations': pairs}
+
+    def _feature_importance(self, columns: List[Any], target_corr: np.ndarray) -> Dict[str, float]:
+        """Absolute correlation with the target, skipping the target itself and NaNs."""
+        return {col: float(abs(r)) for col, r in zip(columns, target_corr)
+                if col != self.target_column and not np.isnan(r)}
+
+    def audit(self, quick: bool = False, sample_fraction: Optional[float] = None,
+              confidence_level: float = 0.95, n_bootstrap: int = 200,
+              random_state: Optional[int] = None) -> Dict[str, Any]:
         """
         Run comprehensive dataset audit.
 
+        Args:
+            quick: Audit a stratified sample (protected attributes × target)
+                instead of every row; bias and fairness results then carry
+                bootstrap confidence intervals and the sample size
+            sample_fraction: Fraction sampled per stratum (implies quick; 0.1 by default)
+            confidence_level: Coverage of the intervals in quick mode
+            n_bootstrap: Bootstrap replicates in quick mode
+            random_state: Seed for sampling and bootstrap
+
         Returns:
             Complete audit results dictionary
         """
+        if quick or sample_fraction is not None:
+            return self._audit_quick(sample_fraction or QUICK_SAMPLE_FRACTION,
+                                     confidence_level, n_bootstrap, random_state)
+
         logger.info("🚀 Starting comprehensive dataset audit...")
 
         # Basic dataset audit is free - no API key required
@@ -414,8 +1093,8 @@ class DatasetAuditor:
         audit_results = {
             'dataset_info': {
                 'source': self.dataset_path or 'DataFrame',
-                'original_shape': self.original_df.shape,
-                'processed_shape': self.df.shape,
+                'original_shape': preprocessing_info['original_shape'],
+                'processed_shape': preprocessing_info['final_shape'],
                 'target_column': self.target_column,
                 'protected_attributes': self.protected_attributes,
                 'justified_attributes': self.justified_attributes,
@@ -433,6 +1112,112 @@ class DatasetAuditor:
         logger.info("✅ Dataset audit completed successfully")
         return audit_results
 
+    def _audit_quick(self, sample_fraction: float, confidence_level: float,
+                     n_bootstrap: int, random_state: Optional[int]) -> Dict[str, Any]:
+        """
+        Audit a stratified sample drawn in one pass over the data.
+
+        Data quality and statistics describe the sample itself. Bias and
+        fairness metrics are design-weighted estimates for the whole dataset,
+        with intervals from resampling rows within strata.
+        """
+        from .bias_detection import BiasDetector
+
+        logger.info(f"🚀 Starting quick dataset audit on a {sample_fraction:.1%} stratified sample...")
+        strata = list(self.protected_attributes)
+        if Utils.is_classification_task(self.original_df[self.target_column]):
+            strata.append(self.target_column)
+
+        sampler = StratifiedSampler(strata, sample_fraction, random_state=random_state)
+        for chunk in (self._iter_chunks() if self.chunksize else [self.original_df]):
+            sampler.update(chunk)
+        sample = sampler.sample()
+
+        sub = DatasetAuditor(sample.data.reset_index(drop=True), self.protected_attributes, self.target_column,
+                             self.justified_attributes, self.user_api_key, self.api_base_url,
+                             correlation_output=self.correlation_output,
+                             correlation_threshold=self.correlation_threshold,
+                             top_k_correlations=self.top_k_correlations,
+                             # Saved encoders are reused, but encoders fitted on the
+                             # sample must not leak into this auditor's registry
+                             encoders=EncoderRegistry({col: self.encoders[col] for col in self.encoders}))
+        audit_results = sub.audit()
+        self.task_type = sub.task_type
+
+        # Privileged group: the most common value in the population, not the sample
+        weights = pd.Series(sample.weights)
+        privileged_values = {attr: weights.groupby(sub.df[attr].to_numpy()).sum().idxmax()
+                             for attr in self.protected_attributes}
+
+        try:
+            detector = BiasDetector(sensitive_features=self.protected_attributes, target=self.target_column,
+                                    justified_attributes=self.justified_attributes,
+                                    privileged_values=privileged_values)
+            results = detector.detect_on_sample(sample, sub.df, confidence_level=confidence_level,
+                                                n_bootstrap=n_bootstrap, random_state=random_state)
+            bias_results = [result.to_dict() for result in results]
+        except Exception as e:
+            logger.error(f"❌ Bias detection failed: {e}")
+            bias_results = []
+
+        fairness_metrics = {}
+        target = sub.df[self.target_column].to_numpy()
+        for attr, privileged_group in privileged_values.items():
+            try:
+                fairness_metrics[attr] = self._sample_fairness_metrics(
+                    sample, sub.df[attr].to_numpy(), target, privileged_group,
+                    confidence_level, n_bootstrap, random_state)
+                fairness_metrics[attr]['is_justified'] = attr in self.justified_attributes
+            except Exception as e:
+                logger.error(f"❌ Fairness metrics computation failed for {attr}: {e}")
+
+        audit_results['dataset_info']['source'] = self.dataset_path or 'DataFrame'
+        audit_results.update({
+            'bias_detection': bias_results,
+            'fairness_metrics': fairness_metrics,
+            'recommendations': self._generate_recommendations(bias_results, audit_results['data_quality']),
+            'sampling': {
+                'sample_size': len(sample),
+                'population_size': sample.population_size,
+                'sample_fraction': sample_fraction,
+                'strata': strata,
+                'n_strata': len(sample.strata),
+                'confidence_level': confidence_level,
+                'n_bootstrap': n_bootstrap
+            }
+        })
+
+        logger.info(f"✅ Quick dataset audit completed on {len(sample)} of {sample.population_size} rows")
+        return audit_results
+
+    @staticmethod
+    def _sample_fairness_metrics(sample: StratifiedSample, groups: np.ndarray, target: np.ndarray,
+                                 privileged_group: Any, confidence_level: float, n_bootstrap: int,
+                                 random_state: Optional[int]) -> Dict[str, Any]:
+        """Design-weighted dataset fairness metrics with within-strata bootstrap intervals."""
+        from .fairness_metrics import FairnessMetrics, FairnessResult
+
+        cells, weights, replicates = sample.bootstrap_cells([groups, target], n_bootstrap, random_state)
+        group_values, group_index = np.unique(groups[cells], return_inverse=True)
+
+        # The target is compared with itself, so every cell is a TP or a TN
+        cell = group_index.ravel() * 4 + np.where(target[cells] == 1, 0, 3)
+        n_counts = len(group_values) * 4
+        confusion = np.bincount(cell, weights=weights, minlength=n_counts).reshape(-1, 4)
+        indicator = np.zeros((len(cells), n_counts))
+        indicator[np.arange(len(cells)), cell] = 1
+        replicate_confusion = (replicates @ indicator).reshape(len(replicates), -1, 4)
+
+        fairness = FairnessMetrics.from_group_statistics(group_values, confusion, privileged_group=privileged_group)
+        results = fairness.compute_all_metrics(confidence_level=confidence_level,
+                                               replicate_confusion=replicate_confusion)
+        for value in results.values():
+            for result in (value.values() if isinstance(value, dict) else [value]):
+                if isinstance(result, FairnessResult):
+                    result.details['sample_size'] = len(sample)
+                    result.details['population_size'] = sample.population_size
+        return results
+
     def _generate_recommendations(self, bias_results: List[Dict], 
                                  data_quality: Dict[str, Any]) -> List[str]:
         """Generate actionable recommendations based on audit results."""
@@ -460,9 +1245,10 @@ class DatasetAuditor:
             )
 
         missing_cols = data_quality['missing_analysis']['columns_with_missing']
+        n_rows = data_quality['basic_statistics']['rows']
         if missing_cols:
             high_missing = [col for col, count in missing_cols.items() 
-                          if (count / len(self.df) * 100) > 20]
+                          if (count / n_rows * 100) > 20]
             if high_missing:
                 recommendations.append(
                     f"❓ High missing values (>20%) in columns: {', '.join(high_missing)}. "
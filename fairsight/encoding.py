@@ -0,0 +1,257 @@
+"""
+Fairsight Toolkit - Categorical Encoding
+========================================
+
+Compact integer encoding of categorical columns. Each column is hashed once
+with ``pd.factorize``, and only its (few) distinct values are mapped to codes,
+so no string copy of the column is ever built. Codes follow the sorted string
+order of the categories, the same order sklearn's ``LabelEncoder`` produces
+on ``astype(str)``, and are stored as int8/int16 where the category count
+allows. Missing values (None or NaN) form a single category.
+
+Encoders are collected in an ``EncoderRegistry`` that can be saved to JSON
+and reused by later audits of the same schema. Categories a saved encoder has
+never seen are encoded as ``UNSEEN_CODE``.
+"""
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Code of categories unknown to a fitted encoder
+UNSEEN_CODE = -1
+
+
+def _code_dtype(n_categories: int) -> np.dtype:
+    """Smallest signed integer type holding codes 0..n-1 and UNSEEN_CODE."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def factorize_keep_na(values: Union[pd.Series, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ``pd.factorize`` with missing values as one category of their own.
+
+    Same result as ``use_na_sentinel=False`` (pandas >= 1.5), except that the
+    missing category always takes the last code.
+
+    Args:
+        values: Values to factorize
+
+    Returns:
+        Tuple of (codes, object array of uniques, NaN last if any value is missing)
+    """
+    codes, uniques = pd.factorize(values)
+    uniques = np.asarray(uniques, dtype=object)
+    missing = codes < 0
+    if missing.any():
+        codes = np.where(missing, len(uniques), codes)
+        uniques = np.append(uniques, np.nan)
+    return codes, uniques
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert NumPy scalars and missing values to JSON-friendly Python values."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+class CategoryEncoder:
+    """
+    Encoder for one categorical column.
+
+    Drop-in for the parts of sklearn's LabelEncoder the auditors use
+    (``classes_``, ``fit_transform``, ``transform``, ``inverse_transform``),
+    except that unseen categories get ``UNSEEN_CODE`` instead of raising.
+    """
+
+    def __init__(self, categories: Optional[List[Any]] = None):
+        """
+        Initialize CategoryEncoder.
+
+        Args:
+            categories: Known categories in code order (fit from data if None)
+        """
+        categories = pd.Index(categories if categories is not None else [], dtype=object)
+        self._categories = categories.where(categories.notna(), np.nan)  # None from JSON
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return self._categories.to_numpy()
+
+    @property
+    def dtype(self) -> np.dtype:
+        return _code_dtype(len(self._categories))
+
+    def _fit_codes(self, values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+        """Learn the categories in one factorize pass and return the codes."""
+        codes, uniques = factorize_keep_na(values)
+        order = np.argsort(np.array([str(u) for u in uniques], dtype=object), kind='stable')
+        self._categories = pd.Index(uniques[order], dtype=object)
+        rank = np.empty(len(order), dtype=self.dtype)
+        rank[order] = np.arange(len(order))
+        return rank[codes]
+
+    def fit(self, values: Union[pd.Series, np.ndarray]) -> "CategoryEncoder":
+        """
+        Learn the categories of a column, replacing any known ones.
+
+        Args:
+            values: Column values
+
+        Returns:
+            self, to allow chaining
+        """
+        self._fit_codes(values)
+        return self
+
+    def transform(self, values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+        """
+        Encode a column.
+
+        Args:
+            values: Column values
+
+        Returns:
+            Integer codes (int8/int16 where possible), UNSEEN_CODE for unknown categories
+        """
+        codes, uniques = factorize_keep_na(values)
+        mapping = self._categories.get_indexer(pd.Index(uniques))
+        return mapping.astype(self.dtype)[codes]
+
+    def fit_transform(self, values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+        return self._fit_codes(values)
+
+    def inverse_transform(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Decode codes back to categories (None for UNSEEN_CODE).
+
+        Args:
+            codes: Integer codes
+
+        Returns:
+            Object array of categories
+        """
+        codes = np.asarray(codes)
+        values = self.classes_[np.clip(codes, 0, None)] if len(self._categories) else np.full(codes.shape, None)
+        return np.where(codes == UNSEEN_CODE, None, values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the encoder to a JSON-serializable dictionary."""
+        return {"categories": [_to_builtin(value) for value in self._categories]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CategoryEncoder":
+        """Rebuild an encoder from to_dict() output."""
+        return cls(data["categories"])
+
+    def __repr__(self) -> str:
+        return f"CategoryEncoder({len(self._categories)} categories, {self.dtype.name})"
+
+
+class EncoderRegistry(Mapping):
+    """
+    Per-column CategoryEncoders, persisted between audits.
+
+    Columns already in the registry are encoded with their saved categories,
+    so codes stay stable across runs; new columns are fitted on first use.
+
+    Example:
+        registry = EncoderRegistry.load("encoders.json") if os.path.exists("encoders.json") else EncoderRegistry()
+        auditor = DatasetAuditor(df, ["sex"], "label", encoders=registry)
+        auditor.audit()
+        registry.save("encoders.json")
+    """
+
+    def __init__(self, encoders: Optional[Dict[str, CategoryEncoder]] = None):
+        """
+        Initialize EncoderRegistry.
+
+        Args:
+            encoders: Encoders by column name
+        """
+        self._encoders: Dict[str, CategoryEncoder] = dict(encoders or {})
+
+    def __getitem__(self, column: str) -> CategoryEncoder:
+        return self._encoders[column]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._encoders)
+
+    def __len__(self) -> int:
+        return len(self._encoders)
+
+    def encode(self, values: pd.Series, column: Optional[str] = None) -> Tuple[np.ndarray, int]:
+        """
+        Encode one column, fitting an encoder if the registry has none for it.
+
+        Args:
+            values: Column values
+            column: Registry key (values.name if None)
+
+        Returns:
+            Tuple of (codes, number of values unseen by a saved encoder)
+        """
+        column = column if column is not None else values.name
+        if column not in self._encoders:
+            self._encoders[column] = CategoryEncoder()
+            return self._encoders[column].fit_transform(values), 0
+        codes = self._encoders[column].transform(values)
+        unseen = int(np.count_nonzero(codes == UNSEEN_CODE))
+        if unseen:
+            logger.warning(f"⚠️ {unseen} values of {column} are unseen categories, encoded as {UNSEEN_CODE}")
+        return codes, unseen
+
+    def encode_frame(self, df: pd.DataFrame, columns: List[str]) -> Dict[str, int]:
+        """
+        Replace columns of a DataFrame with their codes, in place.
+
+        Args:
+            df: DataFrame to update
+            columns: Columns to encode
+
+        Returns:
+            Unseen value counts by column (only columns with unseen values)
+        """
+        unseen = {}
+        for col in columns:
+            df[col], count = self.encode(df[col], col)
+            if count:
+                unseen[col] = count
+        return unseen
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the registry to a JSON-serializable dictionary."""
+        return {column: encoder.to_dict() for column, encoder in self._encoders.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EncoderRegistry":
+        """Rebuild a registry from to_dict() output."""
+        return cls({column: CategoryEncoder.from_dict(encoder) for column, encoder in data.items()})
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the registry to a JSON file."""
+        with open(path, "w") as fp:
+            json.dump(self.to_dict(), fp, indent=2)
+        logger.info(f"💾 Saved {len(self)} categorical encoders to {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "EncoderRegistry":
+        """Read a registry written by save()."""
+        with open(path, "r") as fp:
+            return cls.from_dict(json.load(fp))
+
+    def __repr__(self) -> str:
+        return f"EncoderRegistry({list(self._encoders)})"
@@ -6,21 +6,17 @@ Provides model explainability using SHAP, LIME, and custom feature importance me
 Includes support for both local and global explanations with bias-aware analysis.
 """
 
-import shap
-import lime
-import lime.lime_tabular
 import pandas as pd
 import numpy as np
 import warnings
-import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Any, Dict, List, Optional, Union, Tuple
 from sklearn.base import BaseEstimator
 from sklearn.exceptions import NotFittedError
-from sklearn.inspection import permutation_importance
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 import logging
 
+# shap, lime and matplotlib are imported inside the methods that use them;
+# they are slow to load and not needed for the rest of the toolkit.
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -141,6 +137,8 @@ class ExplainabilityEngine:
         Returns:
             ExplainabilityResult with SHAP analysis
         """
+        import shap
+
         try:
             logger.info("Starting SHAP explanation...")
             
@@ -224,6 +222,8 @@ class ExplainabilityEngine:
         Returns:
             ExplainabilityResult with LIME analysis
         """
+        import lime.lime_tabular
+
         try:
             logger.info("Starting LIME explanation...")
             
@@ -301,6 +301,8 @@ class ExplainabilityEngine:
         Returns:
             ExplainabilityResult with permutation importance
         """
+        from sklearn.inspection import permutation_importance
+
         try:
             logger.info("Starting permutation importance analysis...")
             
@@ -443,6 +445,9 @@ class ExplainabilityEngine:
         X_sample: pd.DataFrame
     ) -> List[str]:
         """Create SHAP visualization plots."""
+        import shap
+        import matplotlib.pyplot as plt
+
         viz_paths = []
         
         try:
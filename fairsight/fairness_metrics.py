@@ -9,15 +9,9 @@ predictive parity, and more.
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Optional, Tuple, Dict, Union, List, Any
-from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score, 
-    confusion_matrix, roc_auc_score, mean_squared_error, mean_absolute_error
-)
-from scipy import stats
 import logging
+import os
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -59,6 +53,428 @@ class FairnessResult:
             "details": self.details
         }
 
+# Column order of the per-group confusion table
+CONFUSION_COLUMNS = ("tp", "fp", "fn", "tn")
+
+# Default number of equal-width probability bins used for calibration
+CALIBRATION_BINS = 10
+
+# Group fairness metrics and the per-group rate each one compares
+GROUP_FAIRNESS_METRICS = {
+    "demographic_parity": "positive_rate",
+    "equal_opportunity": "true_positive_rate",
+    "equal_false_positive_rate": "false_positive_rate",
+    "predictive_parity": "precision",
+}
+
+
+def _divide_counts(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise division with the same zero handling as FairnessMetrics._safe_divide."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = numerator / denominator
+    zero_den = denominator == 0
+    return np.where(zero_den, np.where(numerator == 0, 0.0, np.inf), result)
+
+
+def compute_group_confusion(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    groups: np.ndarray,
+    positive_label: Union[int, str] = 1,
+    sample_weight: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute TP/FP/FN/TN for every group value in a single vectorized pass.
+
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+        groups: Group membership of each row (e.g. protected attribute values)
+        positive_label: Label treated as the positive outcome
+        sample_weight: Row weights; cells then hold weighted sums
+
+    Returns:
+        Tuple of (sorted unique group values, array of shape (k, 4) with
+        columns ordered as CONFUSION_COLUMNS; int64 counts, or float64 sums
+        when weighted)
+    """
+    group_values, group_index = np.unique(np.asarray(groups), return_inverse=True)
+    group_index = group_index.ravel()
+    pred_negative = np.asarray(y_pred) != positive_label
+    true_negative = np.asarray(y_true) != positive_label
+
+    # Cell code: 0=TP, 1=FP, 2=FN, 3=TN
+    cell = group_index * 4 + pred_negative * 2 + true_negative
+    if sample_weight is not None:
+        sums = np.bincount(cell, weights=np.asarray(sample_weight, dtype=float), minlength=len(group_values) * 4)
+        return group_values, sums.reshape(len(group_values), 4)
+    counts = np.bincount(cell, minlength=len(group_values) * 4)
+    return group_values, counts.reshape(len(group_values), 4).astype(np.int64)
+
+
+class ThresholdCurves:
+    """
+    Per-group confusion counts as a function of the decision threshold.
+
+    Scores are sorted once per group and the positive labels accumulated
+    along that order, so the confusion table at any threshold is two
+    binary searches and a lookup per group instead of a pass over the rows.
+    A row is predicted positive when its score is >= the threshold.
+    """
+
+    def __init__(self, group_values: np.ndarray, scores: List[np.ndarray], cum_positive: List[np.ndarray],
+                 cum_weight: Optional[List[np.ndarray]] = None):
+        """
+        Initialize ThresholdCurves.
+
+        Args:
+            group_values: Sorted unique group values
+            scores: Ascending scores of each group
+            cum_positive: Positive-label counts (or weight sums) among each
+                group's lowest 0..n scores (length n + 1)
+            cum_weight: Row weight sums over the same prefixes (None when
+                unweighted, where the prefix length is the count)
+        """
+        self.group_values = np.asarray(group_values)
+        self.scores = scores
+        self.cum_positive = cum_positive
+        self.cum_weight = cum_weight
+
+    @classmethod
+    def from_arrays(
+        cls,
+        y_true: Union[np.ndarray, pd.Series],
+        y_prob: Union[np.ndarray, pd.Series],
+        groups: Union[np.ndarray, pd.Series],
+        positive_label: Union[int, str] = 1,
+        sample_weight: Optional[Union[np.ndarray, pd.Series]] = None
+    ) -> "ThresholdCurves":
+        """
+        Build the curves with one sort of the rows by (group, score).
+
+        Args:
+            y_true: True labels
+            y_prob: Scores or predicted probabilities of the positive label
+            groups: Group membership of each row
+            positive_label: Label treated as the positive outcome
+            sample_weight: Row weights; confusion tables then hold weighted sums
+
+        Returns:
+            ThresholdCurves
+        """
+        group_values, group_index = np.unique(np.asarray(groups), return_inverse=True)
+        group_index = group_index.ravel()
+        y_prob = np.asarray(y_prob, dtype=float)
+        order = np.lexsort((y_prob, group_index))
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(group_index, minlength=len(group_values)))])
+        sorted_scores = y_prob[order]
+        sorted_positive = np.asarray(y_true)[order] == positive_label
+        sorted_weight = np.asarray(sample_weight, dtype=float)[order] if sample_weight is not None else None
+
+        scores, cum_positive, cum_weight = [], [], []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            scores.append(sorted_scores[start:stop])
+            if sorted_weight is None:
+                cum_positive.append(np.concatenate([[0], np.cumsum(sorted_positive[start:stop], dtype=np.int64)]))
+            else:
+                weight = sorted_weight[start:stop]
+                cum_positive.append(np.concatenate([[0.0], np.cumsum(weight * sorted_positive[start:stop])]))
+                cum_weight.append(np.concatenate([[0.0], np.cumsum(weight)]))
+        return cls(group_values, scores, cum_positive, cum_weight if sorted_weight is not None else None)
+
+    def candidate_thresholds(self, max_thresholds: Optional[int] = None) -> np.ndarray:
+        """
+        Distinct scores over all groups, where any group's predictions change.
+
+        Args:
+            max_thresholds: Keep at most this many, spaced by quantile (all if None)
+
+        Returns:
+            Ascending array of thresholds
+        """
+        thresholds = np.unique(np.concatenate(self.scores)) if self.scores else np.zeros(0)
+        if max_thresholds is not None and len(thresholds) > max_thresholds:
+            thresholds = thresholds[np.unique(np.linspace(0, len(thresholds) - 1, max_thresholds).astype(int))]
+        return thresholds
+
+    def confusion(self, thresholds: np.ndarray, per_group: bool = False) -> np.ndarray:
+        """
+        Confusion tables at the given thresholds.
+
+        Args:
+            thresholds: Array of shape (...,) applied to every group, or of
+                shape (..., k) holding one threshold per group
+            per_group: Whether the last axis of thresholds indexes the groups
+
+        Returns:
+            Array of shape (..., k, 4) with columns ordered as CONFUSION_COLUMNS
+            (float weight sums for weighted curves)
+        """
+        thresholds = np.asarray(thresholds, dtype=float)
+        k = len(self.group_values)
+        if per_group and thresholds.shape[-1:] != (k,):
+            raise ValueError(f"Expected one threshold per group ({k}) on the last axis.")
+        shape = thresholds.shape[:-1] if per_group else thresholds.shape
+        result = np.empty(shape + (k, 4), dtype=np.int64 if self.cum_weight is None else np.float64)
+        for g in range(k):
+            t = thresholds[..., g] if per_group else thresholds
+            index = np.searchsorted(self.scores[g], t, side='left')
+            positives, fn = self.cum_positive[g][-1], self.cum_positive[g][index]
+            if self.cum_weight is None:
+                n, below = len(self.scores[g]), index
+            else:
+                n, below = self.cum_weight[g][-1], self.cum_weight[g][index]
+            tn = below - fn
+            result[..., g, 0] = positives - fn
+            result[..., g, 1] = (n - positives) - tn
+            result[..., g, 2] = fn
+            result[..., g, 3] = tn
+        return result
+
+
+def rates_from_confusion(confusion: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Derive per-group rates from a confusion table.
+
+    Args:
+        confusion: Array of shape (..., 4) with columns ordered as CONFUSION_COLUMNS
+
+    Returns:
+        Dict of metric name to array of shape (...)
+    """
+    confusion = np.asarray(confusion)
+    tp, fp, fn, tn = (confusion[..., i] for i in range(4))
+    total = tp + fp + fn + tn
+    positive_actual = tp + fn
+    negative_actual = fp + tn
+
+    return {
+        "positive_rate": _divide_counts(tp + fp, total),  # P(Y_hat = 1)
+        "true_positive_rate": _divide_counts(tp, positive_actual),  # Sensitivity/Recall
+        "false_positive_rate": _divide_counts(fp, negative_actual),  # 1 - Specificity
+        "true_negative_rate": _divide_counts(tn, negative_actual),  # Specificity
+        "false_negative_rate": _divide_counts(fn, positive_actual),  # Miss rate
+        "precision": _divide_counts(tp, tp + fp),  # Positive predictive value
+        "recall": _divide_counts(tp, tp + fn),  # Same as TPR
+        "f1_score": _divide_counts(2 * tp, 2 * tp + fp + fn),
+        "accuracy": _divide_counts(tp + tn, total),
+        "size": total
+    }
+
+
+def calibration_bin_edges(
+    y_prob: np.ndarray,
+    n_bins: int = CALIBRATION_BINS,
+    strategy: str = "uniform"
+) -> np.ndarray:
+    """
+    Compute probability bin edges for calibration.
+
+    Args:
+        y_prob: Predicted probabilities of the positive label
+        n_bins: Number of bins
+        strategy: 'uniform' for equal-width bins over [0, 1] or 'quantile'
+            for equal-frequency bins (duplicate edges are collapsed, so fewer
+            than n_bins may be returned)
+
+    Returns:
+        Array of n_bins + 1 increasing edges
+    """
+    if strategy == "uniform":
+        return np.linspace(0, 1, n_bins + 1)
+    if strategy == "quantile":
+        edges = np.unique(np.quantile(np.asarray(y_prob, dtype=float), np.linspace(0, 1, n_bins + 1)))
+        # Bins are right-closed, so open the first one to include the minimum
+        edges[0] = np.nextafter(edges[0], -np.inf)
+        if len(edges) == 1:
+            edges = np.append(edges, np.nextafter(edges[0], np.inf))
+        return edges
+    raise ValueError(f"Unknown calibration strategy '{strategy}'. Use 'uniform' or 'quantile'.")
+
+
+def compute_calibration_bins(
+    y_true: np.ndarray,
+    y_prob: np.ndarray,
+    groups: np.ndarray,
+    positive_label: Union[int, str] = 1,
+    n_bins: int = CALIBRATION_BINS,
+    bin_edges: Optional[np.ndarray] = None,
+    sample_weight: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Accumulate calibration sufficient statistics for every (group, bin) cell.
+
+    Bins are right-closed intervals (lower, upper]; probabilities outside
+    every bin still count towards the group size.
+
+    Args:
+        y_true: True labels
+        y_prob: Predicted probabilities of the positive label
+        groups: Group membership of each row
+        positive_label: Label treated as the positive outcome
+        n_bins: Number of equal-width bins over [0, 1] (ignored if bin_edges is given)
+        bin_edges: Explicit bin edges, e.g. from calibration_bin_edges()
+        sample_weight: Row weights; every statistic is then a weighted sum
+
+    Returns:
+        Tuple of (sorted unique group values, float array of shape
+        (k, n_bins, 3) holding per-bin row count, probability sum and
+        positive-label sum)
+    """
+    if bin_edges is None:
+        bin_edges = np.linspace(0, 1, n_bins + 1)
+    n_bins = len(bin_edges) - 1
+    group_values, group_index = np.unique(np.asarray(groups), return_inverse=True)
+    group_index = group_index.ravel()
+    y_prob = np.asarray(y_prob, dtype=float)
+    bin_index = np.digitize(y_prob, bin_edges, right=True) - 1
+    in_range = (bin_index >= 0) & (bin_index < n_bins)
+
+    cell = group_index[in_range] * n_bins + bin_index[in_range]
+    size = len(group_values) * n_bins
+    positives = (np.asarray(y_true)[in_range] == positive_label).astype(float)
+    weight = np.asarray(sample_weight, dtype=float)[in_range] if sample_weight is not None else 1.0
+    stats_ = np.stack([
+        np.bincount(cell, weights=weight if sample_weight is not None else None, minlength=size).astype(float),
+        np.bincount(cell, weights=y_prob[in_range] * weight, minlength=size),
+        np.bincount(cell, weights=positives * weight, minlength=size),
+    ], axis=-1)
+    return group_values, stats_.reshape(len(group_values), n_bins, 3)
+
+
+def reliability_from_bins(bins: np.ndarray, group_sizes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Reliability curves and calibration errors from accumulated bin statistics.
+
+    Args:
+        bins: Array of shape (k, n_bins, 3) from compute_calibration_bins()
+        group_sizes: Number of rows in each group
+
+    Returns:
+        Dict with per-bin arrays of shape (k, n_bins) ('count',
+        'mean_confidence', 'observed_rate', 'gap') and per-group arrays of
+        shape (k,) ('expected_calibration_error', 'max_calibration_error')
+    """
+    count, prob_sum, positive_sum = bins[..., 0], bins[..., 1], bins[..., 2]
+    mean_confidence = _divide_counts(prob_sum, count)
+    observed_rate = _divide_counts(positive_sum, count)
+    gap = np.abs(mean_confidence - observed_rate)
+    weight = _divide_counts(count, np.asarray(group_sizes, dtype=float)[:, None])
+    populated = count > 0
+    return {
+        "count": count,
+        "mean_confidence": mean_confidence,
+        "observed_rate": observed_rate,
+        "gap": gap,
+        "expected_calibration_error": np.where(populated, gap * weight, 0.0).sum(axis=1),
+        "max_calibration_error": np.where(populated, gap, 0.0).max(axis=1, initial=0.0),
+    }
+
+
+def _threshold_met(
+    metric: str,
+    difference: np.ndarray,
+    ratio: np.ndarray,
+    fairness_threshold: float,
+    justified_disparity: bool = False
+) -> np.ndarray:
+    """Vectorized version of the per-metric fairness threshold checks."""
+    if justified_disparity:
+        return np.ones(np.shape(difference), dtype=bool)
+    if metric == "demographic_parity":
+        return (ratio >= fairness_threshold) & (ratio <= 1 / fairness_threshold)
+    return np.abs(difference) <= (1 - fairness_threshold)
+
+
+def comparison_columns(
+    confusion: np.ndarray,
+    group_idx: np.ndarray,
+    ref_idx: np.ndarray,
+    fairness_threshold: float = 0.8,
+    justified_disparity: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Compare rows of a confusion table against reference rows.
+
+    Args:
+        confusion: Array of shape (k, 4) with columns ordered as CONFUSION_COLUMNS
+        group_idx: Rows to evaluate
+        ref_idx: Reference row for each entry of group_idx
+        fairness_threshold: Fairness threshold (80% rule by default)
+        justified_disparity: Whether disparities are business-justified
+
+    Returns:
+        Dict of column name to array, ready to be placed in a DataFrame
+    """
+    rates = rates_from_confusion(confusion)
+    columns = {"size": rates["size"][group_idx]}
+    for metric, rate_name in GROUP_FAIRNESS_METRICS.items():
+        value = rates[rate_name][group_idx]
+        reference = rates[rate_name][ref_idx]
+        difference = value - reference
+        ratio = _divide_counts(value, reference)
+        columns[rate_name] = value
+        columns[f"{metric}_difference"] = difference
+        columns[f"{metric}_ratio"] = ratio
+        columns[f"{metric}_threshold_met"] = _threshold_met(
+            metric, difference, ratio, fairness_threshold, justified_disparity
+        )
+    for rate_name in ("accuracy", "recall", "f1_score"):
+        columns[rate_name] = rates[rate_name][group_idx]
+    return columns
+
+
+def threshold_sweep_table(
+    curves: ThresholdCurves,
+    privileged_group: Union[int, str],
+    thresholds: Optional[Union[int, np.ndarray, List[float]]] = None,
+    fairness_threshold: float = 0.8,
+    justified_disparity: bool = False
+) -> pd.DataFrame:
+    """
+    Compare every group against the privileged group at every threshold.
+
+    Args:
+        curves: ThresholdCurves of the protected attribute
+        privileged_group: Value of the privileged group
+        thresholds: Thresholds to evaluate; None for every distinct score, an
+            int for at most that many quantile-spaced scores
+        fairness_threshold: Fairness threshold (80% rule by default)
+        justified_disparity: Whether disparities are business-justified
+
+    Returns:
+        DataFrame with one row per (threshold, group): the columns of
+        FairnessMetrics.compare_all_groups() plus the overall accuracy and
+        equalized odds difference at that threshold
+    """
+    privileged = np.flatnonzero(curves.group_values == privileged_group)
+    if len(privileged) == 0:
+        raise ValueError(f"Privileged group {privileged_group!r} not found in protected attribute.")
+    if thresholds is None or isinstance(thresholds, (int, np.integer)):
+        thresholds = curves.candidate_thresholds(thresholds)
+    thresholds = np.asarray(thresholds, dtype=float)
+
+    k = len(curves.group_values)
+    confusion = curves.confusion(thresholds)
+    overall = rates_from_confusion(confusion.sum(axis=1))["accuracy"]
+    flat = confusion.reshape(-1, 4)
+    group_idx = np.arange(len(flat))
+    ref_idx = (group_idx // k) * k + privileged[0]
+
+    table = {
+        "threshold": np.repeat(thresholds, k),
+        "group": np.tile(curves.group_values, len(thresholds)),
+        "reference_group": np.full(len(flat), curves.group_values[privileged[0]]),
+    }
+    table.update(comparison_columns(flat, group_idx, ref_idx, fairness_threshold, justified_disparity))
+    table["equalized_odds_difference"] = np.maximum(
+        np.abs(table["equal_opportunity_difference"]), np.abs(table["equal_false_positive_rate_difference"])
+    )
+    table["overall_accuracy"] = np.repeat(overall, k)
+    return pd.DataFrame(table)
+
 class FairnessMetrics:
     """
     Comprehensive fairness metrics calculator.
@@ -80,20 +496,85 @@ class FairnessMetrics:
         privileged_group: Union[int, str] = 1,
         positive_label: Union[int, str] = 1,
         fairness_threshold: float = 0.8,
-        justified_disparity: bool = False
+        justified_disparity: bool = False,
+        n_bins: int = CALIBRATION_BINS,
+        calibration_strategy: str = "uniform",
+        sample_weight: Optional[Union[np.ndarray, pd.Series]] = None
     ):
-        self.y_true = np.array(y_true)
-        self.y_pred = np.array(y_pred)
-        self.y_prob = np.array(y_prob) if y_prob is not None else None
-        self.protected_attr = np.array(protected_attr) if protected_attr is not None else None
+        self.y_true = np.asarray(y_true)
+        self.y_pred = np.asarray(y_pred)
+        self.y_prob = np.asarray(y_prob) if y_prob is not None else None
+        self.protected_attr = np.asarray(protected_attr) if protected_attr is not None else None
+        self.sample_weight = np.asarray(sample_weight, dtype=float) if sample_weight is not None else None
         self.privileged_group = privileged_group
         self.positive_label = positive_label
         self.fairness_threshold = fairness_threshold
         self.justified_disparity = justified_disparity
+        self.n_bins = n_bins
+        self.calibration_strategy = calibration_strategy
+        self._group_values = None
+        self._confusion = None
+        self._calibration_bins = None
+        self._bin_edges = None
+        self._threshold_curves = None
         
         self._validate_inputs()
         self.unprivileged_group = self._get_unprivileged_group()
     
+    @classmethod
+    def from_group_statistics(
+        cls,
+        group_values: np.ndarray,
+        confusion: np.ndarray,
+        calibration_bins: Optional[np.ndarray] = None,
+        privileged_group: Union[int, str] = 1,
+        positive_label: Union[int, str] = 1,
+        fairness_threshold: float = 0.8,
+        justified_disparity: bool = False,
+        bin_edges: Optional[np.ndarray] = None
+    ) -> "FairnessMetrics":
+        """
+        Build a calculator from per-group sufficient statistics instead of rows.
+
+        Args:
+            group_values: Sorted unique group values
+            confusion: Array of shape (k, 4) with columns ordered as CONFUSION_COLUMNS;
+                float tables hold weighted counts
+            calibration_bins: Optional array of shape (k, n_bins, 3) from
+                compute_calibration_bins(), required for calibration()
+            privileged_group: Value of the privileged group
+            positive_label: Label treated as the positive outcome
+            fairness_threshold: Fairness threshold (80% rule by default)
+            justified_disparity: Whether disparities are business-justified
+            bin_edges: Edges the calibration bins were built with (equal-width
+                over [0, 1] if None)
+
+        Returns:
+            FairnessMetrics whose metric methods read only from the statistics
+        """
+        fm = cls.__new__(cls)
+        fm.y_true = fm.y_pred = fm.y_prob = fm.protected_attr = fm.sample_weight = None
+        fm.privileged_group = privileged_group
+        fm.positive_label = positive_label
+        fm.fairness_threshold = fairness_threshold
+        fm.justified_disparity = justified_disparity
+        fm._group_values = np.asarray(group_values)
+        confusion = np.asarray(confusion)
+        # Weighted (e.g. design-weighted sample) tables keep their float counts
+        fm._confusion = confusion if np.issubdtype(confusion.dtype, np.floating) else confusion.astype(np.int64)
+        fm._calibration_bins = calibration_bins
+        fm.n_bins = calibration_bins.shape[1] if calibration_bins is not None else CALIBRATION_BINS
+        uniform_edges = np.linspace(0, 1, fm.n_bins + 1)
+        fm._bin_edges = np.asarray(bin_edges, dtype=float) if bin_edges is not None else uniform_edges
+        fm._threshold_curves = None
+        fm.calibration_strategy = "uniform" if np.array_equal(fm._bin_edges, uniform_edges) else "custom"
+        fm.unprivileged_group = fm._get_unprivileged_group()
+        return fm
+    
+    def _has_groups(self) -> bool:
+        """Whether group membership (rows or precomputed statistics) is available."""
+        return self.protected_attr is not None or self._confusion is not None
+    
     def _validate_inputs(self):
         """Validate input data."""
         if len(self.y_true) != len(self.y_pred):
@@ -104,13 +585,16 @@ class FairnessMetrics:
         
         if self.y_prob is not None and len(self.y_true) != len(self.y_prob):
             raise ValueError("y_true and y_prob must have the same length.")
+
+        if self.sample_weight is not None and len(self.y_true) != len(self.sample_weight):
+            raise ValueError("y_true and sample_weight must have the same length.")
     
     def _get_unprivileged_group(self):
         """Identify unprivileged group."""
-        if self.protected_attr is None:
+        if not self._has_groups():
             return None
             
-        unique_vals = np.unique(self.protected_attr)
+        unique_vals, _ = self._group_table()
         unprivileged_groups = [val for val in unique_vals if val != self.privileged_group]
         
         if not unprivileged_groups:
@@ -119,6 +603,21 @@ class FairnessMetrics:
         # Return the first unprivileged group (can be extended for multiple groups)
         return unprivileged_groups[0]
     
+    def _group_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the cached per-group confusion table.
+
+        The table is built with a single pass over the arrays on first access;
+        every metric method reads its counts from here instead of rescanning.
+        """
+        if self._confusion is None:
+            if self.protected_attr is None:
+                raise ValueError("Protected attribute not provided.")
+            self._group_values, self._confusion = compute_group_confusion(
+                self.y_true, self.y_pred, self.protected_attr, self.positive_label, self.sample_weight
+            )
+        return self._group_values, self._confusion
+    
     def _safe_divide(self, numerator: float, denominator: float) -> float:
         """Safe division with zero handling."""
         if denominator == 0:
@@ -127,14 +626,13 @@ class FairnessMetrics:
     
     def _group_metrics(self, group_value: Union[int, str]) -> Dict[str, float]:
         """Compute basic metrics for a specific group."""
-        if self.protected_attr is None:
+        if not self._has_groups():
             raise ValueError("Protected attribute not provided.")
             
-        mask = self.protected_attr == group_value
-        y_true_group = self.y_true[mask]
-        y_pred_group = self.y_pred[mask]
+        group_values, confusion = self._group_table()
+        matches = np.flatnonzero(group_values == group_value)
         
-        if len(y_true_group) == 0:
+        if len(matches) == 0:
             return {
                 "positive_rate": 0.0,
                 "true_positive_rate": 0.0,
@@ -148,28 +646,9 @@ class FairnessMetrics:
                 "size": 0
             }
         
-        # Basic counts
-        tp = np.sum((y_pred_group == self.positive_label) & (y_true_group == self.positive_label))
-        fp = np.sum((y_pred_group == self.positive_label) & (y_true_group != self.positive_label))
-        fn = np.sum((y_pred_group != self.positive_label) & (y_true_group == self.positive_label))
-        tn = np.sum((y_pred_group != self.positive_label) & (y_true_group != self.positive_label))
-        
-        total = len(y_true_group)
-        positive_actual = np.sum(y_true_group == self.positive_label)
-        negative_actual = total - positive_actual
-        
-        return {
-            "positive_rate": self._safe_divide(tp + fp, total),  # P(Y_hat = 1)
-            "true_positive_rate": self._safe_divide(tp, positive_actual),  # Sensitivity/Recall
-            "false_positive_rate": self._safe_divide(fp, negative_actual),  # 1 - Specificity
-            "true_negative_rate": self._safe_divide(tn, negative_actual),  # Specificity
-            "false_negative_rate": self._safe_divide(fn, positive_actual),  # Miss rate
-            "precision": self._safe_divide(tp, tp + fp),  # Positive predictive value
-            "recall": self._safe_divide(tp, tp + fn),  # Same as TPR
-            "f1_score": self._safe_divide(2 * tp, 2 * tp + fp + fn),
-            "accuracy": self._safe_divide(tp + tn, total),
-            "size": total
-        }
+        rates = rates_from_confusion(confusion[matches[:1]])
+        return {name: (values[0].item() if name == "size" else float(values[0]))
+                for name, values in rates.items()}
     
     def demographic_parity(self) -> FairnessResult:
         """
@@ -296,46 +775,68 @@ class FairnessMetrics:
             interpretation=interpretation
         )
     
+    def _calibration_table(self) -> np.ndarray:
+        """Return cached per-group calibration bin statistics, aligned with _group_table()."""
+        if self._calibration_bins is None:
+            self._bin_edges = calibration_bin_edges(self.y_prob, self.n_bins, self.calibration_strategy)
+            _, self._calibration_bins = compute_calibration_bins(
+                self.y_true, self.y_prob, self.protected_attr, self.positive_label,
+                bin_edges=self._bin_edges, sample_weight=self.sample_weight
+            )
+        return self._calibration_bins
+    
+    def _reliability(self) -> Dict[str, np.ndarray]:
+        """Per-group reliability statistics from the cached calibration bins."""
+        _, confusion = self._group_table()
+        return reliability_from_bins(self._calibration_table(), confusion.sum(axis=1))
+    
+    def reliability_table(self) -> Optional[pd.DataFrame]:
+        """
+        Per-bin reliability table for every group.
+        
+        Returns:
+            DataFrame with one row per (group, bin) holding the bin bounds, row
+            count, mean predicted probability, observed positive rate and their
+            absolute gap; None if probabilities are unavailable
+        """
+        if self.y_prob is None and self._calibration_bins is None:
+            logger.warning("Reliability table requires probability predictions (y_prob)")
+            return None
+        
+        group_values, _ = self._group_table()
+        reliability = self._reliability()
+        k, n_bins = reliability["count"].shape
+        return pd.DataFrame({
+            "group": np.repeat(group_values, n_bins),
+            "bin": np.tile(np.arange(n_bins), k),
+            "lower": np.tile(self._bin_edges[:-1], k),
+            "upper": np.tile(self._bin_edges[1:], k),
+            "count": reliability["count"].ravel().astype(np.int64),
+            "mean_confidence": reliability["mean_confidence"].ravel(),
+            "observed_rate": reliability["observed_rate"].ravel(),
+            "gap": reliability["gap"].ravel(),
+        })
+    
     def calibration(self) -> Optional[FairnessResult]:
         """
         Compute Calibration fairness.
         Requires probability predictions (y_prob).
         """
-        if self.y_prob is None:
+        if self.y_prob is None and self._calibration_bins is None:
             logger.warning("Calibration requires probability predictions (y_prob)")
             return None
         
-        # Group data
-        priv_mask = self.protected_attr == self.privileged_group
-        unpriv_mask = self.protected_attr == self.unprivileged_group
+        # Expected/maximum calibration error for every group from one binning pass
+        group_values, _ = self._group_table()
+        reliability = self._reliability()
+        n_bins = reliability["count"].shape[1]
         
-        priv_probs = self.y_prob[priv_mask]
-        priv_actual = self.y_true[priv_mask]
-        unpriv_probs = self.y_prob[unpriv_mask]
-        unpriv_actual = self.y_true[unpriv_mask]
+        def group_error(group_value, key):
+            matches = np.flatnonzero(group_values == group_value)
+            return float(reliability[key][matches[0]]) if len(matches) else 0.0
         
-        # Compute calibration using binning
-        n_bins = 10
-        
-        def compute_calibration_error(probs, actual):
-            bin_boundaries = np.linspace(0, 1, n_bins + 1)
-            bin_lowers = bin_boundaries[:-1]
-            bin_uppers = bin_boundaries[1:]
-            
-            ece = 0
-            for bin_lower, bin_upper in zip(bin_lowers, bin_uppers):
-                in_bin = (probs > bin_lower) & (probs <= bin_upper)
-                prop_in_bin = in_bin.mean()
-                
-                if prop_in_bin > 0:
-                    accuracy_in_bin = actual[in_bin].mean()
-                    avg_confidence_in_bin = probs[in_bin].mean()
-                    ece += np.abs(avg_confidence_in_bin - accuracy_in_bin) * prop_in_bin
-            
-            return ece
-        
-        priv_cal_error = compute_calibration_error(priv_probs, priv_actual)
-        unpriv_cal_error = compute_calibration_error(unpriv_probs, unpriv_actual)
+        priv_cal_error = group_error(self.privileged_group, "expected_calibration_error")
+        unpriv_cal_error = group_error(self.unprivileged_group, "expected_calibration_error")
         
         difference = unpriv_cal_error - priv_cal_error
         
@@ -357,8 +858,12 @@ class FairnessMetrics:
             interpretation=interpretation,
             details={
                 "n_bins": n_bins,
+                "strategy": self.calibration_strategy,
+                "bin_edges": self._bin_edges.tolist(),
                 "privileged_calibration_error": priv_cal_error,
-                "unprivileged_calibration_error": unpriv_cal_error
+                "unprivileged_calibration_error": unpriv_cal_error,
+                "privileged_max_calibration_error": group_error(self.privileged_group, "max_calibration_error"),
+                "unprivileged_max_calibration_error": group_error(self.unprivileged_group, "max_calibration_error")
             }
         )
     
@@ -398,15 +903,188 @@ class FairnessMetrics:
         
         return performance_gaps
     
-    def evaluate(self):
+    def threshold_curves(self) -> ThresholdCurves:
+        """Per-group score curves of y_prob, sorted once and cached."""
+        if self._threshold_curves is None:
+            if self.y_prob is None or self.protected_attr is None:
+                raise ValueError("Threshold sweeps need y_prob and protected_attr.")
+            self._threshold_curves = ThresholdCurves.from_arrays(
+                self.y_true, self.y_prob, self.protected_attr, self.positive_label, self.sample_weight
+            )
+        return self._threshold_curves
+
+    def threshold_sweep(self, thresholds: Optional[Union[int, np.ndarray, List[float]]] = None) -> pd.DataFrame:
+        """
+        Fairness metrics of every group at every decision threshold on y_prob.
+
+        Args:
+            thresholds: Thresholds to evaluate; None for every distinct score,
+                an int for at most that many quantile-spaced scores
+
+        Returns:
+            DataFrame with one row per (threshold, group), see threshold_sweep_table()
+        """
+        return threshold_sweep_table(
+            self.threshold_curves(), self.privileged_group, thresholds,
+            self.fairness_threshold, self.justified_disparity
+        )
+
+    def compare_all_groups(self, pairwise: bool = False) -> pd.DataFrame:
+        """
+        Compare every group of the protected attribute in one pass.
+
+        Unlike the single-pair methods above, which only compare the privileged
+        group against the first unprivileged group, this evaluates all k groups
+        from the cached confusion table.
+
+        Args:
+            pairwise: If True, compare every ordered pair of groups instead of
+                each group against the privileged group
+
+        Returns:
+            DataFrame with one row per group (or per group pair) holding the
+            group rates, their difference/ratio to the reference group and
+            whether each fairness threshold is met
+        """
+        group_values, confusion = self._group_table()
+        k = len(group_values)
+
+        if pairwise:
+            group_idx, ref_idx = np.meshgrid(np.arange(k), np.arange(k), indexing='ij')
+            keep = group_idx != ref_idx
+            group_idx, ref_idx = group_idx[keep], ref_idx[keep]
+        else:
+            privileged = np.flatnonzero(group_values == self.privileged_group)
+            if len(privileged) == 0:
+                raise ValueError(f"Privileged group {self.privileged_group!r} not found in protected attribute.")
+            group_idx = np.arange(k)
+            ref_idx = np.full(k, privileged[0])
+
+        table = {
+            "group": group_values[group_idx],
+            "reference_group": group_values[ref_idx],
+        }
+        table.update(comparison_columns(
+            confusion, group_idx, ref_idx, self.fairness_threshold, self.justified_disparity
+        ))
+
+        return pd.DataFrame(table)
+    
+    def evaluate(self, **kwargs):
         """Alias for compute_all_metrics for user convenience."""
-        return self.compute_all_metrics()
+        return self.compute_all_metrics(**kwargs)
+    
+    def _group_counts(self, group_value: Union[int, str]) -> np.ndarray:
+        """Confusion counts of one group (zeros if the group is absent)."""
+        group_values, confusion = self._group_table()
+        matches = np.flatnonzero(group_values == group_value)
+        return confusion[matches[0]] if len(matches) else np.zeros(4, dtype=np.int64)
+    
+    def bootstrap_confusion(self, n_bootstrap: int = 1000, random_state: Optional[int] = None) -> np.ndarray:
+        """
+        Resample the privileged and unprivileged confusion counts.
+        
+        Each replicate redraws a group's n rows as one multinomial draw over
+        its TP/FP/FN/TN cells, which is equivalent to resampling the rows
+        within each group but never touches row-level data.
+        
+        Args:
+            n_bootstrap: Number of bootstrap replicates
+            random_state: Seed for reproducible replicates
+            
+        Returns:
+            Array of shape (n_bootstrap, 2, 4) for [privileged, unprivileged]
+        """
+        counts = np.stack([
+            self._group_counts(self.privileged_group),
+            self._group_counts(self.unprivileged_group)
+        ])
+        sizes = counts.sum(axis=1)
+        pvals = np.where(sizes[:, None] > 0, counts / np.maximum(sizes, 1)[:, None], 0.25)
+        rng = np.random.default_rng(random_state)
+        if not np.issubdtype(counts.dtype, np.floating):
+            return rng.multinomial(sizes, pvals, size=(n_bootstrap, 2))
+        # Weighted tables: redraw as many rows as the weight sum, then rescale to it
+        n_draws = np.maximum(np.rint(sizes), 1).astype(np.int64)
+        return rng.multinomial(n_draws, pvals, size=(n_bootstrap, 2)) * (sizes / n_draws)[:, None]
+    
+    def _attach_confidence_intervals(
+        self,
+        results: Dict[str, Union[FairnessResult, Dict[str, FairnessResult]]],
+        n_bootstrap: int,
+        confidence_level: float,
+        random_state: Optional[int],
+        replicate_confusion: Optional[np.ndarray] = None
+    ):
+        """Add bootstrap confidence intervals to each count-based result's details."""
+        if replicate_confusion is None:
+            replicates = self.bootstrap_confusion(n_bootstrap, random_state)
+        else:
+            group_values, _ = self._group_table()
+            replicate_confusion = np.asarray(replicate_confusion)
+            if replicate_confusion.ndim != 3 or replicate_confusion.shape[1:] != (len(group_values), 4):
+                raise ValueError(f"replicate_confusion must have shape (n_replicates, {len(group_values)}, 4).")
+            pair = [np.flatnonzero(group_values == g) for g in (self.privileged_group, self.unprivileged_group)]
+            if not all(len(matches) for matches in pair):
+                # E.g. a small sample without privileged rows: there is nothing to resample
+                logger.warning("⚠️ Privileged group has no rows in the replicate tables; skipping confidence intervals")
+                return
+            replicates = replicate_confusion[:, [matches[0] for matches in pair]]
+            n_bootstrap = len(replicates)
+        rates = rates_from_confusion(replicates)
+        tail = (1 - confidence_level) / 2 * 100
+        
+        def interval(values):
+            low, high = np.percentile(values, [tail, 100 - tail])
+            return [float(low), float(high)]
+        
+        targets = [(results[metric], metric, rate_name)
+                   for metric, rate_name in GROUP_FAIRNESS_METRICS.items() if metric in results]
+        targets += [(result, None, metric) for metric, result in results.get("performance_gaps", {}).items()]
+        
+        for result, metric, rate_name in targets:
+            priv, unpriv = rates[rate_name][:, 0], rates[rate_name][:, 1]
+            difference = unpriv - priv
+            ratio = _divide_counts(unpriv, priv)
+            if metric is None:
+                # Performance gaps use a fixed 10% threshold
+                met = self.justified_disparity | (np.abs(difference) <= 0.1)
+            else:
+                met = _threshold_met(metric, difference, ratio, self.fairness_threshold, self.justified_disparity)
+            result.details["confidence_interval"] = {
+                "n_bootstrap": n_bootstrap,
+                "confidence_level": confidence_level,
+                "privileged_value": interval(priv),
+                "unprivileged_value": interval(unpriv),
+                "difference": interval(difference),
+                "ratio": interval(ratio),
+                "threshold_met_rate": float(np.mean(met))
+            }
     
-    def compute_all_metrics(self) -> Dict[str, Union[FairnessResult, Dict[str, FairnessResult]]]:
-        """Compute all available fairness metrics."""
+    def compute_all_metrics(
+        self,
+        n_bootstrap: int = 0,
+        confidence_level: float = 0.95,
+        random_state: Optional[int] = None,
+        replicate_confusion: Optional[np.ndarray] = None
+    ) -> Dict[str, Union[FairnessResult, Dict[str, FairnessResult]]]:
+        """
+        Compute all available fairness metrics.
+        
+        Args:
+            n_bootstrap: If > 0, attach bootstrap confidence intervals computed
+                from n_bootstrap resampled confusion tables to the details of
+                every count-based result (calibration is not resampled)
+            confidence_level: Coverage of the percentile intervals
+            random_state: Seed for reproducible bootstrap replicates
+            replicate_confusion: Precomputed replicate tables of shape
+                (n_replicates, k, 4), aligned with the group table, used for
+                the intervals instead of resampling (e.g. a stratified
+                sample's bootstrap)
+        """
         results = {}
         
-        if self.protected_attr is None:
+        if not self._has_groups():
             logger.warning("No protected attribute provided. Cannot compute group fairness metrics.")
             return results
         
@@ -427,8 +1105,413 @@ class FairnessMetrics:
         # Performance gaps
         results["performance_gaps"] = self.overall_performance_gap()
         
+        if n_bootstrap > 0 or replicate_confusion is not None:
+            self._attach_confidence_intervals(results, n_bootstrap, confidence_level, random_state,
+                                              replicate_confusion)
+        
         return results
 
+def _to_builtin(value: Any) -> Any:
+    """Convert NumPy scalars to plain Python values for serialization."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _accumulate_shard(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    protected_attributes: Dict[str, np.ndarray],
+    y_prob: Optional[np.ndarray] = None,
+    bin_edges: Optional[np.ndarray] = None,
+    sample_weight: Optional[np.ndarray] = None
+) -> Dict[str, "FairnessAccumulator"]:
+    """Build one accumulator per protected attribute for a shard (process-pool worker)."""
+    return {
+        attr_name: FairnessAccumulator(bin_edges=bin_edges).update(y_true, y_pred, attr_values, y_prob,
+                                                                   sample_weight)
+        for attr_name, attr_values in protected_attributes.items()
+    }
+
+
+class FairnessAccumulator:
+    """
+    Incremental fairness metrics over chunked prediction logs.
+
+    Only per-group sufficient statistics (confusion counts and calibration
+    bin sums) are kept between chunks, so memory is bounded by the number of
+    groups rather than the number of rows. Accumulators are also mergeable
+    sketches: shards audited in separate processes or on separate machines
+    can be combined exactly with merge(), and to_dict()/from_dict() give a
+    JSON-serializable form for shipping them between nodes.
+
+    Example:
+        acc = FairnessAccumulator(privileged_group="M")
+        for chunk in pd.read_csv("predictions.csv", chunksize=1_000_000):
+            acc.update(chunk["label"], chunk["pred"], chunk["gender"], chunk["score"])
+        results = acc.finalize()
+
+    Equal-frequency calibration bins need the score distribution up front, so
+    pass bin_edges (e.g. calibration_bin_edges() over a sample) to use them.
+    """
+
+    def __init__(
+        self,
+        privileged_group: Union[int, str] = 1,
+        positive_label: Union[int, str] = 1,
+        fairness_threshold: float = 0.8,
+        justified_disparity: bool = False,
+        n_bins: int = CALIBRATION_BINS,
+        bin_edges: Optional[np.ndarray] = None
+    ):
+        self.privileged_group = privileged_group
+        self.positive_label = positive_label
+        self.fairness_threshold = fairness_threshold
+        self.justified_disparity = justified_disparity
+        self.bin_edges = np.asarray(bin_edges, dtype=float) if bin_edges is not None else np.linspace(0, 1, n_bins + 1)
+        self.n_bins = len(self.bin_edges) - 1
+        self.n_rows = 0
+        self._group_lookup: Dict[Any, int] = {}
+        self._confusion = np.zeros((0, 4), dtype=np.int64)
+        self._calibration_bins: Optional[np.ndarray] = None
+
+    def _group_indices(self, chunk_groups: Union[np.ndarray, List[Any]]) -> np.ndarray:
+        """Map chunk group values to accumulator rows, growing the tables for new groups."""
+        if isinstance(chunk_groups, np.ndarray):
+            chunk_groups = chunk_groups.tolist()
+        indices = np.empty(len(chunk_groups), dtype=np.int64)
+        for i, value in enumerate(chunk_groups):
+            if value not in self._group_lookup:
+                self._group_lookup[value] = len(self._group_lookup)
+            indices[i] = self._group_lookup[value]
+
+        n_new = len(self._group_lookup) - len(self._confusion)
+        if n_new > 0:
+            self._confusion = np.vstack([self._confusion, np.zeros((n_new, 4), dtype=self._confusion.dtype)])
+            if self._calibration_bins is not None:
+                self._calibration_bins = np.concatenate(
+                    [self._calibration_bins, np.zeros((n_new, self.n_bins, 3))]
+                )
+        return indices
+
+    def update(
+        self,
+        y_true_chunk: Union[np.ndarray, pd.Series],
+        y_pred_chunk: Union[np.ndarray, pd.Series],
+        protected_chunk: Union[np.ndarray, pd.Series],
+        y_prob_chunk: Optional[Union[np.ndarray, pd.Series]] = None,
+        sample_weight_chunk: Optional[Union[np.ndarray, pd.Series]] = None
+    ) -> "FairnessAccumulator":
+        """
+        Add one chunk of rows to the running statistics.
+
+        Args:
+            y_true_chunk: True labels
+            y_pred_chunk: Predicted labels
+            protected_chunk: Protected attribute values
+            y_prob_chunk: Predicted probabilities (optional, needed for calibration)
+            sample_weight_chunk: Row weights (optional); the confusion table
+                switches to weighted float sums from the first weighted chunk
+
+        Returns:
+            self, to allow chaining
+        """
+        y_true_chunk = np.asarray(y_true_chunk)
+        if not (len(y_true_chunk) == len(y_pred_chunk) == len(protected_chunk)):
+            raise ValueError("y_true, y_pred and protected chunks must have the same length.")
+        if y_prob_chunk is not None and len(y_prob_chunk) != len(y_true_chunk):
+            raise ValueError("y_true and y_prob chunks must have the same length.")
+        if self.n_rows and (y_prob_chunk is None) != (self._calibration_bins is None):
+            raise ValueError("y_prob must be provided for either all chunks or none.")
+
+        chunk_groups, chunk_confusion = compute_group_confusion(
+            y_true_chunk, y_pred_chunk, protected_chunk, self.positive_label, sample_weight_chunk
+        )
+        if sample_weight_chunk is not None:
+            self._confusion = self._confusion.astype(np.float64)
+        if y_prob_chunk is not None and self._calibration_bins is None:
+            self._calibration_bins = np.zeros((len(self._confusion), self.n_bins, 3))
+
+        rows = self._group_indices(chunk_groups)
+        self._confusion[rows] += chunk_confusion
+
+        if y_prob_chunk is not None:
+            _, chunk_bins = compute_calibration_bins(
+                y_true_chunk, y_prob_chunk, protected_chunk, self.positive_label,
+                bin_edges=self.bin_edges, sample_weight=sample_weight_chunk
+            )
+            self._calibration_bins[rows] += chunk_bins
+
+        self.n_rows += len(y_true_chunk)
+        return self
+
+    def merge(self, other: "FairnessAccumulator") -> "FairnessAccumulator":
+        """
+        Fold another accumulator's statistics into this one.
+
+        Merging is exact and associative, so shards can be combined in any
+        order.
+
+        Args:
+            other: Accumulator built with the same positive_label and bin edges
+
+        Returns:
+            self, to allow chaining
+        """
+        if other.positive_label != self.positive_label or not np.array_equal(other.bin_edges, self.bin_edges):
+            raise ValueError("Cannot merge accumulators with different positive_label or bin edges.")
+        if other.n_rows == 0:
+            return self
+        if self.n_rows and (other._calibration_bins is None) != (self._calibration_bins is None):
+            raise ValueError("Cannot merge accumulators where only one has calibration statistics.")
+
+        if other._calibration_bins is not None and self._calibration_bins is None:
+            self._calibration_bins = np.zeros((len(self._confusion), self.n_bins, 3))
+
+        rows = self._group_indices(list(other._group_lookup.keys()))
+        if np.issubdtype(other._confusion.dtype, np.floating):
+            self._confusion = self._confusion.astype(np.float64)
+        self._confusion[rows] += other._confusion
+        if other._calibration_bins is not None:
+            self._calibration_bins[rows] += other._calibration_bins
+        self.n_rows += other.n_rows
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the sketch to a JSON-serializable dictionary."""
+        return {
+            "privileged_group": _to_builtin(self.privileged_group),
+            "positive_label": _to_builtin(self.positive_label),
+            "fairness_threshold": self.fairness_threshold,
+            "justified_disparity": self.justified_disparity,
+            "bin_edges": self.bin_edges.tolist(),
+            "n_rows": self.n_rows,
+            "groups": list(self._group_lookup.keys()),
+            "confusion": self._confusion.tolist(),
+            "calibration_bins": self._calibration_bins.tolist() if self._calibration_bins is not None else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FairnessAccumulator":
+        """Rebuild a sketch from the output of to_dict()."""
+        acc = cls(
+            privileged_group=data["privileged_group"],
+            positive_label=data["positive_label"],
+            fairness_threshold=data["fairness_threshold"],
+            justified_disparity=data["justified_disparity"],
+            bin_edges=data["bin_edges"]
+        )
+        acc.n_rows = data["n_rows"]
+        acc._group_lookup = {value: i for i, value in enumerate(data["groups"])}
+        confusion = np.array(data["confusion"]).reshape(-1, 4)
+        acc._confusion = confusion if np.issubdtype(confusion.dtype, np.floating) else confusion.astype(np.int64)
+        if data["calibration_bins"] is not None:
+            acc._calibration_bins = np.array(data["calibration_bins"], dtype=float).reshape(-1, acc.n_bins, 3)
+        return acc
+
+    def group_statistics(self) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """
+        Return the accumulated statistics ordered by sorted group value.
+
+        Returns:
+            Tuple of (group values, confusion table, calibration bins or None)
+        """
+        values = list(self._group_lookup.keys())
+        order = np.argsort(np.array(values), kind='stable')
+        group_values = np.array(values)[order]
+        calibration_bins = self._calibration_bins[order] if self._calibration_bins is not None else None
+        return group_values, self._confusion[order], calibration_bins
+
+    def to_metrics(self) -> FairnessMetrics:
+        """Build a FairnessMetrics calculator from the accumulated statistics."""
+        if not self._group_lookup:
+            raise ValueError("No data has been accumulated; call update() first.")
+        group_values, confusion, calibration_bins = self.group_statistics()
+        return FairnessMetrics.from_group_statistics(
+            group_values,
+            confusion,
+            calibration_bins=calibration_bins,
+            privileged_group=self.privileged_group,
+            positive_label=self.positive_label,
+            fairness_threshold=self.fairness_threshold,
+            justified_disparity=self.justified_disparity,
+            bin_edges=self.bin_edges
+        )
+
+    def finalize(self) -> Dict[str, Union[FairnessResult, Dict[str, FairnessResult]]]:
+        """Compute all fairness metrics, matching FairnessMetrics.compute_all_metrics()."""
+        return self.to_metrics().compute_all_metrics()
+
+
+class FairnessCube:
+    """
+    Confusion counts for every cell of a protected-attribute cross-product.
+
+    The cube is built with one hashed group-by over the rows; marginal and
+    lower-order intersections are rolled up from the cube, so the row-level
+    data is never rescanned.
+    """
+
+    def __init__(
+        self,
+        attribute_names: List[str],
+        levels: List[np.ndarray],
+        cell_codes: np.ndarray,
+        confusion: np.ndarray
+    ):
+        self.attribute_names = list(attribute_names)
+        self.levels = levels
+        self.cell_codes = cell_codes
+        self.confusion = confusion
+
+    @classmethod
+    def from_arrays(
+        cls,
+        y_true: Union[np.ndarray, pd.Series],
+        y_pred: Union[np.ndarray, pd.Series],
+        protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
+        positive_label: Union[int, str] = 1
+    ) -> "FairnessCube":
+        """
+        Build the cube from row-level arrays.
+
+        Args:
+            y_true: True labels
+            y_pred: Predicted labels
+            protected_attributes: Dict of {attr_name: attr_values}
+            positive_label: Label treated as the positive outcome
+
+        Returns:
+            FairnessCube holding only the observed cells
+        """
+        if not protected_attributes:
+            raise ValueError("At least one protected attribute is required.")
+
+        names = list(protected_attributes.keys())
+        levels = []
+        key = np.zeros(len(y_true), dtype=np.int64)
+        valid = np.ones(len(y_true), dtype=bool)
+        n_cells = 1
+        for name in names:
+            codes, uniques = pd.factorize(np.asarray(protected_attributes[name]), sort=True)
+            if len(codes) != len(y_true):
+                raise ValueError(f"y_true and protected attribute '{name}' must have the same length.")
+            n_cells *= max(len(uniques), 1)
+            if n_cells > np.iinfo(np.int64).max:
+                raise ValueError("Too many attribute combinations to encode the cube key.")
+            valid &= codes >= 0
+            key = key * len(uniques) + np.maximum(codes, 0)
+            levels.append(np.asarray(uniques))
+
+        if not valid.all():
+            logger.warning(f"Dropping {int((~valid).sum())} rows with missing protected attribute values from the cube")
+
+        # Hashed group-by on the combined cell key
+        cell_index, cell_keys = pd.factorize(key[valid])
+        cell_keys = np.asarray(cell_keys, dtype=np.int64)
+        pred_negative = np.asarray(y_pred)[valid] != positive_label
+        true_negative = np.asarray(y_true)[valid] != positive_label
+        cell = cell_index * 4 + pred_negative * 2 + true_negative
+        confusion = np.bincount(cell, minlength=len(cell_keys) * 4).reshape(len(cell_keys), 4)
+
+        # Decode the mixed-radix key back into per-attribute codes
+        cell_codes = np.empty((len(cell_keys), len(names)), dtype=np.int64)
+        remainder = cell_keys
+        for dim in range(len(names) - 1, -1, -1):
+            cell_codes[:, dim] = remainder % len(levels[dim])
+            remainder = remainder // len(levels[dim])
+
+        return cls(names, levels, cell_codes, confusion.astype(np.int64))
+
+    def rollup(self, attributes: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Aggregate the cube onto a subset of its attributes.
+
+        Args:
+            attributes: Attribute names to keep
+
+        Returns:
+            Tuple of (per-attribute codes of shape (m, len(attributes)),
+            confusion table of shape (m, 4))
+        """
+        dims = [self.attribute_names.index(attr) for attr in attributes]
+        codes, inverse = np.unique(self.cell_codes[:, dims], axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        confusion = np.column_stack([
+            np.bincount(inverse, weights=self.confusion[:, i], minlength=len(codes))
+            for i in range(4)
+        ]).astype(np.int64)
+        return codes, confusion
+
+    def to_frame(self, attributes: Optional[List[str]] = None, min_support: int = 0) -> pd.DataFrame:
+        """
+        Return the (rolled-up) confusion counts as a DataFrame.
+
+        Args:
+            attributes: Attribute names to keep (all cube attributes if None)
+            min_support: Drop cells with fewer rows than this
+
+        Returns:
+            DataFrame with one column per attribute followed by tp/fp/fn/tn
+        """
+        attributes = attributes or self.attribute_names
+        codes, confusion = self.rollup(attributes)
+        keep = confusion.sum(axis=1) >= min_support
+        frame = self._label_columns(attributes, codes[keep])
+        for i, column in enumerate(CONFUSION_COLUMNS):
+            frame[column] = confusion[keep, i]
+        return pd.DataFrame(frame)
+
+    def _label_columns(self, attributes: List[str], codes: np.ndarray) -> Dict[str, np.ndarray]:
+        """Map per-attribute codes back to the original attribute values."""
+        return {
+            attr: self.levels[self.attribute_names.index(attr)][codes[:, i]]
+            for i, attr in enumerate(attributes)
+        }
+
+    def compare_cells(
+        self,
+        attributes: Optional[List[str]] = None,
+        reference: Optional[Dict[str, Union[int, str]]] = None,
+        min_support: int = 30,
+        fairness_threshold: float = 0.8,
+        justified_disparity: bool = False
+    ) -> pd.DataFrame:
+        """
+        Compare every supported cell of an intersection against a reference cell.
+
+        Args:
+            attributes: Attribute names defining the intersection (all if None)
+            reference: Dict of {attr_name: value} identifying the reference cell;
+                defaults to the largest cell
+            min_support: Cells with fewer rows are pruned from the output
+            fairness_threshold: Fairness threshold (80% rule by default)
+            justified_disparity: Whether disparities are business-justified
+
+        Returns:
+            DataFrame with one row per supported cell
+        """
+        attributes = attributes or self.attribute_names
+        codes, confusion = self.rollup(attributes)
+        sizes = confusion.sum(axis=1)
+
+        if reference is not None and all(attr in reference for attr in attributes):
+            labels = self._label_columns(attributes, codes)
+            match = np.ones(len(codes), dtype=bool)
+            for attr in attributes:
+                match &= labels[attr] == reference[attr]
+            if not match.any():
+                raise ValueError(f"Reference cell {reference!r} not found in the cube.")
+            ref_row = int(np.flatnonzero(match)[0])
+        else:
+            ref_row = int(np.argmax(sizes))
+
+        keep = np.flatnonzero(sizes >= min_support)
+        table = self._label_columns(attributes, codes[keep])
+        table["is_reference"] = keep == ref_row
+        table.update(comparison_columns(
+            confusion, keep, np.full(len(keep), ref_row), fairness_threshold, justified_disparity
+        ))
+        return pd.DataFrame(table)
+
 
 class FairnessEngine:
     """
@@ -439,11 +1522,15 @@ class FairnessEngine:
         self,
         justified_attributes: Optional[List[str]] = None,
         fairness_threshold: float = 0.8,
-        output_dir: str = "/tmp/fairsight_fairness"
+        output_dir: str = "/tmp/fairsight_fairness",
+        calibration_bins: int = CALIBRATION_BINS,
+        calibration_strategy: str = "uniform"
     ):
         self.justified_attributes = justified_attributes or []
         self.fairness_threshold = fairness_threshold
         self.output_dir = output_dir
+        self.calibration_bins = calibration_bins
+        self.calibration_strategy = calibration_strategy
         self._ensure_output_dir()
     
     def _ensure_output_dir(self):
@@ -457,7 +1544,10 @@ class FairnessEngine:
         y_pred: Union[np.ndarray, pd.Series],
         protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
         y_prob: Optional[Union[np.ndarray, pd.Series]] = None,
-        privileged_groups: Optional[Dict[str, Union[int, str]]] = None
+        privileged_groups: Optional[Dict[str, Union[int, str]]] = None,
+        n_jobs: int = 1,
+        n_bootstrap: int = 0,
+        sample_weight: Optional[Union[np.ndarray, pd.Series]] = None
     ) -> Dict[str, Dict[str, Union[FairnessResult, Dict[str, FairnessResult]]]]:
         """
         Comprehensive fairness analysis across multiple protected attributes.
@@ -468,10 +1558,24 @@ class FairnessEngine:
             protected_attributes: Dict of {attr_name: attr_values}
             y_prob: Predicted probabilities (optional)
             privileged_groups: Dict of {attr_name: privileged_value} (optional)
+            n_jobs: Number of worker processes; values above 1 (or -1 for all
+                cores) shard the rows and merge per-shard sketches
+            n_bootstrap: Number of bootstrap replicates for confidence
+                intervals (0 disables them)
+            sample_weight: Row weights (e.g. survey or Reweighing weights);
+                every rate becomes a weighted rate
             
         Returns:
             Nested dict of fairness results
         """
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs > 1:
+            return self._analyze_fairness_sharded(
+                y_true, y_pred, protected_attributes, y_prob, privileged_groups, n_jobs, n_bootstrap,
+                sample_weight
+            )
+        
         results = {}
         
         for attr_name, attr_values in protected_attributes.items():
@@ -481,13 +1585,7 @@ class FairnessEngine:
             is_justified = attr_name in self.justified_attributes
             
             # Determine privileged group
-            if privileged_groups and attr_name in privileged_groups:
-                privileged_group = privileged_groups[attr_name]
-            else:
-                # Default: assume the most frequent class is privileged
-                unique_vals, counts = np.unique(attr_values, return_counts=True)
-                privileged_group = unique_vals[np.argmax(counts)]
-                logger.info(f"Auto-detected privileged group for {attr_name}: {privileged_group}")
+            privileged_group = self._resolve_privileged_group(attr_name, attr_values, privileged_groups)
             
             # Create fairness calculator
             fairness_calc = FairnessMetrics(
@@ -497,15 +1595,447 @@ class FairnessEngine:
                 protected_attr=attr_values,
                 privileged_group=privileged_group,
                 fairness_threshold=self.fairness_threshold,
-                justified_disparity=is_justified
+                justified_disparity=is_justified,
+                n_bins=self.calibration_bins,
+                calibration_strategy=self.calibration_strategy,
+                sample_weight=sample_weight
             )
             
             # Compute all metrics
-            attr_results = fairness_calc.compute_all_metrics()
+            attr_results = fairness_calc.compute_all_metrics(n_bootstrap=n_bootstrap)
             results[attr_name] = attr_results
         
         return results
     
+    def _analyze_fairness_sharded(
+        self,
+        y_true: Union[np.ndarray, pd.Series],
+        y_pred: Union[np.ndarray, pd.Series],
+        protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
+        y_prob: Optional[Union[np.ndarray, pd.Series]],
+        privileged_groups: Optional[Dict[str, Union[int, str]]],
+        n_jobs: int,
+        n_bootstrap: int = 0,
+        sample_weight: Optional[Union[np.ndarray, pd.Series]] = None
+    ) -> Dict[str, Dict[str, Union[FairnessResult, Dict[str, FairnessResult]]]]:
+        """Run analyze_fairness() over row shards in a process pool and merge the sketches."""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        y_prob = np.asarray(y_prob) if y_prob is not None else None
+        sample_weight = np.asarray(sample_weight, dtype=float) if sample_weight is not None else None
+        protected_attributes = {name: np.asarray(values) for name, values in protected_attributes.items()}
+        # Shards must share bin edges for their calibration sums to merge
+        bin_edges = (
+            calibration_bin_edges(y_prob, self.calibration_bins, self.calibration_strategy)
+            if y_prob is not None else None
+        )
+        
+        bounds = np.linspace(0, len(y_true), n_jobs + 1).astype(int)
+        shards = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        logger.info(f"Analyzing fairness over {len(shards)} shards")
+        
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(
+                    _accumulate_shard,
+                    y_true[shard],
+                    y_pred[shard],
+                    {name: values[shard] for name, values in protected_attributes.items()},
+                    y_prob[shard] if y_prob is not None else None,
+                    bin_edges,
+                    sample_weight[shard] if sample_weight is not None else None
+                )
+                for shard in shards
+            ]
+            shard_sketches = [future.result() for future in futures]
+        
+        results = {}
+        for attr_name in protected_attributes:
+            sketch = shard_sketches[0][attr_name]
+            for other in shard_sketches[1:]:
+                sketch.merge(other[attr_name])
+            
+            group_values, confusion, calibration_bins = sketch.group_statistics()
+            if privileged_groups and attr_name in privileged_groups:
+                privileged_group = privileged_groups[attr_name]
+            else:
+                # Most frequent group, read from the merged counts
+                privileged_group = group_values[np.argmax(confusion.sum(axis=1))]
+                logger.info(f"Auto-detected privileged group for {attr_name}: {privileged_group}")
+            
+            fairness_calc = FairnessMetrics.from_group_statistics(
+                group_values,
+                confusion,
+                calibration_bins=calibration_bins,
+                privileged_group=privileged_group,
+                fairness_threshold=self.fairness_threshold,
+                justified_disparity=attr_name in self.justified_attributes,
+                bin_edges=sketch.bin_edges
+            )
+            results[attr_name] = fairness_calc.compute_all_metrics(n_bootstrap=n_bootstrap)
+        
+        return results
+    
+    def _resolve_privileged_group(
+        self,
+        attr_name: str,
+        attr_values: Union[np.ndarray, pd.Series],
+        privileged_groups: Optional[Dict[str, Union[int, str]]] = None
+    ) -> Union[int, str]:
+        """Return the configured privileged group or the most frequent value."""
+        if privileged_groups and attr_name in privileged_groups:
+            return privileged_groups[attr_name]
+        
+        # Default: assume the most frequent class is privileged
+        unique_vals, counts = np.unique(attr_values, return_counts=True)
+        privileged_group = unique_vals[np.argmax(counts)]
+        logger.info(f"Auto-detected privileged group for {attr_name}: {privileged_group}")
+        return privileged_group
+    
+    def analyze_groups(
+        self,
+        y_true: Union[np.ndarray, pd.Series],
+        y_pred: Union[np.ndarray, pd.Series],
+        protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
+        privileged_groups: Optional[Dict[str, Union[int, str]]] = None,
+        pairwise: bool = False,
+        sample_weight: Optional[Union[np.ndarray, pd.Series]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Multi-group fairness analysis for attributes with more than two values.
+        
+        Args:
+            y_true: True labels
+            y_pred: Predicted labels
+            protected_attributes: Dict of {attr_name: attr_values}
+            privileged_groups: Dict of {attr_name: privileged_value} (optional)
+            pairwise: Compare every pair of groups instead of each group
+                against the privileged group
+            sample_weight: Row weights for weighted rates (optional)
+            
+        Returns:
+            Dict of {attr_name: per-group table from FairnessMetrics.compare_all_groups()}
+        """
+        results = {}
+        
+        for attr_name, attr_values in protected_attributes.items():
+            logger.info(f"Analyzing all groups for attribute: {attr_name}")
+            
+            fairness_calc = FairnessMetrics(
+                y_true=y_true,
+                y_pred=y_pred,
+                protected_attr=attr_values,
+                privileged_group=self._resolve_privileged_group(attr_name, attr_values, privileged_groups),
+                fairness_threshold=self.fairness_threshold,
+                justified_disparity=attr_name in self.justified_attributes,
+                sample_weight=sample_weight
+            )
+            results[attr_name] = fairness_calc.compare_all_groups(pairwise=pairwise)
+
+        return results
+
+    def threshold_sweep(
+        self,
+        y_true: Union[np.ndarray, pd.Series],
+        y_prob: Union[np.ndarray, pd.Series],
+        protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
+        privileged_groups: Optional[Dict[str, Union[int, str]]] = None,
+        thresholds: Optional[Union[int, np.ndarray, List[float]]] = None,
+        sample_weight: Optional[Union[np.ndarray, pd.Series]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fairness curves over the decision threshold for each protected attribute.
+
+        Scores are sorted once per group; every threshold is then evaluated
+        from cumulative label counts, in O(n log n) overall.
+
+        Args:
+            y_true: True labels
+            y_prob: Predicted probabilities of the positive label
+            protected_attributes: Dict of {attr_name: attr_values}
+            privileged_groups: Dict of {attr_name: privileged_value} (optional)
+            thresholds: Thresholds to evaluate; None for every distinct score,
+                an int for at most that many quantile-spaced scores
+            sample_weight: Row weights for weighted rates (optional)
+
+        Returns:
+            Dict of {attr_name: per-(threshold, group) table from threshold_sweep_table()}
+        """
+        results = {}
+        for attr_name, attr_values in protected_attributes.items():
+            logger.info(f"Sweeping decision thresholds for attribute: {attr_name}")
+            results[attr_name] = threshold_sweep_table(
+                ThresholdCurves.from_arrays(y_true, y_prob, attr_values, sample_weight=sample_weight),
+                self._resolve_privileged_group(attr_name, attr_values, privileged_groups),
+                thresholds,
+                self.fairness_threshold,
+                attr_name in self.justified_attributes
+            )
+        return results
+
+    def optimize_thresholds(
+        self,
+        y_true: Union[np.ndarray, pd.Series],
+        y_prob: Union[np.ndarray, pd.Series],
+        protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
+        privileged_groups: Optional[Dict[str, Union[int, str]]] = None,
+        constraint: str = "demographic_parity",
+        utility: Optional[Dict[str, float]] = None,
+        base_threshold: float = 0.5,
+        max_thresholds: int = 512,
+        sample_weight: Optional[Union[np.ndarray, pd.Series]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Post-processing mitigation with group-specific decision thresholds.
+
+        Args:
+            y_true: True labels
+            y_prob: Predicted probabilities of the positive label
+            protected_attributes: Dict of {attr_name: attr_values}
+            privileged_groups: Dict of {attr_name: privileged_value} (optional)
+            constraint: "demographic_parity" or "equalized_odds"
+            utility: Gain of each confusion cell (accuracy if None), see GroupThresholdOptimizer
+            base_threshold: Shared threshold the "before" results are computed at
+            max_thresholds: Candidate thresholds per group
+            sample_weight: Row weights; rates and utility are then weighted (optional)
+
+        Returns:
+            Dict of {attr_name: {'thresholds', 'constraint_satisfied', 'before',
+            'after', 'optimizer'}}, where 'before' and 'after' hold
+            compute_all_metrics() output at the shared and the group thresholds
+        """
+        from .threshold_optimizer import GroupThresholdOptimizer
+
+        results = {}
+        for attr_name, attr_values in protected_attributes.items():
+            logger.info(f"Optimizing group thresholds for attribute: {attr_name}")
+            privileged_group = self._resolve_privileged_group(attr_name, attr_values, privileged_groups)
+            justified = attr_name in self.justified_attributes
+            curves = ThresholdCurves.from_arrays(y_true, y_prob, attr_values, sample_weight=sample_weight)
+
+            before = FairnessMetrics.from_group_statistics(
+                curves.group_values, curves.confusion(np.array([base_threshold]))[0],
+                privileged_group=privileged_group, fairness_threshold=self.fairness_threshold,
+                justified_disparity=justified
+            )
+            optimizer = GroupThresholdOptimizer(
+                constraint=constraint, utility=utility,
+                fairness_threshold=self.fairness_threshold, max_thresholds=max_thresholds
+            ).fit_curves(curves, privileged_group)
+            after = FairnessMetrics.from_group_statistics(
+                curves.group_values, optimizer.confusion_, privileged_group=privileged_group,
+                fairness_threshold=self.fairness_threshold, justified_disparity=justified
+            )
+
+            results[attr_name] = {
+                'thresholds': optimizer.thresholds_,
+                'constraint_satisfied': optimizer.constraint_satisfied_,
+                'before': before.compute_all_metrics(),
+                'after': after.compute_all_metrics(),
+                'optimizer': optimizer
+            }
+        return results
+
+    def simulate_mitigations(
+        self,
+        y_true: Union[np.ndarray, pd.Series],
+        y_prob: Union[np.ndarray, pd.Series],
+        protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
+        privileged_groups: Optional[Dict[str, Union[int, str]]] = None,
+        n_thresholds: int = 16,
+        reweighing_strengths: Union[int, np.ndarray] = 11,
+        fairness_metric: str = "equalized_odds_difference",
+        base_threshold: float = 0.5,
+        sample_weight: Optional[Union[np.ndarray, pd.Series]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        What-if comparison of group thresholds and reweighing before retraining.
+
+        Group statistics are computed once per attribute; every candidate is
+        then evaluated from them in one batched NumPy pass.
+
+        Args:
+            y_true: True labels
+            y_prob: Predicted probabilities of the positive label
+            protected_attributes: Dict of {attr_name: attr_values}
+            privileged_groups: Dict of {attr_name: privileged_value} (optional)
+            n_thresholds: Thresholds per axis of the (privileged, unprivileged) grid
+            reweighing_strengths: Blend factors towards the Reweighing weights,
+                or their number
+            fairness_metric: Metric the Pareto frontier trades against accuracy,
+                see MitigationSimulator.pareto_frontier()
+            base_threshold: Shared decision threshold of the unmitigated model
+            sample_weight: Row weights (optional)
+
+        Returns:
+            Dict of {attr_name: {'candidates', 'frontier', 'simulator'}}, where
+            'candidates' is MitigationSimulator.evaluate() output and 'frontier'
+            its Pareto-optimal rows
+        """
+        from .mitigation_simulator import MitigationSimulator
+
+        results = {}
+        for attr_name, attr_values in protected_attributes.items():
+            logger.info(f"Simulating mitigations for attribute: {attr_name}")
+            simulator = MitigationSimulator.from_arrays(
+                y_true, y_prob, attr_values,
+                self._resolve_privileged_group(attr_name, attr_values, privileged_groups),
+                base_threshold=base_threshold, sample_weight=sample_weight
+            )
+            candidates = simulator.evaluate(
+                thresholds=simulator.threshold_candidates(n_thresholds),
+                weights=simulator.reweighing_candidates(reweighing_strengths)
+            )
+            results[attr_name] = {
+                'candidates': candidates,
+                'frontier': simulator.pareto_frontier(candidates, fairness_metric),
+                'simulator': simulator
+            }
+        return results
+
+    def analyze_intersectional(
+        self,
+        y_true: Union[np.ndarray, pd.Series],
+        y_pred: Union[np.ndarray, pd.Series],
+        protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
+        privileged_groups: Optional[Dict[str, Union[int, str]]] = None,
+        min_support: int = 30,
+        max_order: Optional[int] = None
+    ) -> Dict[Tuple[str, ...], pd.DataFrame]:
+        """
+        Intersectional fairness analysis (e.g. gender × race × age_band).
+        
+        Confusion counts are computed once for the full cross-product of the
+        protected attributes; every lower-order intersection and marginal is
+        rolled up from that cube.
+        
+        Args:
+            y_true: True labels
+            y_pred: Predicted labels
+            protected_attributes: Dict of {attr_name: attr_values}
+            privileged_groups: Dict of {attr_name: privileged_value} used as the
+                reference cell (optional; largest cell otherwise)
+            min_support: Minimum number of rows for a cell to be reported
+            max_order: Largest number of attributes to intersect (all if None)
+            
+        Returns:
+            Dict of {attribute combination: per-cell comparison table}
+        """
+        from itertools import combinations
+        
+        cube = FairnessCube.from_arrays(y_true, y_pred, protected_attributes)
+        names = cube.attribute_names
+        max_order = min(max_order or len(names), len(names))
+        
+        results = {}
+        for order in range(1, max_order + 1):
+            for combo in combinations(names, order):
+                logger.info(f"Analyzing intersection: {' × '.join(combo)}")
+                results[combo] = cube.compare_cells(
+                    attributes=list(combo),
+                    reference=privileged_groups,
+                    min_support=min_support,
+                    fairness_threshold=self.fairness_threshold,
+                    justified_disparity=any(attr in self.justified_attributes for attr in combo)
+                )
+
+        return results
+
+    def analyze_over_time(
+        self,
+        y_true: Union[np.ndarray, pd.Series],
+        y_pred: Union[np.ndarray, pd.Series],
+        timestamps: Union[np.ndarray, pd.Series],
+        protected_attributes: Dict[str, Union[np.ndarray, pd.Series]],
+        freq: str = "D",
+        privileged_groups: Optional[Dict[str, Union[int, str]]] = None,
+        min_support: int = 0
+    ) -> pd.DataFrame:
+        """
+        Fairness metrics per time bucket (e.g. per day, week or month).
+
+        Timestamps are mapped to period ordinals and become one more dimension
+        of a (time bucket × attribute) FairnessCube per attribute, so every
+        cell is counted in one pass over the rows and a row missing one
+        attribute still counts for the others. Each bucket's groups are
+        compared against the privileged group of the same bucket.
+
+        Args:
+            y_true: True labels
+            y_pred: Predicted labels
+            timestamps: Datetime-like value of each row (missing rows are dropped)
+            protected_attributes: Dict of {attr_name: attr_values}
+            freq: Bucket size as a pandas period alias ('D', 'W', 'M', 'Q', 'h', ...)
+            privileged_groups: Dict of {attr_name: privileged_value}; defaults
+                to each attribute's most frequent value over the whole period
+            min_support: Drop cells with fewer rows than this
+
+        Returns:
+            Tidy DataFrame with one row per (time_bucket, attribute, group),
+            time_bucket holding the bucket start. Differences and ratios are
+            NaN in buckets without privileged rows.
+        """
+        periods = pd.DatetimeIndex(pd.to_datetime(np.asarray(timestamps))).to_period(freq)
+        # Float ordinals so missing timestamps factorize as missing
+        ordinals = np.where(periods.isna(), np.nan, periods.asi8.astype(np.float64))
+
+        tables = []
+        for attr_name, attr_values in protected_attributes.items():
+            logger.info(f"Analyzing fairness over time for attribute: {attr_name}")
+            cube = FairnessCube.from_arrays(y_true, y_pred, {"time_bucket": ordinals, attr_name: attr_values})
+            codes, confusion = cube.cell_codes, cube.confusion
+            # Period(ordinal=...) rather than PeriodIndex.from_ordinals, which needs pandas >= 2.2
+            bucket_starts = pd.DatetimeIndex([pd.Period(ordinal=int(ordinal), freq=freq).start_time
+                                              for ordinal in cube.levels[0]])
+            levels = cube.levels[1]
+            if privileged_groups and attr_name in privileged_groups:
+                privileged_group = privileged_groups[attr_name]
+            else:
+                group_sizes = np.bincount(codes[:, 1], weights=confusion.sum(axis=1), minlength=len(levels))
+                privileged_group = levels[np.argmax(group_sizes)]
+                logger.info(f"Auto-detected privileged group for {attr_name}: {privileged_group}")
+
+            # Reference row of every bucket (-1 when the privileged group is absent)
+            is_privileged = levels[codes[:, 1]] == privileged_group
+            reference = np.full(len(bucket_starts), -1)
+            reference[codes[is_privileged, 0]] = np.flatnonzero(is_privileged)
+            ref_idx = reference[codes[:, 0]]
+
+            rows = np.arange(len(codes))
+            table = {
+                "time_bucket": bucket_starts[codes[:, 0]],
+                "attribute": np.full(len(codes), attr_name, dtype=object),
+                "group": levels[codes[:, 1]],
+                "is_privileged": is_privileged,
+            }
+            columns = comparison_columns(
+                confusion, rows, np.where(ref_idx >= 0, ref_idx, rows), self.fairness_threshold,
+                attr_name in self.justified_attributes
+            )
+            missing = ref_idx < 0
+            for metric in GROUP_FAIRNESS_METRICS:
+                columns[f"{metric}_difference"] = np.where(missing, np.nan, columns[f"{metric}_difference"])
+                columns[f"{metric}_ratio"] = np.where(missing, np.nan, columns[f"{metric}_ratio"])
+                columns[f"{metric}_threshold_met"] = columns[f"{metric}_threshold_met"] & ~missing
+            table.update(columns)
+            tables.append(pd.DataFrame(table)[confusion.sum(axis=1) >= min_support])
+
+        if not tables:
+            # Same tidy schema, without rows
+            empty = np.zeros(0, dtype=np.int64)
+            return pd.DataFrame({
+                "time_bucket": pd.DatetimeIndex([]),
+                "attribute": np.zeros(0, dtype=object),
+                "group": np.zeros(0, dtype=object),
+                "is_privileged": np.zeros(0, dtype=bool),
+                **comparison_columns(np.zeros((0, 4), dtype=np.int64), empty, empty)
+            })
+        return pd.concat(tables, ignore_index=True).sort_values(
+            ["time_bucket", "attribute"], kind="stable", ignore_index=True
+        )
+
     def create_fairness_dashboard(
         self,
         fairness_results: Dict[str, Dict[str, Union[FairnessResult, Dict[str, FairnessResult]]]],
@@ -521,6 +2051,8 @@ class FairnessEngine:
         Returns:
             Path to saved dashboard image
         """
+        import matplotlib.pyplot as plt
+
         n_attrs = len(fairness_results)
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle(title, fontsize=16, fontweight='bold')
@@ -2,28 +2,47 @@ import os
 import glob
 import json
 from typing import List, Dict, Any, Optional
-from PIL import Image
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from ..auth import require_premium_access, TieredAccessError
 
-try:
-    import torch
-except ImportError:
-    torch = None
-try:
-    import open_clip
-except ImportError:
-    open_clip = None
-try:
-    from diffusers import StableDiffusionPipeline
-except ImportError:
-    StableDiffusionPipeline = None
-try:
-    import imagehash
-except ImportError:
-    imagehash = None
+# The imaging and deep-learning backends take seconds to import, so they are
+# only loaded once a detector is actually constructed.
+Image = None
+torch = None
+open_clip = None
+StableDiffusionPipeline = None
+imagehash = None
+_backends_loaded = False
+
+
+def _load_backends() -> None:
+    """Import the optional image backends, leaving missing ones as None."""
+    global Image, torch, open_clip, StableDiffusionPipeline, imagehash, _backends_loaded
+    if _backends_loaded:
+        return
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+    try:
+        import torch
+    except ImportError:
+        torch = None
+    try:
+        import open_clip
+    except ImportError:
+        open_clip = None
+    try:
+        from diffusers import StableDiffusionPipeline
+    except ImportError:
+        StableDiffusionPipeline = None
+    try:
+        import imagehash
+    except ImportError:
+        imagehash = None
+    _backends_loaded = True
 
 class IllegalDataDetector:
     def __init__(self, pipeline, reference_folder: str, device: str = "cuda", phash_threshold: int = 8, 
@@ -34,8 +53,9 @@ class IllegalDataDetector:
         except TieredAccessError as e:
             raise e
         
-        if torch is None or open_clip is None or imagehash is None:
-            raise ImportError("Required libraries 'torch', 'open_clip_torch', and 'imagehash' must be installed.")
+        _load_backends()
+        if torch is None or open_clip is None or imagehash is None or Image is None:
+            raise ImportError("Required libraries 'torch', 'open_clip_torch', 'imagehash' and 'Pillow' must be installed.")
         self.pipeline = pipeline
         self.reference_folder = reference_folder
         self.device = device
@@ -58,7 +78,7 @@ class IllegalDataDetector:
             raise ValueError(f"No reference images found in {folder}")
         return files
 
-    def _compute_reference_embeddings(self) -> Dict[str, torch.Tensor]:
+    def _compute_reference_embeddings(self) -> Dict[str, "torch.Tensor"]:
         embeddings = {}
         for img_path in self.reference_images:
             img = Image.open(img_path).convert("RGB")
@@ -0,0 +1,303 @@
+"""
+Fairsight Toolkit - Mitigation Simulator
+========================================
+
+What-if estimates of bias mitigations before any model is retrained.
+
+The simulator starts from group statistics that are computed once: the
+ThresholdCurves of one protected attribute, i.e. each group's sorted scores
+with cumulative label counts. A candidate mitigation is then just numbers
+applied to those tables:
+
+- group thresholds: one decision threshold per group, read off the curves
+- cell weights: one weight per (group, label) cell, as produced by
+  Reweighing; confusion cells are rescaled by the weight of their label
+
+Hundreds of candidates are evaluated as one (candidates × groups × 4)
+confusion array, without touching the rows again. Weight candidates hold
+each group's TPR and FPR fixed and change the label mix, so they estimate
+how the current predictions score on the reweighted population, not how a
+retrained model would behave.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional, Union
+import logging
+
+from .fairness_metrics import ThresholdCurves, _divide_counts, rates_from_confusion
+
+logger = logging.getLogger(__name__)
+
+# Fairness summaries of a candidate and how far each one is from parity
+SIMULATION_METRICS = {
+    "disparate_impact": lambda value: 1 - np.minimum(value, _divide_counts(1, value)),
+    "statistical_parity_difference": np.abs,
+    "equalized_odds_difference": lambda value: value,
+}
+
+# Label weight applied to each of the (tp, fp, fn, tn) cells: 1 = positive label
+_CELL_LABELS = np.array([1, 0, 1, 0])
+
+
+class MitigationSimulator:
+    """
+    Batched what-if evaluation of group thresholds and reweighing.
+
+    Example:
+        simulator = MitigationSimulator.from_arrays(y_true, y_prob, df["sex"], privileged_group="M")
+        table = simulator.evaluate(
+            thresholds=simulator.threshold_candidates(),
+            weights=simulator.reweighing_candidates()
+        )
+        frontier = simulator.pareto_frontier(table, "equalized_odds_difference")
+    """
+
+    def __init__(self, curves: ThresholdCurves, privileged_group: Union[int, str],
+                 base_threshold: float = 0.5):
+        """
+        Initialize MitigationSimulator.
+
+        Args:
+            curves: ThresholdCurves of the protected attribute
+            privileged_group: Value of the privileged group
+            base_threshold: Shared decision threshold of the unmitigated model
+        """
+        matches = np.flatnonzero(curves.group_values == privileged_group)
+        if len(matches) == 0:
+            raise ValueError(f"Privileged group {privileged_group!r} not found in protected attribute.")
+        if len(curves.group_values) < 2:
+            raise ValueError("Mitigation simulation needs at least two groups.")
+        self.curves = curves
+        self.privileged_index = int(matches[0])
+        self.base_threshold = base_threshold
+
+    @classmethod
+    def from_arrays(cls,
+                    y_true: Union[np.ndarray, pd.Series],
+                    y_prob: Union[np.ndarray, pd.Series],
+                    groups: Union[np.ndarray, pd.Series],
+                    privileged_group: Union[int, str],
+                    positive_label: Union[int, str] = 1,
+                    base_threshold: float = 0.5,
+                    sample_weight: Optional[Union[np.ndarray, pd.Series]] = None) -> "MitigationSimulator":
+        """
+        Build the simulator with the one pass over the rows it needs.
+
+        Args:
+            y_true: True labels
+            y_prob: Predicted probabilities of the positive label
+            groups: Protected attribute value of each row
+            privileged_group: Value of the privileged group
+            positive_label: Label treated as the positive outcome
+            base_threshold: Shared decision threshold of the unmitigated model
+            sample_weight: Row weights (optional)
+
+        Returns:
+            MitigationSimulator
+        """
+        curves = ThresholdCurves.from_arrays(y_true, y_prob, groups, positive_label, sample_weight)
+        return cls(curves, privileged_group, base_threshold)
+
+    @property
+    def group_values(self) -> np.ndarray:
+        return self.curves.group_values
+
+    def label_counts(self) -> np.ndarray:
+        """(negative, positive) label counts or weight sums of each group, shape (k, 2)."""
+        positives = np.array([cum[-1] for cum in self.curves.cum_positive], dtype=float)
+        if self.curves.cum_weight is None:
+            totals = np.array([len(scores) for scores in self.curves.scores], dtype=float)
+        else:
+            totals = np.array([cum[-1] for cum in self.curves.cum_weight], dtype=float)
+        return np.stack([totals - positives, positives], axis=1)
+
+    def threshold_candidates(self, n_thresholds: int = 16) -> np.ndarray:
+        """
+        Grid of (privileged, unprivileged) threshold pairs.
+
+        Both thresholds run over the same quantile-spaced pooled scores; every
+        unprivileged group shares the second threshold of the pair.
+
+        Args:
+            n_thresholds: Thresholds per axis, giving n_thresholds² candidates
+
+        Returns:
+            Array of shape (n_thresholds², k) with one threshold per group
+        """
+        grid = self.curves.candidate_thresholds(n_thresholds)
+        privileged, unprivileged = (axis.ravel() for axis in np.meshgrid(grid, grid, indexing='ij'))
+        thresholds = np.repeat(unprivileged[:, None], len(self.group_values), axis=1)
+        thresholds[:, self.privileged_index] = privileged
+        return thresholds
+
+    def reweighing_weights(self, reweighing: Optional[Any] = None) -> np.ndarray:
+        """
+        Reweighing cell weights, shape (k, 2) for the (negative, positive) labels.
+
+        Args:
+            reweighing: Fitted Reweighing on this protected attribute alone,
+                whose cell weights are looked up; if None, the Kamiran-Calders
+                weights are computed from the cached label counts
+
+        Returns:
+            Weight of every (group, label) cell (1.0 for cells Reweighing never saw)
+        """
+        if reweighing is None:
+            counts = self.label_counts()
+            expected = counts.sum(axis=1, keepdims=True) * counts.sum(axis=0, keepdims=True) / counts.sum()
+            return np.where(counts > 0, _divide_counts(expected, counts), 1.0)
+
+        if len(reweighing.protected_attrs) != 1:
+            raise ValueError("Reweighing must be fitted on the simulated protected attribute alone.")
+        table = reweighing.weight_table()
+        positive = (table[reweighing.label] == reweighing.positive_label).to_numpy()
+        negative = (table[reweighing.label] == reweighing.negative_label).to_numpy()
+        groups = pd.Index(self.group_values).get_indexer(table[reweighing.protected_attrs[0]])
+        found = (groups >= 0) & (positive | negative)
+        weights = np.ones((len(self.group_values), 2))
+        weights[groups[found], positive[found].astype(int)] = table['weight'].to_numpy()[found]
+        return weights
+
+    def reweighing_candidates(self, strengths: Union[int, np.ndarray] = 11,
+                              reweighing: Optional[Any] = None) -> np.ndarray:
+        """
+        Partial reweighing: unit weights blended towards the Reweighing weights.
+
+        Args:
+            strengths: Blend factors in [0, 1], or the number of evenly spaced ones
+            reweighing: Fitted Reweighing to take the full weights from (optional)
+
+        Returns:
+            Array of shape (len(strengths), k, 2)
+        """
+        if isinstance(strengths, (int, np.integer)):
+            strengths = np.linspace(0, 1, strengths)
+        strengths = np.asarray(strengths, dtype=float)[:, None, None]
+        return 1 + strengths * (self.reweighing_weights(reweighing)[None] - 1)
+
+    def confusion(self, thresholds: Optional[np.ndarray] = None,
+                  weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Simulated confusion tables of a batch of candidates.
+
+        Args:
+            thresholds: Group thresholds of shape (m, k) (base_threshold if None)
+            weights: Cell weights of shape (m, k, 2) (unit weights if None);
+                when both are given they are paired candidate by candidate
+
+        Returns:
+            Array of shape (m, k, 4) with columns ordered as CONFUSION_COLUMNS
+        """
+        if thresholds is None:
+            m = 1 if weights is None else len(weights)
+            thresholds = np.full((m, len(self.group_values)), self.base_threshold)
+        confusion = self.curves.confusion(thresholds, per_group=True).astype(float)
+        if weights is not None:
+            confusion = confusion * np.asarray(weights, dtype=float)[..., _CELL_LABELS]
+        return confusion
+
+    def summarize(self, confusion: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Fairness and accuracy of every candidate.
+
+        Every unprivileged group is compared with the privileged group and the
+        worst group is reported, so the summaries also cover more than two groups.
+
+        Args:
+            confusion: Simulated confusion tables of shape (m, k, 4)
+
+        Returns:
+            Dict of SIMULATION_METRICS names and 'accuracy' to arrays of shape (m,)
+        """
+        rates = rates_from_confusion(confusion)
+        p = self.privileged_index
+        others = np.arange(len(self.group_values)) != p
+        positive_rate = rates["positive_rate"]
+
+        ratio = _divide_counts(positive_rate, positive_rate[:, [p]])[:, others]
+        worst_ratio = np.argmax(SIMULATION_METRICS["disparate_impact"](ratio), axis=1)[:, None]
+        difference = (positive_rate - positive_rate[:, [p]])[:, others]
+        worst_difference = np.argmax(np.abs(difference), axis=1)[:, None]
+        odds_gap = np.maximum(
+            np.abs(rates["true_positive_rate"] - rates["true_positive_rate"][:, [p]]),
+            np.abs(rates["false_positive_rate"] - rates["false_positive_rate"][:, [p]])
+        )[:, others]
+
+        return {
+            "disparate_impact": np.take_along_axis(ratio, worst_ratio, axis=1)[:, 0],
+            "statistical_parity_difference": np.take_along_axis(difference, worst_difference, axis=1)[:, 0],
+            "equalized_odds_difference": odds_gap.max(axis=1),
+            "accuracy": rates_from_confusion(confusion.sum(axis=1))["accuracy"],
+        }
+
+    def evaluate(self, thresholds: Optional[np.ndarray] = None,
+                 weights: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Evaluate threshold and reweighing candidates side by side.
+
+        Thresholds and weights given together are evaluated as two separate
+        candidate sets; combined candidates can be built with confusion().
+        The unmitigated model is always candidate 0.
+
+        Args:
+            thresholds: Group thresholds of shape (m, k), e.g. threshold_candidates()
+            weights: Cell weights of shape (m, k, 2), e.g. reweighing_candidates()
+
+        Returns:
+            DataFrame with one row per candidate: 'candidate', 'kind'
+            ('baseline', 'thresholds' or 'reweighing'), 'strength' (mean
+            absolute weight change, NaN for thresholds), one
+            'threshold_<group>' column per group, the SIMULATION_METRICS and
+            'accuracy'
+        """
+        k = len(self.group_values)
+        base = np.full((1, k), self.base_threshold)
+        parts = [(
+            "baseline", self.confusion(base), base, np.zeros(1)
+        )]
+        if thresholds is not None:
+            thresholds = np.asarray(thresholds, dtype=float).reshape(-1, k)
+            parts.append(("thresholds", self.confusion(thresholds), thresholds, np.full(len(thresholds), np.nan)))
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float).reshape(-1, k, 2)
+            strength = np.abs(weights - 1).mean(axis=(1, 2))
+            parts.append(("reweighing", self.confusion(weights=weights), np.repeat(base, len(weights), axis=0), strength))
+
+        confusion = np.concatenate([part[1] for part in parts])
+        candidate_thresholds = np.concatenate([part[2] for part in parts])
+        table = {
+            "candidate": np.arange(len(confusion)),
+            "kind": np.concatenate([np.full(len(part[1]), part[0]) for part in parts]),
+            "strength": np.concatenate([part[3] for part in parts]),
+        }
+        for g, value in enumerate(self.group_values):
+            table[f"threshold_{value}"] = candidate_thresholds[:, g]
+        table.update(self.summarize(confusion))
+        logger.info(f"🧪 Simulated {len(confusion)} mitigation candidates")
+        return pd.DataFrame(table)
+
+    @staticmethod
+    def pareto_frontier(table: pd.DataFrame, fairness_metric: str = "equalized_odds_difference") -> pd.DataFrame:
+        """
+        Candidates no other candidate beats on both fairness and accuracy.
+
+        Args:
+            table: Output of evaluate()
+            fairness_metric: One of SIMULATION_METRICS; its distance from parity
+                is minimized while accuracy is maximized
+
+        Returns:
+            Frontier rows of the table, from fairest to most accurate, with an
+            added 'unfairness' column
+        """
+        if fairness_metric not in SIMULATION_METRICS:
+            raise ValueError(f"fairness_metric must be one of {tuple(SIMULATION_METRICS)}")
+        unfairness = np.asarray(SIMULATION_METRICS[fairness_metric](table[fairness_metric].to_numpy(dtype=float)))
+        accuracy = table["accuracy"].to_numpy(dtype=float)
+
+        order = np.lexsort((-accuracy, unfairness))
+        order = order[np.isfinite(unfairness[order]) & np.isfinite(accuracy[order])]
+        best_before = np.concatenate([[-np.inf], np.maximum.accumulate(accuracy[order])[:-1]])
+        keep = order[accuracy[order] > best_before]
+        return table.iloc[keep].assign(unfairness=unfairness[keep]).reset_index(drop=True)
@@ -15,6 +15,9 @@ from typing import Dict, Any, List, Optional, Union, Tuple
 import logging
 import warnings
 from .utils import Utils
+from .prediction_cache import PredictionCache
+from .audit_frame import AuditFrame, Filters
+from .profile import column_profile
 
 logger = logging.getLogger(__name__)
 
@@ -32,34 +35,45 @@ class ModelAuditor:
 
     def __init__(self, 
                  model: BaseEstimator,
-                 dataset: Union[str, pd.DataFrame, None] = None,
+                 dataset: Union[str, pd.DataFrame, AuditFrame, None] = None,
                  X_test: Optional[pd.DataFrame] = None,
                  y_test: Optional[Union[pd.Series, np.ndarray]] = None,
                  protected_attributes: Optional[List[str]] = None,
                  target_column: Optional[str] = None,
                  justified_attributes: Optional[List[str]] = None,
-                 task_type: Optional[str] = None):
+                 task_type: Optional[str] = None,
+                 prediction_cache: Optional[PredictionCache] = None,
+                 filters: Optional[Filters] = None,
+                 optimize_memory: bool = False):
         """
         Initialize ModelAuditor.
 
         Args:
             model: Trained model to audit
-            dataset: Full dataset (will be split if X_test/y_test not provided)
+            dataset: Full dataset path (CSV/Parquet/Feather/Arrow), DataFrame or shared
+                AuditFrame (split if X_test/y_test not provided)
             X_test: Test features
             y_test: Test targets
             protected_attributes: List of protected/sensitive attributes
             target_column: Target column name
             justified_attributes: Attributes justified for discrimination
             task_type: 'classification' or 'regression' (auto-detected if None)
+            prediction_cache: Cache shared with other auditors (a private one is created if None)
+            filters: Row filters applied while loading ``dataset``, e.g. [("year", ">=", 2020)]
+            optimize_memory: Load ``dataset`` with compact dtypes (see Utils.optimize_dtypes)
         """
         self.model = model
         self.protected_attributes = protected_attributes or []
         self.justified_attributes = justified_attributes or []
         self.target_column = target_column
         self.task_type = task_type
+        self.prediction_cache = prediction_cache or PredictionCache()
 
         # Data setup
-        self._setup_data(dataset, X_test, y_test)
+        self._setup_data(dataset, X_test, y_test, filters, optimize_memory)
+        self._data_key = PredictionCache.data_fingerprint(self.X_test)
+        # The model is pickled once per audit, not on every cached lookup
+        self._model_key = self.prediction_cache.model_key(self.model)
 
         # Model validation
         self._validate_model()
@@ -72,23 +86,28 @@ class ModelAuditor:
         logger.info(f"🤖 ModelAuditor initialized for {self.task_type} task")
         logger.info(f"📋 Justified attributes: {self.justified_attributes}")
 
-    def _setup_data(self, dataset: Union[str, pd.DataFrame, None], 
+    def _setup_data(self, dataset: Union[str, pd.DataFrame, AuditFrame, None], 
                    X_test: Optional[pd.DataFrame], 
-                   y_test: Optional[Union[pd.Series, np.ndarray]]):
+                   y_test: Optional[Union[pd.Series, np.ndarray]],
+                   filters: Optional[Filters] = None,
+                   optimize_memory: bool = False):
         """Setup test data for model auditing."""
 
         if X_test is not None and y_test is not None:
-            # Use provided test data
-            self.X_test = X_test.copy() if isinstance(X_test, pd.DataFrame) else pd.DataFrame(X_test)
-            self.y_test = y_test.copy() if hasattr(y_test, 'copy') else y_test
+            # Use provided test data (shallow: the auditor never modifies it)
+            self.X_test = X_test.copy(deep=False) if isinstance(X_test, pd.DataFrame) else pd.DataFrame(X_test)
+            self.y_test = y_test.copy(deep=False) if isinstance(y_test, pd.Series) else y_test
             logger.info(f"📊 Using provided test data: {self.X_test.shape}")
 
         elif dataset is not None:
-            # Load dataset and split
-            if isinstance(dataset, str):
-                df = pd.read_csv(dataset)
-            else:
-                df = dataset.copy()
+            # Load only the model's features plus target and protected attributes
+            # when the model records its feature names
+            columns = None
+            feature_names = getattr(self.model, 'feature_names_in_', None)
+            if feature_names is not None and self.target_column:
+                columns = list(feature_names) + [self.target_column] + self.protected_attributes
+            df = AuditFrame.load(dataset, columns=columns, filters=filters, optimize_memory=optimize_memory,
+                                 categorical_columns=self.protected_attributes).frame
 
             # Infer target column if not provided
             if not self.target_column:
@@ -119,14 +138,22 @@ class ModelAuditor:
         if not hasattr(self.model, 'predict'):
             raise ValueError("Model must have a 'predict' method")
 
-        # Check if model is fitted by trying a prediction
+        # Check if model is fitted by running the test-set prediction that
+        # every later stage reads from the cache
         try:
-            sample_input = self.X_test.iloc[:1] if hasattr(self.X_test, 'iloc') else self.X_test[:1]
-            self.model.predict(sample_input)
+            self._predict()
             logger.info("✅ Model validation passed")
         except Exception as e:
             raise ValueError(f"Model appears to be unfitted or incompatible: {e}")
 
+    def _predict(self) -> np.ndarray:
+        """Cached predictions for the test set."""
+        return self.prediction_cache.predict(self.model, self.X_test, self._data_key, self._model_key)
+
+    def _predict_proba(self) -> np.ndarray:
+        """Cached class probabilities for the test set."""
+        return self.prediction_cache.predict_proba(self.model, self.X_test, self._data_key, self._model_key)
+
     def evaluate_performance(self) -> Dict[str, float]:
         """
         Evaluate model performance on test data.
@@ -138,14 +165,14 @@ class ModelAuditor:
 
         try:
             # Get predictions
-            y_pred = self.model.predict(self.X_test)
+            y_pred = self._predict()
 
             if self.task_type == 'classification':
                 metrics = self._classification_metrics(self.y_test, y_pred)
 
                 # Add probability-based metrics if available
                 if hasattr(self.model, 'predict_proba'):
-                    y_proba = self.model.predict_proba(self.X_test)
+                    y_proba = self._predict_proba()
                     if y_proba.shape[1] == 2:  # Binary classification
                         metrics['roc_auc'] = roc_auc_score(self.y_test, y_proba[:, 1])
 
@@ -190,10 +217,10 @@ class ModelAuditor:
             from .bias_detection import BiasDetector
 
             # Get model predictions
-            y_pred = self.model.predict(self.X_test)
+            y_pred = self._predict()
 
             # Create dataframe with predictions and protected attributes
-            df_with_preds = self.X_test.copy()
+            df_with_preds = self.X_test.copy(deep=False)
             df_with_preds['predictions'] = y_pred
             df_with_preds[self.target_column] = self.y_test
 
@@ -233,7 +260,7 @@ class ModelAuditor:
             from .fairness_metrics import FairnessMetrics
 
             # Get predictions
-            y_pred = self.model.predict(self.X_test)
+            y_pred = self._predict()
 
             # For each protected attribute, compute fairness metrics
             for attr in self.protected_attributes:
@@ -241,7 +268,7 @@ class ModelAuditor:
                     continue
 
                 # Determine privileged group (most common value)
-                privileged_group = self.X_test[attr].mode().iloc[0]
+                privileged_group = column_profile(self.X_test[attr]).mode
 
                 fairness = FairnessMetrics(
                     y_true=self.y_test,
@@ -266,7 +293,7 @@ class ModelAuditor:
     def _compute_group_performance(self, attr: str, privileged_group: Any) -> Dict[str, Dict[str, float]]:
         """Compute performance metrics for different groups."""
         try:
-            y_pred = self.model.predict(self.X_test)
+            y_pred = self._predict()
 
             # Split by groups
             privileged_mask = self.X_test[attr] == privileged_group
@@ -366,7 +393,7 @@ class ModelAuditor:
             for attr in self.protected_attributes:
                 if attr in self.X_test.columns:
                     # Simple correlation with predictions
-                    y_pred = self.model.predict(self.X_test)
+                    y_pred = self._predict()
                     if self.task_type == 'classification':
                         # For classification, use correlation with predictions
                         corr = np.corrcoef(self.X_test[attr], y_pred)[0, 1]
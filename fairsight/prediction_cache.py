@@ -0,0 +1,184 @@
+"""
+Fairsight Toolkit - Prediction Cache
+====================================
+
+Memoizes model inference so that every audit stage reuses one
+``predict`` / ``predict_proba`` pass over the same data. Entries are keyed on
+a digest of the model's current state and a fingerprint of the input data, so
+a model refitted in place misses the cache. Hashing a large model can cost
+as much as inference, so callers that look the same model up repeatedly
+(ModelAuditor) compute ``model_key`` once and pass it in. At most ``max_entries`` results are
+kept in memory, and entries can optionally be persisted to disk so repeated
+audits of the same model and test set skip inference.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache:
+    """
+    Per-audit cache of model predictions and probabilities.
+
+    Entries are keyed on a digest of the pickled model plus a data
+    fingerprint, and the least recently used ones are evicted beyond
+    ``max_entries``. With ``cache_dir`` set, entries are also written to
+    ``.npy`` files under the same keys, so they survive across processes.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 16):
+        """
+        Initialize PredictionCache.
+
+        Args:
+            cache_dir: Directory for persisted predictions (memory only if None)
+            max_entries: In-memory results kept before the least recently used is dropped
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], np.ndarray]" = OrderedDict()
+        # Models that cannot be pickled are keyed on id(); keep them alive so it cannot be reused
+        self._unpicklable: Dict[int, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def data_fingerprint(X: Union[pd.DataFrame, pd.Series, np.ndarray]) -> str:
+        """
+        Compute a content digest of the input data.
+
+        Args:
+            X: Features passed to the model
+
+        Returns:
+            Hex digest covering values, index, column names and dtypes
+        """
+        digest = hashlib.sha256()
+        if isinstance(X, (pd.DataFrame, pd.Series)):
+            digest.update(pd.util.hash_pandas_object(X, index=True).to_numpy().tobytes())
+            if isinstance(X, pd.DataFrame):
+                digest.update(repr(list(X.columns)).encode("utf-8"))
+                digest.update(repr(list(X.dtypes.astype(str))).encode("utf-8"))
+        else:
+            array = np.ascontiguousarray(X)
+            digest.update(repr((array.shape, str(array.dtype))).encode("utf-8"))
+            if array.dtype == object:
+                digest.update(pd.util.hash_array(array.ravel()).tobytes())
+            else:
+                digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def model_key(self, model: Any) -> str:
+        """
+        Cache key of the model's current state.
+
+        Pickles and hashes the whole model, which can cost as much as
+        inference for large ensembles: compute it once per audit and pass it
+        to predict() / predict_proba() like ``data_key``.
+
+        Args:
+            model: Fitted model
+
+        Returns:
+            Digest of the pickled model, or an identity key ("id-...") for
+            models that cannot be pickled (those are never persisted)
+        """
+        try:
+            return hashlib.sha256(pickle.dumps(model, protocol=4)).hexdigest()
+        except Exception as e:
+            if id(model) not in self._unpicklable:
+                logger.warning(f"⚠️ Model cannot be fingerprinted, predictions are cached by identity only: {e}")
+                self._unpicklable[id(model)] = model
+            return f"id-{id(model)}"
+
+    def _path(self, model_key: str, data_key: str, method: str) -> str:
+        return os.path.join(self.cache_dir, f"{model_key[:24]}_{data_key[:24]}_{method}.npy")
+
+    def _get(self, method: str, model: Any, X: Any, data_key: Optional[str],
+             model_key: Optional[str], memoize: bool) -> np.ndarray:
+        if not memoize:
+            self.misses += 1
+            return np.asarray(getattr(model, method)(X))
+
+        data_key = data_key or self.data_fingerprint(X)
+        model_key = model_key or self.model_key(model)
+        key = (model_key, data_key, method)
+
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        persist = self.cache_dir and not model_key.startswith("id-")
+        path = self._path(model_key, data_key, method) if persist else None
+        if path and os.path.exists(path):
+            values = np.load(path, allow_pickle=False)
+            self.hits += 1
+            logger.info(f"💾 Loaded cached {method} output from {path}")
+        else:
+            values = np.asarray(getattr(model, method)(X))
+            self.misses += 1
+            if path:
+                try:
+                    np.save(path, values, allow_pickle=False)
+                except ValueError:
+                    # Object arrays (e.g. string labels) are kept in memory only
+                    pass
+
+        self._entries[key] = values
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return values
+
+    def predict(self, model: Any, X: Any, data_key: Optional[str] = None,
+                model_key: Optional[str] = None, memoize: bool = True) -> np.ndarray:
+        """
+        Return ``model.predict(X)``, running inference only on a cache miss.
+
+        Args:
+            model: Fitted model
+            X: Features
+            data_key: Precomputed ``data_fingerprint(X)`` to skip rehashing
+            model_key: Precomputed ``model_key(model)`` to skip re-pickling the model
+            memoize: Cache the result; pass False for one-off batches such as
+                streamed chunks, which would otherwise pile up in memory
+
+        Returns:
+            Array of predictions
+        """
+        return self._get("predict", model, X, data_key, model_key, memoize)
+
+    def predict_proba(self, model: Any, X: Any, data_key: Optional[str] = None,
+                      model_key: Optional[str] = None, memoize: bool = True) -> np.ndarray:
+        """
+        Return ``model.predict_proba(X)``, running inference only on a cache miss.
+
+        Args:
+            model: Fitted model exposing ``predict_proba``
+            X: Features
+            data_key: Precomputed ``data_fingerprint(X)`` to skip rehashing
+            model_key: Precomputed ``model_key(model)`` to skip re-pickling the model
+            memoize: Cache the result; pass False for one-off batches such as
+                streamed chunks, which would otherwise pile up in memory
+
+        Returns:
+            Array of class probabilities
+        """
+        return self._get("predict_proba", model, X, data_key, model_key, memoize)
+
+    def clear(self):
+        """Drop all in-memory entries (persisted files are left in place)."""
+        self._entries.clear()
+        self._unpicklable.clear()
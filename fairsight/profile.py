@@ -0,0 +1,178 @@
+"""
+Fairsight Toolkit - Dataset Profile
+===================================
+
+A cached per-column profile: dtype, row and missing counts, cardinality,
+value counts and mode, all taken from one ``value_counts`` pass. Task-type
+inference, privileged-group detection and the auditors' distribution and
+mode lookups read it instead of rescanning the same column at every stage.
+
+Profiles are cached per process, keyed on a column digest: name, dtype,
+length and a hash of every value. Hashing is one vectorized pass, much
+cheaper than counting values, so every stage handed the same data finds the
+same profile, while any change to a value (imputing, encoding, filtering,
+in-place edits) gives a new digest.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Column profiles kept in the process-wide cache
+PROFILE_CACHE_SIZE = 256
+
+_profiles: "OrderedDict[str, ColumnProfile]" = OrderedDict()
+
+
+def column_digest(values: pd.Series) -> str:
+    """
+    Digest identifying a column for the profile cache.
+
+    Args:
+        values: Column values
+
+    Returns:
+        Hex digest of the name, dtype, length and all values
+    """
+    digest = hashlib.sha256(repr((values.name, str(values.dtype), len(values))).encode())
+    digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ColumnProfile:
+    """
+    Summary of one column.
+
+    Attributes:
+        name: Column name
+        dtype: Column dtype
+        count: Number of rows
+        missing: Number of missing values
+        value_counts: Counts of the non-missing values, most frequent first
+        digest: Cache key of the column
+    """
+
+    def __init__(self, values: pd.Series, digest: Optional[str] = None):
+        self.name = values.name
+        self.dtype = values.dtype
+        self.count = len(values)
+        self.value_counts = values.value_counts()
+        self.missing = self.count - int(self.value_counts.sum())
+        self.digest = digest or column_digest(values)
+
+    @property
+    def n_unique(self) -> int:
+        """Number of distinct non-missing values (unobserved categories excluded)."""
+        return int(np.count_nonzero(self.value_counts.to_numpy()))
+
+    @property
+    def mode(self) -> Any:
+        """Most frequent value, the smallest one on ties (as ``Series.mode().iloc[0]``)."""
+        if self.value_counts.empty:
+            return None
+        counts = self.value_counts
+        tied = counts.index[counts.to_numpy() == counts.iloc[0]]
+        try:
+            return tied.sort_values()[0]
+        except TypeError:
+            return tied[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the profile to a dictionary."""
+        return {
+            'dtype': str(self.dtype),
+            'count': self.count,
+            'missing': self.missing,
+            'n_unique': self.n_unique,
+            'mode': self.mode
+        }
+
+    def __repr__(self) -> str:
+        return f"ColumnProfile({self.name!r}, {self.dtype}, {self.n_unique} unique, {self.missing} missing)"
+
+
+def column_profile(values: pd.Series) -> ColumnProfile:
+    """
+    Profile of a column, from the cache when the same data was profiled before.
+
+    Args:
+        values: Column values
+
+    Returns:
+        ColumnProfile
+    """
+    digest = column_digest(values)
+    profile = _profiles.get(digest)
+    if profile is None:
+        profile = _profiles[digest] = ColumnProfile(values, digest)
+        if len(_profiles) > PROFILE_CACHE_SIZE:
+            _profiles.popitem(last=False)
+    else:
+        _profiles.move_to_end(digest)
+    return profile
+
+
+def clear_profile_cache() -> None:
+    """Drop all cached column profiles."""
+    _profiles.clear()
+
+
+class DatasetProfile:
+    """
+    Lazily filled profiles of a DataFrame's columns.
+
+    Columns are profiled on first access and shared through the process-wide
+    cache, so a profile built by one auditor is reused by the next.
+
+    Example:
+        profile = DatasetProfile(df)
+        profile["sex"].value_counts
+        profile.privileged_groups(["sex", "race"])
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Initialize DatasetProfile.
+
+        Args:
+            df: Data to profile
+        """
+        self._df = df
+        self._columns: Dict[str, ColumnProfile] = {}
+
+    def __getitem__(self, column: str) -> ColumnProfile:
+        if column not in self._columns:
+            self._columns[column] = column_profile(self._df[column])
+        return self._columns[column]
+
+    def __contains__(self, column: Any) -> bool:
+        return column in self._df.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._df.columns)
+
+    def __len__(self) -> int:
+        return len(self._df.columns)
+
+    def privileged_groups(self, attributes: List[str]) -> Dict[str, Any]:
+        """
+        Most common value of each attribute present in the data.
+
+        Args:
+            attributes: Protected attributes
+
+        Returns:
+            Dict mapping attribute names to privileged values
+        """
+        return {attr: self[attr].value_counts.index[0] for attr in attributes
+                if attr in self and not self[attr].value_counts.empty}
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Profiles of every column, as dictionaries."""
+        return {column: self[column].to_dict() for column in self}
@@ -0,0 +1,280 @@
+"""
+Fairsight Toolkit - Proxy Detection
+===================================
+
+Finds features that act as proxies for protected attributes, i.e. features
+that carry information about e.g. sex or race even when the protected column
+itself is dropped. Every feature is reduced to small integer codes
+(categories, or quantile bins for numeric columns). The contingency tables of
+a whole batch of features against a protected attribute are then built with
+one ``np.bincount``, and mutual information and Cramér's V are computed for
+all of them at once.
+
+On large tables a uniform row sample can be scanned instead. Its error bounds
+come from a multinomial bootstrap of the sampled contingency tables.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROXY_METHODS = ("mutual_information", "cramers_v")
+
+# Upper bound on rows × features encoded per bincount batch
+_BATCH_CELLS = 1 << 24
+
+# Rows used to place quantile bin edges on large tables
+_EDGE_SAMPLE_ROWS = 1 << 16
+
+
+def encode_codes(values: pd.Series, n_bins: int = 10, max_categories: int = 50) -> Tuple[np.ndarray, int]:
+    """
+    Reduce a column to dense integer codes.
+
+    Numeric columns with more than ``n_bins`` distinct values are cut at
+    their quantiles. Other columns are factorized, and the rarest categories
+    beyond ``max_categories`` are merged into one code. Missing values get a
+    code of their own.
+
+    Args:
+        values: Column to encode
+        n_bins: Quantile bins for continuous numeric columns
+        max_categories: Maximum number of codes for categorical columns
+
+    Returns:
+        Tuple of (int64 codes, number of codes)
+    """
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        numeric = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        observed = ~np.isnan(numeric)
+        if len(np.unique(numeric[observed])) > n_bins:
+            edges = np.unique(np.quantile(numeric[observed], np.linspace(0, 1, n_bins + 1)[1:-1]))
+            codes = np.searchsorted(edges, numeric, side='right')
+            codes[~observed] = len(edges) + 1
+            return codes.astype(np.int64), len(edges) + 2
+
+    codes, uniques = pd.factorize(values)
+    n_codes = len(uniques)
+    if n_codes > max_categories:
+        # Keep the most frequent categories, fold the tail into one code
+        frequency = np.bincount(codes[codes >= 0], minlength=n_codes)
+        remap = np.full(n_codes, max_categories - 1, dtype=np.int64)
+        remap[np.argsort(-frequency, kind='stable')[:max_categories - 1]] = np.arange(max_categories - 1)
+        codes = np.where(codes >= 0, remap[np.maximum(codes, 0)], -1)
+        n_codes = max_categories
+    codes = np.where(codes >= 0, codes, n_codes).astype(np.int64)
+    return codes, n_codes + 1
+
+
+def _encode_features(df: pd.DataFrame, features: List[str], n_bins: int, max_categories: int,
+                     rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode many columns at once into a column-major int16 code matrix.
+
+    Continuous numeric columns are binned together: bin edges come from the
+    quantiles of a row sample, and codes from vectorized comparisons against
+    the edges. Columns with few distinct values fall back to encode_codes().
+
+    Returns:
+        Tuple of (codes of shape (n, len(features)), number of codes per feature)
+    """
+    codes = np.empty((len(df), len(features)), dtype=np.int16, order='F')
+    n_codes = np.zeros(len(features), dtype=np.int64)
+    position = {col: i for i, col in enumerate(features)}
+    numeric = [col for col in features
+               if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])]
+
+    step = max(1, _BATCH_CELLS // max(len(df), 1))
+    for start in range(0, len(numeric), step):
+        block = numeric[start:start + step]
+        X = df[block].to_numpy(dtype=np.float32, na_value=np.nan)
+        rows = rng.choice(len(X), _EDGE_SAMPLE_ROWS, replace=False) if len(X) > _EDGE_SAMPLE_ROWS else slice(None)
+        sample = np.sort(X[rows], axis=0)  # NaNs sort last
+        distinct = (np.diff(sample, axis=0) > 0).sum(axis=0) + 1
+        with np.errstate(invalid='ignore'):
+            edges = np.nanquantile(sample, np.linspace(0, 1, n_bins + 1)[1:-1], axis=0)
+
+        binned = np.zeros_like(X, dtype=np.int16)
+        for edge in edges:
+            binned += X >= edge
+        binned[np.isnan(X)] = n_bins
+        for i, col in enumerate(block):
+            if distinct[i] > n_bins:
+                codes[:, position[col]] = binned[:, i]
+                n_codes[position[col]] = n_bins + 1
+
+    for col, i in position.items():
+        if n_codes[i] == 0:
+            codes[:, i], n_codes[i] = encode_codes(df[col], n_bins, max_categories)
+    return codes, n_codes
+
+
+def _association(tables: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Association measures for a stack of contingency tables.
+
+    Args:
+        tables: Counts of shape (..., protected codes, feature codes)
+
+    Returns:
+        Dict of arrays with the leading shape of ``tables``: mutual information
+        (nats), MI normalized by the protected attribute's entropy, and Cramér's V
+    """
+    tables = tables.astype(np.float64)
+    n = tables.sum(axis=(-2, -1), keepdims=True)
+    p_xy = tables / np.maximum(n, 1)
+    p_x = p_xy.sum(axis=-1, keepdims=True)
+    p_y = p_xy.sum(axis=-2, keepdims=True)
+    expected = p_x * p_y
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mi = np.where(p_xy > 0, p_xy * np.log(p_xy / expected), 0.0).sum(axis=(-2, -1))
+        entropy = -np.where(p_x > 0, p_x * np.log(p_x), 0.0).sum(axis=(-2, -1))
+        chi2 = n[..., 0, 0] * np.where(expected > 0, (p_xy - expected) ** 2 / expected, 0.0).sum(axis=(-2, -1))
+        dof = np.minimum((p_x > 0).sum(axis=(-2, -1)), (p_y > 0).sum(axis=(-2, -1))) - 1
+        cramers_v = np.where(dof > 0, np.sqrt(chi2 / (n[..., 0, 0] * dof)), 0.0)
+        normalized_mi = np.where(entropy > 0, mi / entropy, 0.0)
+
+    return {
+        "mutual_information": np.maximum(mi, 0.0),
+        "normalized_mutual_information": np.clip(normalized_mi, 0.0, 1.0),
+        "cramers_v": np.clip(cramers_v, 0.0, 1.0)
+    }
+
+
+def _contingency_tables(protected_codes: np.ndarray, n_protected: int,
+                        feature_codes: np.ndarray, width: int) -> np.ndarray:
+    """
+    Contingency tables of one protected attribute against a batch of features.
+
+    Args:
+        protected_codes: Codes of the protected attribute, shape (n,)
+        n_protected: Number of protected codes
+        feature_codes: Codes of the features, shape (n, f)
+        width: Upper bound on the number of codes of any feature in the batch
+
+    Returns:
+        Counts of shape (f, n_protected, width)
+    """
+    n_features = feature_codes.shape[1]
+    cell = protected_codes[:, None] * width + feature_codes.astype(np.int64)
+    cell += np.arange(n_features) * (n_protected * width)
+    counts = np.bincount(cell.ravel(), minlength=n_features * n_protected * width)
+    return counts.reshape(n_features, n_protected, width)
+
+
+def _bootstrap_bounds(tables: np.ndarray, score_key: str, n_bootstrap: int,
+                      tail: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Percentile bounds of a score from multinomial redraws of each table.
+
+    Redrawing a table's n rows over its cells is equivalent to resampling
+    the sampled rows, without touching row-level data.
+    """
+    n_features = len(tables)
+    flat = tables.reshape(n_features, -1).astype(np.float64)
+    n_rows = int(flat[0].sum())
+    pvals = flat / max(n_rows, 1)
+    step = max(1, _BATCH_CELLS // (n_bootstrap * flat.shape[1]))
+    bounds = np.empty((2, n_features))
+    for start in range(0, n_features, step):
+        part = pvals[start:start + step]
+        replicates = rng.multinomial(n_rows, part, size=(n_bootstrap, len(part)))
+        boot = _association(replicates.reshape(n_bootstrap, len(part), *tables.shape[1:]))[score_key]
+        bounds[:, start:start + step] = np.percentile(boot, [tail, 100 - tail], axis=0)
+    return bounds
+
+
+def scan_proxies(df: pd.DataFrame,
+                 protected_attributes: List[str],
+                 features: Optional[List[str]] = None,
+                 method: str = "mutual_information",
+                 threshold: float = 0.3,
+                 n_bins: int = 10,
+                 max_categories: int = 50,
+                 sample_size: Optional[int] = None,
+                 n_bootstrap: int = 200,
+                 confidence_level: float = 0.95,
+                 random_state: Optional[int] = None,
+                 population_rows: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Score every feature against every protected attribute.
+
+    Args:
+        df: Data to scan
+        protected_attributes: Protected columns
+        features: Candidate proxy columns (all other columns if None)
+        method: Score used for ranking and flagging: "mutual_information"
+            (MI normalized by the protected attribute's entropy) or "cramers_v"
+        threshold: Score at or above which a feature is flagged as a proxy
+        n_bins: Quantile bins for continuous numeric features
+        max_categories: Maximum codes per categorical column
+        sample_size: Scan a uniform sample of this many rows and attach
+            bootstrap error bounds (all rows if None)
+        n_bootstrap: Bootstrap replicates in sampling mode
+        confidence_level: Confidence level of the error bounds
+        random_state: Seed for the sample and the bootstrap
+        population_rows: Size of the population when df is already a sample
+            (e.g. drawn while streaming); error bounds are attached if larger
+
+    Returns:
+        One dict per (feature, protected attribute) pair, strongest first
+    """
+    if method not in PROXY_METHODS:
+        raise ValueError(f"method must be one of {PROXY_METHODS}")
+    protected_attributes = [attr for attr in protected_attributes if attr in df.columns]
+    if features is None:
+        features = [col for col in df.columns if col not in protected_attributes]
+    features = [col for col in features if col in df.columns]
+    if not protected_attributes or not features:
+        return []
+
+    rng = np.random.default_rng(random_state)
+    population_rows = population_rows or len(df)
+    if sample_size is not None and sample_size < len(df):
+        df = df.iloc[np.sort(rng.choice(len(df), size=sample_size, replace=False))]
+    n_rows = len(df)
+    sampled = n_rows < population_rows
+    score_key = "normalized_mutual_information" if method == "mutual_information" else "cramers_v"
+    tail = (1 - confidence_level) / 2 * 100
+
+    codes, n_codes = _encode_features(df, features, n_bins, max_categories, rng)
+    batch_size = max(1, _BATCH_CELLS // max(n_rows, 1))
+
+    results = []
+    for attr in protected_attributes:
+        protected_codes, n_protected = encode_codes(df[attr], n_bins, max_categories)
+        for start in range(0, len(features), batch_size):
+            batch = slice(start, start + batch_size)
+            tables = _contingency_tables(protected_codes, n_protected, codes[:, batch], int(n_codes[batch].max()))
+            scores = _association(tables)
+
+            bounds = None
+            if sampled and n_bootstrap:
+                bounds = _bootstrap_bounds(tables, score_key, n_bootstrap, tail, rng)
+
+            for i, col in enumerate(features[start:start + batch_size]):
+                result = {
+                    'feature': col,
+                    'protected_attribute': attr,
+                    'mutual_information': float(scores['mutual_information'][i]),
+                    'normalized_mutual_information': float(scores['normalized_mutual_information'][i]),
+                    'cramers_v': float(scores['cramers_v'][i]),
+                    'method': method,
+                    'score': float(scores[score_key][i]),
+                    'is_proxy': bool(scores[score_key][i] >= threshold),
+                    'n_rows': n_rows
+                }
+                if bounds is not None:
+                    result['confidence_interval'] = {
+                        'n_bootstrap': n_bootstrap,
+                        'confidence_level': confidence_level,
+                        'score': [float(bounds[0, i]), float(bounds[1, i])]
+                    }
+                results.append(result)
+
+    results.sort(key=lambda r: r['score'], reverse=True)
+    return results
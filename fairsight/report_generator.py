@@ -11,15 +11,14 @@ import os
 import json
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.patches import Circle, Rectangle
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union, Tuple
 import base64
 from io import BytesIO
 import logging
-import pkg_resources
+
+# matplotlib, fpdf and pkg_resources are imported by the chart and PDF
+# methods that need them, keeping `import fairsight` cheap.
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,10 +32,6 @@ except ImportError:
     JINJA2_AVAILABLE = False
     logger.warning("Jinja2 not available. Advanced templating will be disabled.")
 
-# Remove WeasyPrint imports and logic
-# Add FPDF import
-from fpdf import FPDF
-
 # Import NumpyEncoder from registry_client
 try:
     from .registry_client import NumpyEncoder
@@ -251,6 +246,9 @@ class ReportGenerator:
         Returns:
             Path to saved badge image
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Circle
+
         fig, ax = plt.subplots(figsize=(size[0]/100, size[1]/100))
         ax.set_xlim(-1.2, 1.2)
         ax.set_ylim(-1.2, 1.2)
@@ -314,6 +312,8 @@ class ReportGenerator:
         justified_attributes: Optional[List[str]] = None
     ) -> str:
         """Create a summary chart of bias analysis results."""
+        import matplotlib.pyplot as plt
+
         justified_attributes = justified_attributes or []
         
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
@@ -418,6 +418,8 @@ class ReportGenerator:
         fairness_results: Dict[str, Any]
     ) -> str:
         """Create a comprehensive fairness metrics visualization."""
+        import matplotlib.pyplot as plt
+
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle('Fairness Metrics Analysis', fontsize=16, fontweight='bold')
         
@@ -1106,6 +1108,9 @@ class ReportGenerator:
         model_name: str
     ) -> str:
         """Generate PDF report from markdown using FPDF and bundled Unicode font."""
+        import pkg_resources
+        from fpdf import FPDF
+
         def safe_unicode(text):
             # Remove characters above U+FFFF (most emoji, rare symbols)
             return ''.join(c for c in text if ord(c) <= 0xFFFF)
@@ -1,48 +1,227 @@
+"""
+Fairsight Toolkit - Reweighing
+==============================
+
+Reweighing bias mitigation (Kamiran and Calders, 2012). Every
+(protected group, label) cell gets the weight P(group) P(label) / P(group, label),
+so that group and label are independent in the weighted data. Several
+protected attributes give intersectional groups.
+
+Rows are reduced to integer cell codes and counted with ``np.bincount``.
+Weights are then mapped back to the rows by code, with no per-row Python. Counting
+also works chunk by chunk, so datasets that do not fit in memory are handled
+in two passes: count, then write a float32 weight array (optionally a
+memory-mapped ``.npy`` file).
+"""
+
+import numpy as np
 import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+import logging
+
+from .audit_frame import iter_chunks
+
+logger = logging.getLogger(__name__)
+
 
 class Reweighing:
     """
     Reweighing bias mitigation algorithm (Kamiran and Calders, 2012).
     Computes instance weights to balance the distribution of protected groups and labels.
     Usage: Use the computed weights in model training to mitigate bias.
+
+    Example:
+        weights = Reweighing(["sex", "race"], "label").compute_weights(df)
+
+        # Larger than memory: count in one pass, write weights in a second
+        rw = Reweighing("sex", "label").fit("applications.parquet", chunksize=1_000_000)
+        weights = rw.write_weights("applications.parquet", "weights.npy")
     """
-    def __init__(self, protected_attr: str, label: str, privileged_value, unprivileged_value, positive_label=1, negative_label=0):
+    def __init__(self, protected_attr: Union[str, List[str]], label: str, privileged_value=None,
+                 unprivileged_value=None, positive_label=1, negative_label=0):
         self.protected_attr = protected_attr
+        self.protected_attrs = [protected_attr] if isinstance(protected_attr, str) else list(protected_attr)
         self.label = label
         self.privileged_value = privileged_value
         self.unprivileged_value = unprivileged_value
         self.positive_label = positive_label
         self.negative_label = negative_label
+        self._reset()
+
+    def _reset(self):
+        self._lookup: Dict[Tuple[Any, ...], int] = {}
+        self.cell_counts_ = np.zeros(0, dtype=np.int64)
+        self.n_rows_ = 0
+        self._weights: Optional[np.ndarray] = None
+
+    @property
+    def columns(self) -> List[str]:
+        return self.protected_attrs + [self.label]
+
+    def _cell_ids(self, chunk: pd.DataFrame, insert: bool) -> np.ndarray:
+        """
+        Cell id of every row, -1 for rows with a missing value or an unknown cell.
+
+        Columns are factorized separately and combined mixed-radix, so only the
+        distinct cells of the chunk are looked up in the cell registry.
+        """
+        combined = np.zeros(len(chunk), dtype=np.int64)
+        missing = np.zeros(len(chunk), dtype=bool)
+        levels = []
+        for col in self.columns:
+            codes, uniques = pd.factorize(chunk[col])
+            missing |= codes < 0
+            combined = combined * max(len(uniques), 1) + np.maximum(codes, 0)
+            levels.append(uniques)
+        present, local = np.unique(combined[~missing], return_inverse=True)
+
+        mapping = np.empty(len(present), dtype=np.int64)
+        for i, code in enumerate(present):
+            key = []
+            for uniques in reversed(levels):
+                code, index = divmod(int(code), len(uniques))
+                key.append(uniques[index])
+            key = tuple(reversed(key))
+            if insert:
+                mapping[i] = self._lookup.setdefault(key, len(self._lookup))
+            else:
+                mapping[i] = self._lookup.get(key, -1)
+
+        cells = np.full(len(chunk), -1, dtype=np.int64)
+        cells[~missing] = mapping[local.ravel()]
+        return cells
+
+    def partial_fit(self, chunk: pd.DataFrame) -> "Reweighing":
+        """
+        Count the (protected group, label) cells of one chunk.
+
+        Args:
+            chunk: DataFrame batch holding the protected attributes and the label
+
+        Returns:
+            self, to allow chaining
+        """
+        cells = self._cell_ids(chunk, insert=True)
+        counted = cells[cells >= 0]
+        self.cell_counts_ = np.bincount(counted, minlength=len(self._lookup)).astype(np.int64) + np.pad(
+            self.cell_counts_, (0, len(self._lookup) - len(self.cell_counts_)))
+        self.n_rows_ += len(chunk)
+        self._weights = None
+        return self
+
+    def fit(self, data: Union[str, pd.DataFrame, Iterable[pd.DataFrame]],
+            chunksize: Optional[int] = None) -> "Reweighing":
+        """
+        Count the cells of a dataset (the first pass in streaming mode).
+
+        Args:
+            data: DataFrame, file path (CSV/Parquet/Feather/Arrow) or iterable of chunks
+            chunksize: Rows per chunk when reading a path or slicing a DataFrame
+
+        Returns:
+            self, to allow chaining
+        """
+        self._reset()
+        for chunk in self._chunks(data, chunksize):
+            self.partial_fit(chunk)
+        logger.info(f"⚖️ Reweighing fitted on {self.n_rows_} rows, {len(self._lookup)} cells")
+        return self
+
+    def _chunks(self, data: Union[str, pd.DataFrame, Iterable[pd.DataFrame]],
+                chunksize: Optional[int]) -> Iterable[pd.DataFrame]:
+        if isinstance(data, pd.DataFrame) and chunksize is None:
+            return [data]
+        if isinstance(data, (str, pd.DataFrame)):
+            return iter_chunks(data, chunksize or 1_000_000, columns=self.columns)
+        return data
+
+    def cell_weights(self) -> np.ndarray:
+        """Weight of every registered cell: P(group) P(label) / P(group, label)."""
+        if self._weights is None:
+            # Cells are few, so their group and label ids are assigned in Python
+            group_ids: Dict[Tuple[Any, ...], int] = {}
+            label_ids: Dict[Any, int] = {}
+            groups = np.array([group_ids.setdefault(key[:-1], len(group_ids)) for key in self._lookup], dtype=np.int64)
+            labels = np.array([label_ids.setdefault(key[-1], len(label_ids)) for key in self._lookup], dtype=np.int64)
+            counts = self.cell_counts_.astype(np.float64)
+            n_group = np.bincount(groups, weights=counts, minlength=len(group_ids))[groups]
+            n_label = np.bincount(labels, weights=counts, minlength=len(label_ids))[labels]
+            total = counts.sum()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                weights = n_group * n_label / (total * counts)
+            self._weights = np.where(counts > 0, weights, 1.0)
+        return self._weights
+
+    def weight_table(self) -> pd.DataFrame:
+        """
+        Fitted cells with their counts and weights.
+
+        Returns:
+            DataFrame with one column per protected attribute, the label,
+            'count' and 'weight'
+        """
+        table = pd.DataFrame(list(self._lookup.keys()), columns=self.columns)
+        table['count'] = self.cell_counts_
+        table['weight'] = self.cell_weights()
+        return table
+
+    def transform(self, chunk: pd.DataFrame, dtype: Any = np.float64) -> np.ndarray:
+        """
+        Weights of the rows of a chunk.
+
+        Rows with a missing protected value or label, or a cell unseen during
+        fit, get weight 1.0.
+
+        Args:
+            chunk: DataFrame batch holding the protected attributes and the label
+            dtype: Output dtype
+
+        Returns:
+            Array of weights aligned with the chunk rows
+        """
+        cells = self._cell_ids(chunk, insert=False)
+        weights = np.append(self.cell_weights(), 1.0).astype(dtype)
+        return weights[cells]  # -1 picks the trailing 1.0
 
     def compute_weights(self, df: pd.DataFrame) -> pd.Series:
         """
         Compute reweighing weights for each instance in the DataFrame.
         Returns a pandas Series of weights aligned with df.index.
         """
-        # Marginal probabilities
-        total = len(df)
-        p_prot = df[self.protected_attr].value_counts(normalize=True).to_dict()
-        p_label = df[self.label].value_counts(normalize=True).to_dict()
-
-        # Joint probabilities
-        joint = df.groupby([self.protected_attr, self.label]).size() / total
-
-        # Compute weights
-        def get_weight(row):
-            prot = row[self.protected_attr]
-            label = row[self.label]
-            # Marginal
-            p_a = p_prot.get(prot, 0)
-            p_y = p_label.get(label, 0)
-            # Joint
-            p_ay = joint.get((prot, label), 0)
-            if p_ay == 0:
-                return 1.0  # Avoid division by zero
-            return (p_a * p_y) / p_ay
-
-        weights = df.apply(get_weight, axis=1)
+        self.fit(df)
+        return pd.Series(self.transform(df), index=df.index)
+
+    def write_weights(self, data: Union[str, pd.DataFrame, Iterable[pd.DataFrame]],
+                      path: Optional[str] = None, chunksize: int = 1_000_000) -> np.ndarray:
+        """
+        Second streaming pass: write float32 weights for every row.
+
+        Args:
+            data: The data fit() counted, again as a path, DataFrame or iterable of chunks
+            path: Write a memory-mapped .npy file here (in-memory array if None)
+            chunksize: Rows per chunk when reading a path or slicing a DataFrame
+
+        Returns:
+            float32 array (np.memmap when path is given) of length n_rows_
+        """
+        if path is not None:
+            weights = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=(self.n_rows_,))
+        else:
+            weights = np.empty(self.n_rows_, dtype=np.float32)
+
+        start = 0
+        for chunk in self._chunks(data, chunksize):
+            if start + len(chunk) > self.n_rows_:
+                raise ValueError("More rows than were counted by fit(); pass the same data to both passes.")
+            weights[start:start + len(chunk)] = self.transform(chunk, dtype=np.float32)
+            start += len(chunk)
+        if start != self.n_rows_:
+            raise ValueError("Fewer rows than were counted by fit(); pass the same data to both passes.")
+        if path is not None:
+            weights.flush()
+            logger.info(f"💾 Wrote {self.n_rows_} reweighing weights to {path}")
         return weights
 
 # Example usage (not run):
 # rw = Reweighing('gender', 'outcome', privileged_value='male', unprivileged_value='female')
-# weights = rw.compute_weights(df) 
\ No newline at end of file
+# weights = rw.compute_weights(df)
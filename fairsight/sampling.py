@@ -0,0 +1,219 @@
+"""
+Fairsight Toolkit - Stratified Sampling
+=======================================
+
+One-pass stratified sampling for quick audits. Strata are the cells of
+protected attributes × target, so small groups are not lost. Every row gets
+a uniform random key. A stratum keeps the rows whose key falls below the
+sampling fraction, topped up with its lowest-keyed rows when that would leave
+fewer than ``min_per_stratum``. This is a per-stratum bottom-k reservoir, so
+chunks can be fed one at a time. Rows drawn with the same seed and a larger
+fraction always form a superset, so samples can be grown until the error
+bounds are tight enough.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from .encoding import factorize_keep_na
+
+logger = logging.getLogger(__name__)
+
+QUICK_SAMPLE_FRACTION = 0.1
+
+
+class StratifiedSample:
+    """
+    A drawn sample with design weights.
+
+    Attributes:
+        data: Sampled rows
+        positions: Row positions of the sample in the streamed input
+        stratum: Stratum code of every sampled row
+        weights: Design weight of every row (stratum size / stratum sample size)
+        strata: Stratum key (tuple of strata values) per stratum code
+        strata_sizes: Population row count per stratum code
+        sample_sizes: Sampled row count per stratum code
+    """
+
+    def __init__(self, data: pd.DataFrame, positions: np.ndarray, stratum: np.ndarray,
+                 strata: List[Tuple[Any, ...]], strata_sizes: np.ndarray):
+        self.data = data
+        self.positions = positions
+        self.stratum = stratum
+        self.strata = strata
+        self.strata_sizes = strata_sizes
+        self.sample_sizes = np.bincount(stratum, minlength=len(strata))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.weights = (strata_sizes / self.sample_sizes)[stratum]
+
+    @property
+    def population_size(self) -> int:
+        return int(self.strata_sizes.sum())
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def bootstrap_cells(self, cell_keys: List[np.ndarray], n_bootstrap: int,
+                        random_state: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Collapse the sample into cells and redraw them within strata.
+
+        Rows of a cell share their stratum and the given keys (e.g. label and
+        prediction), so any metric built from weighted counts is the same on
+        the cells as on the rows. Each replicate redraws every stratum's
+        sample as one multinomial draw over its cells, which is equivalent to
+        resampling rows within strata.
+
+        Args:
+            cell_keys: Per-row arrays that, together with the stratum, define a cell
+            n_bootstrap: Number of replicates
+            random_state: Seed for reproducible replicates
+
+        Returns:
+            Tuple of (a representative row position in self.data per cell,
+            point-estimate cell weights, replicate cell weights of shape
+            (n_bootstrap, n_cells))
+        """
+        keys = [self.stratum] + [factorize_keep_na(np.asarray(k))[0] for k in cell_keys]
+        cell_codes, representative, cell_of_row = np.unique(np.stack(keys, axis=1), axis=0,
+                                                            return_index=True, return_inverse=True)
+        cell_of_row = cell_of_row.ravel()
+        counts = np.bincount(cell_of_row, minlength=len(cell_codes))
+        cell_stratum = cell_codes[:, 0]
+        cell_weight = self.strata_sizes[cell_stratum] / self.sample_sizes[cell_stratum]
+
+        rng = np.random.default_rng(random_state)
+        replicates = np.zeros((n_bootstrap, len(cell_codes)))
+        for h in np.unique(cell_stratum):
+            cells = np.flatnonzero(cell_stratum == h)
+            replicates[:, cells] = rng.multinomial(self.sample_sizes[h], counts[cells] / self.sample_sizes[h],
+                                                   size=n_bootstrap)
+        return representative, counts * cell_weight, replicates * cell_weight
+
+
+class StratifiedSampler:
+    """
+    One-pass stratified sampler over chunks.
+
+    Example:
+        sampler = StratifiedSampler(["sex", "race", "label"], sample_fraction=0.01, random_state=0)
+        for chunk in pd.read_csv("applications.csv", chunksize=1_000_000):
+            sampler.update(chunk)
+        sample = sampler.sample()
+    """
+
+    def __init__(self, strata: List[str], sample_fraction: float = QUICK_SAMPLE_FRACTION,
+                 min_per_stratum: int = 30, random_state: Optional[int] = None):
+        """
+        Initialize StratifiedSampler.
+
+        Args:
+            strata: Columns whose value combinations define the strata
+            sample_fraction: Fraction of every stratum to sample
+            min_per_stratum: Minimum rows per stratum (all rows of smaller strata)
+            random_state: Seed; the same seed with a larger fraction gives a superset
+        """
+        if not 0 < sample_fraction <= 1:
+            raise ValueError("sample_fraction must be in (0, 1]")
+        self.strata_columns = list(strata)
+        self.sample_fraction = sample_fraction
+        self.min_per_stratum = min_per_stratum
+        self._rng = np.random.default_rng(random_state)
+        self._lookup: Dict[Tuple[Any, ...], int] = {}
+        self._sizes = np.zeros(0, dtype=np.int64)
+        self.n_rows = 0
+        self._kept: List[Tuple[pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]] = []
+        self._reserve: Optional[Tuple[pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def _stratum_codes(self, chunk: pd.DataFrame) -> np.ndarray:
+        # Mixed-radix combination of per-column codes, so no row tuples are built
+        combined = np.zeros(len(chunk), dtype=np.int64)
+        levels = []
+        for col in self.strata_columns:
+            codes, uniques = factorize_keep_na(chunk[col])
+            combined = combined * len(uniques) + codes
+            levels.append(uniques)
+        present, local = np.unique(combined, return_inverse=True)
+
+        mapping = np.empty(len(present), dtype=np.int64)
+        for i, code in enumerate(present):
+            key = []
+            for uniques in reversed(levels):
+                code, index = divmod(int(code), len(uniques))
+                value = uniques[index]
+                key.append(None if pd.isna(value) else value)
+            mapping[i] = self._lookup.setdefault(tuple(reversed(key)), len(self._lookup))
+        if len(self._lookup) > len(self._sizes):
+            self._sizes = np.concatenate([self._sizes, np.zeros(len(self._lookup) - len(self._sizes), dtype=np.int64)])
+        return mapping[local.ravel()]
+
+    def update(self, chunk: pd.DataFrame) -> "StratifiedSampler":
+        """
+        Feed one chunk of rows.
+
+        Args:
+            chunk: DataFrame batch
+
+        Returns:
+            self, to allow chaining
+        """
+        if len(chunk) == 0:
+            return self
+        stratum = self._stratum_codes(chunk)
+        keys = self._rng.random(len(chunk))
+        positions = np.arange(self.n_rows, self.n_rows + len(chunk))
+        self._sizes += np.bincount(stratum, minlength=len(self._sizes))
+        self.n_rows += len(chunk)
+
+        kept = keys < self.sample_fraction
+        if kept.any():
+            self._kept.append((chunk[kept], positions[kept], stratum[kept], keys[kept]))
+
+        # Lowest-keyed remaining rows per stratum, to top up small strata
+        rest = ~kept
+        candidates = [(chunk[rest], positions[rest], stratum[rest], keys[rest])]
+        if self._reserve is not None:
+            candidates.insert(0, self._reserve)
+        data = pd.concat([c[0] for c in candidates])
+        pos, strat, key = (np.concatenate([c[i] for c in candidates]) for i in (1, 2, 3))
+        order = np.lexsort((key, strat))
+        first = np.searchsorted(strat[order], strat[order], side='left')
+        keep = order[(np.arange(len(order)) - first) < self.min_per_stratum]
+        self._reserve = (data.iloc[keep], pos[keep], strat[keep], key[keep])
+        return self
+
+    def sample(self) -> StratifiedSample:
+        """
+        Draw the sample from everything fed so far.
+
+        Returns:
+            StratifiedSample with design weights
+        """
+        parts = list(self._kept)
+        kept_sizes = np.bincount(np.concatenate([p[2] for p in parts]) if parts else np.zeros(0, dtype=np.int64),
+                                 minlength=len(self._sizes))
+        if self._reserve is not None:
+            data, pos, strat, key = self._reserve
+            order = np.lexsort((key, strat))
+            first = np.searchsorted(strat[order], strat[order], side='left')
+            needed = self.min_per_stratum - kept_sizes[strat[order]]
+            top_up = order[(np.arange(len(order)) - first) < needed]
+            parts.append((data.iloc[top_up], pos[top_up], strat[top_up], key[top_up]))
+
+        parts = [p for p in parts if len(p[1])]
+        if not parts:
+            raise ValueError("No rows have been sampled; call update() first.")
+        positions = np.concatenate([p[1] for p in parts])
+        order = np.argsort(positions, kind='stable')
+        data = pd.concat([p[0] for p in parts]).iloc[order]
+        stratum = np.concatenate([p[2] for p in parts])[order]
+
+        strata = [None] * len(self._lookup)
+        for key, code in self._lookup.items():
+            strata[code] = key
+        sample = StratifiedSample(data, positions[order], stratum, strata, self._sizes.copy())
+        logger.info(f"🎯 Stratified sample: {len(sample)} of {self.n_rows} rows across {len(strata)} strata")
+        return sample
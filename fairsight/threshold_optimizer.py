@@ -0,0 +1,212 @@
+"""
+Fairsight Toolkit - Group Threshold Optimizer
+=============================================
+
+Post-processing mitigation: one decision threshold per protected group,
+chosen to satisfy demographic parity or equalized odds while maximizing
+accuracy or a custom utility.
+
+The search runs on ThresholdCurves, so the scores are sorted once and no
+model is re-run. Each group's candidate thresholds are its distinct scores,
+thinned to at most ``max_thresholds`` quantile-spaced values. The fairness
+constraints compare each group to the privileged group, as FairnessMetrics
+does. Once the privileged threshold is fixed, every other group is therefore
+optimized on its own: the search is a batched (privileged candidates × group
+candidates) evaluation per group rather than a search over all combinations.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional, Tuple, Union
+import logging
+
+from .fairness_metrics import FairnessMetrics, FairnessResult, ThresholdCurves, rates_from_confusion
+
+logger = logging.getLogger(__name__)
+
+THRESHOLD_CONSTRAINTS = ("demographic_parity", "equalized_odds")
+
+# Objective weights of the (tp, fp, fn, tn) cells
+ACCURACY_UTILITY = {"tp": 1.0, "fp": 0.0, "fn": 0.0, "tn": 1.0}
+
+
+class GroupThresholdOptimizer:
+    """
+    Per-group decision thresholds under a fairness constraint.
+
+    Example:
+        optimizer = GroupThresholdOptimizer(constraint="equalized_odds")
+        optimizer.fit(y_true, y_prob, df["sex"], privileged_group="M")
+        y_pred = optimizer.predict(y_prob, df["sex"])
+    """
+
+    def __init__(self,
+                 constraint: str = "demographic_parity",
+                 utility: Optional[Dict[str, float]] = None,
+                 fairness_threshold: float = 0.8,
+                 max_thresholds: int = 512):
+        """
+        Initialize GroupThresholdOptimizer.
+
+        Args:
+            constraint: "demographic_parity" (positive-rate ratio to the
+                privileged group within [fairness_threshold, 1 / fairness_threshold])
+                or "equalized_odds" (TPR and FPR differences to the privileged
+                group within 1 - fairness_threshold)
+            utility: Gain of each confusion cell, e.g. {"tp": 1, "fp": -5};
+                missing cells count 0 (accuracy if None)
+            fairness_threshold: Fairness threshold (80% rule by default)
+            max_thresholds: Candidate thresholds per group
+        """
+        if constraint not in THRESHOLD_CONSTRAINTS:
+            raise ValueError(f"constraint must be one of {THRESHOLD_CONSTRAINTS}")
+        self.constraint = constraint
+        self.utility = dict(utility) if utility is not None else dict(ACCURACY_UTILITY)
+        self.fairness_threshold = fairness_threshold
+        self.max_thresholds = max_thresholds
+        self.thresholds_: Optional[Dict[Any, float]] = None
+        self.confusion_: Optional[np.ndarray] = None
+        self.group_values_: Optional[np.ndarray] = None
+        self.privileged_group_: Any = None
+        self.constraint_satisfied_: Optional[bool] = None
+
+    def _candidates(self, curves: ThresholdCurves, group: int) -> np.ndarray:
+        """Thinned distinct scores of one group, plus +inf (nobody positive)."""
+        scores = np.unique(curves.scores[group])
+        if len(scores) > self.max_thresholds - 1:
+            scores = scores[np.unique(np.linspace(0, len(scores) - 1, self.max_thresholds - 1).astype(int))]
+        return np.append(scores, np.inf)
+
+    def _group_tables(self, curves: ThresholdCurves, group: int) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Candidate thresholds of a group with their confusion tables and rates."""
+        thresholds = self._candidates(curves, group)
+        confusion = curves.confusion(thresholds)[:, group]
+        return thresholds, confusion, rates_from_confusion(confusion)
+
+    def _violation(self, privileged: Dict[str, np.ndarray], group: Dict[str, np.ndarray]) -> np.ndarray:
+        """Constraint violation of every (privileged candidate, group candidate) pair."""
+        if self.constraint == "demographic_parity":
+            reference = privileged["positive_rate"][:, None]
+            rate = group["positive_rate"][None, :]
+            return np.maximum.reduce([
+                np.zeros(np.broadcast_shapes(reference.shape, rate.shape)),
+                self.fairness_threshold * reference - rate,
+                rate - reference / self.fairness_threshold
+            ])
+        tolerance = 1 - self.fairness_threshold
+        return np.maximum.reduce([
+            np.zeros((len(privileged["size"]), len(group["size"]))),
+            np.abs(group["true_positive_rate"][None, :] - privileged["true_positive_rate"][:, None]) - tolerance,
+            np.abs(group["false_positive_rate"][None, :] - privileged["false_positive_rate"][:, None]) - tolerance
+        ])
+
+    def fit_curves(self, curves: ThresholdCurves, privileged_group: Union[int, str]) -> "GroupThresholdOptimizer":
+        """
+        Choose the thresholds from precomputed score curves.
+
+        Args:
+            curves: ThresholdCurves of the protected attribute
+            privileged_group: Value of the privileged group
+
+        Returns:
+            self, to allow chaining
+        """
+        matches = np.flatnonzero(curves.group_values == privileged_group)
+        if len(matches) == 0:
+            raise ValueError(f"Privileged group {privileged_group!r} not found in protected attribute.")
+        p = int(matches[0])
+        weights = np.array([self.utility.get(cell, 0.0) for cell in ("tp", "fp", "fn", "tn")])
+
+        p_thresholds, p_confusion, p_rates = self._group_tables(curves, p)
+        total_violation = np.zeros(len(p_thresholds))
+        total_utility = p_confusion @ weights
+        choices = {}
+        for g in range(len(curves.group_values)):
+            if g == p:
+                continue
+            thresholds, confusion, rates = self._group_tables(curves, g)
+            violation = self._violation(p_rates, rates)
+            # Least violating candidates first (exactly feasible when possible), then the best utility
+            least = violation.min(axis=1)
+            utility = np.where(violation <= least[:, None] + 1e-12, (confusion @ weights)[None, :], -np.inf)
+            best = np.argmax(utility, axis=1)
+            total_violation += least
+            total_utility += utility[np.arange(len(p_thresholds)), best]
+            choices[g] = (thresholds, best)
+
+        feasible = total_violation <= total_violation.min() + 1e-12
+        chosen = int(np.argmax(np.where(feasible, total_utility, -np.inf)))
+        group_thresholds = np.empty(len(curves.group_values))
+        group_thresholds[p] = p_thresholds[chosen]
+        for g, (thresholds, best) in choices.items():
+            group_thresholds[g] = thresholds[best[chosen]]
+
+        self.group_values_ = curves.group_values
+        self.privileged_group_ = curves.group_values[p]
+        self.thresholds_ = {value: float(t) for value, t in zip(curves.group_values, group_thresholds)}
+        self.confusion_ = curves.confusion(group_thresholds, per_group=True)
+        self.constraint_satisfied_ = bool(total_violation[chosen] <= 1e-12)
+        if not self.constraint_satisfied_:
+            logger.warning(f"⚠️ No thresholds satisfy {self.constraint}; using the least violating ones")
+        logger.info(f"🎚️ Group thresholds for {self.constraint}: {self.thresholds_}")
+        return self
+
+    def fit(self,
+            y_true: Union[np.ndarray, pd.Series],
+            y_prob: Union[np.ndarray, pd.Series],
+            groups: Union[np.ndarray, pd.Series],
+            privileged_group: Union[int, str],
+            positive_label: Union[int, str] = 1,
+            sample_weight: Optional[Union[np.ndarray, pd.Series]] = None) -> "GroupThresholdOptimizer":
+        """
+        Choose the thresholds from scored rows.
+
+        Args:
+            y_true: True labels
+            y_prob: Predicted probabilities of the positive label
+            groups: Protected attribute value of each row
+            privileged_group: Value of the privileged group
+            positive_label: Label treated as the positive outcome
+            sample_weight: Row weights; rates and utility are then weighted (optional)
+
+        Returns:
+            self, to allow chaining
+        """
+        curves = ThresholdCurves.from_arrays(y_true, y_prob, groups, positive_label, sample_weight)
+        return self.fit_curves(curves, privileged_group)
+
+    def predict(self, y_prob: Union[np.ndarray, pd.Series], groups: Union[np.ndarray, pd.Series]) -> np.ndarray:
+        """
+        Apply the group thresholds.
+
+        Args:
+            y_prob: Predicted probabilities of the positive label
+            groups: Protected attribute value of each row
+
+        Returns:
+            0/1 predictions (groups unseen during fit keep the privileged threshold)
+        """
+        if self.thresholds_ is None:
+            raise ValueError("GroupThresholdOptimizer is not fitted; call fit() first.")
+        index = pd.Index(self.group_values_).get_indexer(np.asarray(groups))
+        thresholds = np.array(list(self.thresholds_.values()))
+        row_thresholds = np.where(index >= 0, thresholds[np.maximum(index, 0)], self.thresholds_[self.privileged_group_])
+        return (np.asarray(y_prob, dtype=float) >= row_thresholds).astype(int)
+
+    def fairness_results(self, fairness_threshold: Optional[float] = None
+                         ) -> Dict[str, Union[FairnessResult, Dict[str, FairnessResult]]]:
+        """
+        Fairness metrics at the fitted thresholds, from the cached confusion tables.
+
+        Args:
+            fairness_threshold: Threshold for the reported checks (the optimizer's if None)
+
+        Returns:
+            Output of FairnessMetrics.compute_all_metrics()
+        """
+        if self.confusion_ is None:
+            raise ValueError("GroupThresholdOptimizer is not fitted; call fit() first.")
+        return FairnessMetrics.from_group_statistics(
+            self.group_values_, self.confusion_, privileged_group=self.privileged_group_,
+            fairness_threshold=fairness_threshold or self.fairness_threshold
+        ).compute_all_metrics()
@@ -10,14 +10,19 @@ import pandas as pd
 import numpy as np
 from typing import List, Dict, Any, Union, Optional, Tuple
 import logging
-from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 import warnings
+from .encoding import CategoryEncoder, EncoderRegistry
+from .profile import column_profile
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# DataFrame.attrs key under which optimize_dtypes() records its savings
+MEMORY_OPTIMIZATION_ATTR = "fairsight_memory_optimization"
+
 class Utils:
     """Utility class containing helper functions for the Fairsight toolkit."""
 
@@ -114,28 +119,45 @@ class Utils:
             if isinstance(y, np.ndarray):
                 y = pd.Series(y)
 
-            # Check data type
+            # Check data type before counting unique values
             if y.dtype == 'object' or y.dtype.name == 'category':
                 return True
 
-            # Check number of unique values
-            unique_values = y.nunique()
-            total_values = len(y)
-
-            # If less than 20 unique values or less than 5% unique, likely classification
-            if unique_values < 20 or (unique_values / total_values) < 0.05:
-                return True
-
-            # Check if all values are integers
-            if y.dtype in ['int64', 'int32', 'int16', 'int8']:
-                return True
-
-            return False
+            profile = column_profile(y)
+            return Utils.is_classification_counts(profile.dtype, profile.n_unique, profile.count)
 
         except Exception as e:
             logger.error(f"Error determining task type: {e}")
             return True  # Default to classification
 
+    @staticmethod
+    def is_classification_counts(dtype: Any, unique_values: Optional[int], total_values: int) -> bool:
+        """
+        Classification check from summary counts, for targets seen in chunks.
+
+        Args:
+            dtype: Target dtype
+            unique_values: Number of distinct target values (None if too many to track)
+            total_values: Number of target values
+
+        Returns:
+            bool: True if classification, False if regression
+        """
+        dtype = np.dtype(dtype) if not hasattr(dtype, 'name') else dtype
+        if dtype == 'object' or dtype.name == 'category':
+            return True
+
+        # If less than 20 unique values or less than 5% unique, likely classification
+        if unique_values is not None and total_values and (
+                unique_values < 20 or (unique_values / total_values) < 0.05):
+            return True
+
+        # Check if all values are integers
+        if dtype in ['int64', 'int32', 'int16', 'int8']:
+            return True
+
+        return False
+
     @staticmethod
     def is_regression_task(y: Union[pd.Series, np.ndarray]) -> bool:
         """
@@ -153,7 +175,8 @@ class Utils:
     def preprocess_data(df: pd.DataFrame, 
                        target_column: str,
                        protected_attributes: List[str],
-                       justified_attributes: Optional[List[str]] = None) -> Tuple[pd.DataFrame, Dict[str, LabelEncoder]]:
+                       justified_attributes: Optional[List[str]] = None,
+                       encoders: Optional[EncoderRegistry] = None) -> Tuple[pd.DataFrame, Dict[str, CategoryEncoder]]:
         """
         Preprocess dataset for fairness analysis.
 
@@ -162,13 +185,15 @@ class Utils:
             target_column: Name of target column
             protected_attributes: List of protected attributes
             justified_attributes: List of justified attributes (won't be flagged for bias)
+            encoders: Registry of categorical encoders to reuse (and extend);
+                a fresh one is used if None
 
         Returns:
-            Tuple of processed DataFrame and label encoders dict
+            Tuple of processed DataFrame and the encoders of its categorical columns
         """
         try:
             df_processed = df.copy()
-            label_encoders = {}
+            encoders = encoders if encoders is not None else EncoderRegistry()
 
             # Handle missing values
             for col in df_processed.columns:
@@ -178,11 +203,9 @@ class Utils:
                     df_processed[col] = df_processed[col].fillna(df_processed[col].median())
 
             # Encode categorical variables
-            categorical_cols = df_processed.select_dtypes(include=['object', 'category']).columns
-
-            for col in categorical_cols:
-                label_encoders[col] = LabelEncoder()
-                df_processed[col] = label_encoders[col].fit_transform(df_processed[col].astype(str))
+            categorical_cols = df_processed.select_dtypes(include=['object', 'category']).columns.tolist()
+            encoders.encode_frame(df_processed, categorical_cols)
+            label_encoders = {col: encoders[col] for col in categorical_cols}
 
             # Log justified attributes if provided
             if justified_attributes:
@@ -214,8 +237,8 @@ class Utils:
             if attr not in df.columns:
                 continue
 
-            # Get value counts
-            value_counts = df[attr].value_counts()
+            # Get value counts (shared with the other stages through the profile cache)
+            value_counts = column_profile(df[attr]).value_counts
 
             # For binary attributes, assume majority is privileged
             if len(value_counts) == 2:
@@ -266,9 +289,10 @@ class Utils:
             df: Input DataFrame
 
         Returns:
-            Dict containing summary statistics
+            Dict containing summary statistics; frames passed through
+            optimize_dtypes() also report the bytes saved
         """
-        return {
+        stats = {
             'rows': len(df),
             'columns': len(df.columns),
             'missing_values': df.isnull().sum().sum(),
@@ -276,12 +300,88 @@ class Utils:
             'categorical_columns': len(df.select_dtypes(include=['object', 'category']).columns),
             'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024 / 1024
         }
+        optimization = df.attrs.get(MEMORY_OPTIMIZATION_ATTR)
+        if optimization:
+            stats['memory_optimization'] = optimization
+            stats['memory_saved_bytes'] = optimization['bytes_saved']
+        return stats
+
+    @staticmethod
+    def optimize_dtypes(df: pd.DataFrame,
+                        categorical_columns: Optional[List[str]] = None,
+                        max_category_ratio: float = 0.5,
+                        nullable: bool = False) -> pd.DataFrame:
+        """
+        Shrink a DataFrame's memory footprint without changing its values.
+
+        Integers are downcast to the smallest signed type holding their
+        range, and floats to float32 where every value survives the round
+        trip. String columns with few distinct values become ``category``.
+        The input is not modified; unchanged columns are shared with it.
+
+        Args:
+            df: Input DataFrame
+            categorical_columns: Columns always converted to category
+                (e.g. protected attributes)
+            max_category_ratio: Convert other string columns when distinct
+                values / non-missing values is at most this
+            nullable: Store integer-valued float columns with missing values
+                as nullable Int8/Int16/... (missing becomes pd.NA)
+
+        Returns:
+            Optimized DataFrame; the bytes saved are recorded in its attrs and
+            reported by create_summary_stats()
+        """
+        categorical_columns = set(categorical_columns or [])
+        memory_before = df.memory_usage(index=False, deep=True)
+        optimized = df.copy(deep=False)
+        converted = {}
+
+        for col in df.columns:
+            values = df[col]
+            dtype = values.dtype
+            new = None
+            if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+                continue
+            if pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype):
+                new = pd.to_numeric(values, downcast='integer')
+            elif pd.api.types.is_float_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype):
+                array = values.to_numpy()
+                observed = ~np.isnan(array)
+                if nullable and not observed.all() and np.array_equal(array[observed], np.round(array[observed])):
+                    new = pd.to_numeric(values.astype('Int64'), downcast='integer')
+                elif dtype != np.float32:
+                    with np.errstate(over='ignore', invalid='ignore'):
+                        narrowed = array.astype(np.float32)
+                    if np.array_equal(narrowed, array, equal_nan=True):
+                        new = pd.Series(narrowed, index=values.index, name=col)
+            elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+                n_observed = int(values.notna().sum())
+                n_unique = values.nunique(dropna=True)
+                if col in categorical_columns or (n_observed and n_unique / n_observed <= max_category_ratio):
+                    new = values.astype('category')
+
+            if new is not None and new.dtype != dtype:
+                optimized[col] = new
+                converted[col] = {'from': str(dtype), 'to': str(new.dtype)}
+
+        memory_after = optimized.memory_usage(index=False, deep=True)
+        bytes_before, bytes_after = int(memory_before.sum()), int(memory_after.sum())
+        optimized.attrs[MEMORY_OPTIMIZATION_ATTR] = {
+            'bytes_before': bytes_before,
+            'bytes_after': bytes_after,
+            'bytes_saved': bytes_before - bytes_after,
+            'converted_columns': converted
+        }
+        logger.info(f"🗜️ Optimized dtypes of {len(converted)} columns: "
+                    f"{bytes_before / 1024 / 1024:.1f} MB → {bytes_after / 1024 / 1024:.1f} MB")
+        return optimized
 
-def preprocess_data(df, target_column, protected_attributes, justified_attributes=None):
+def preprocess_data(df, target_column, protected_attributes, justified_attributes=None, encoders=None):
     """
     Standalone wrapper for Utils.preprocess_data.
     """
-    return Utils.preprocess_data(df, target_column, protected_attributes, justified_attributes)
+    return Utils.preprocess_data(df, target_column, protected_attributes, justified_attributes, encoders)
 
 def calculate_privilege_groups(df, protected_attributes):
     """
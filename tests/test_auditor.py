@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
+from unittest.mock import patch
 from fairsight import FSAuditor, Auditor, TieredAccessError, APIKeyVerificationError
+from fairsight import Utils
+from fairsight.audit_frame import AuditFrame
 
 # def test_fsauditor_basic_features_free():
 #     """Test that basic FSAuditor features work without API key (FREE)."""
@@ -35,6 +38,90 @@ from fairsight import FSAuditor, Auditor, TieredAccessError, APIKeyVerificationE
 #         print(f"❌ Basic features failed: {e}")
 #         raise
 
+def test_fsauditor_stages_share_one_audit_frame(tmp_path):
+    """Dataset stages parse the CSV once and never modify the shared frame."""
+    csv_path = tmp_path / 'data.csv'
+    pd.DataFrame({
+        'category': ['A', 'B', 'A', 'B', 'A', 'B'],
+        'intent': [1, 0, 1, 0, 1, 0],
+        'feature': [10, 20, 10, 30, 15, 25]
+    }).to_csv(csv_path, index=False)
+
+    auditor = FSAuditor(dataset=str(csv_path), sensitive_features=['category'], target='intent')
+    with patch('pandas.read_csv', wraps=pd.read_csv) as read_csv:
+        dataset_results = auditor.run_dataset_audit()
+        bias_results = auditor.run_comprehensive_bias_detection()
+    assert read_csv.call_count == 1
+    assert 'error' not in dataset_results and 'error' not in bias_results
+
+    frame = auditor.audit_frame
+    assert isinstance(frame, AuditFrame)
+    # Label encoding ran on the auditor's view, not on the shared data
+    assert frame.frame['category'].tolist() == ['A', 'B', 'A', 'B', 'A', 'B']
+    assert dataset_results['dataset_info']['source'] == str(csv_path)
+
+    view = frame.view(extra={'predictions': np.ones(len(frame))})
+    assert 'predictions' not in frame.columns
+    assert np.shares_memory(view['feature'].to_numpy(), frame.array('feature'))
+
+def test_fsauditor_streams_when_over_memory_budget(tmp_path):
+    rng = np.random.default_rng(6)
+    df = pd.DataFrame({
+        'gender': rng.choice(['F', 'M'], 20000),
+        'age': rng.integers(18, 90, 20000),
+        'income': rng.normal(size=20000).round(1),
+        'approved': rng.integers(0, 2, 20000)
+    })
+    df.to_parquet(tmp_path / 'data.parquet')
+    expected = FSAuditor(dataset=df, sensitive_features=['gender'], target='approved')
+
+    auditor = FSAuditor(dataset=str(tmp_path / 'data.parquet'), sensitive_features=['gender'],
+                        target='approved', max_memory='256KB')
+    assert 1000 <= auditor.chunksize < len(df)
+    with patch('pandas.read_csv') as read_csv, patch('pyarrow.parquet.read_table') as read_table:
+        dataset_results = auditor.run_dataset_audit()
+        bias_results = auditor.run_comprehensive_bias_detection()
+    assert not read_csv.called and not read_table.called and auditor._audit_frame is None
+    assert dataset_results['data_quality']['basic_statistics']['rows'] == len(df)
+    assert ([r['value'] for r in bias_results['detailed_results']]
+            == [r['value'] for r in expected.run_comprehensive_bias_detection()['detailed_results']])
+
+    optimized = FSAuditor(dataset=df, sensitive_features=['gender'], target='approved', optimize_memory=True)
+    frame = optimized.audit_frame.frame
+    assert frame['gender'].dtype == 'category' and frame['age'].dtype == np.int8
+    assert frame['income'].dtype == np.float64  # float32 would change the values
+    stats = Utils.create_summary_stats(frame)
+    assert stats['memory_saved_bytes'] > df.memory_usage(deep=True).sum() / 2
+
+def test_fsauditor_model_audit_reads_only_holdout_when_over_budget(tmp_path):
+    from sklearn.linear_model import LogisticRegression
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        'gender': rng.integers(0, 2, 5000),
+        'age': rng.integers(18, 90, 5000),
+        'income': rng.normal(size=5000).round(1),
+        'notes': rng.choice(['a', 'b', 'c'], 5000),
+        'approved': rng.integers(0, 2, 5000)
+    })
+    df.to_parquet(tmp_path / 'data.parquet')
+    model = LogisticRegression().fit(df[['gender', 'age', 'income']], df['approved'])
+    expected = FSAuditor(dataset=df, model=model, sensitive_features=['gender'], target='approved').run_model_audit()
+
+    auditor = FSAuditor(dataset=str(tmp_path / 'data.parquet'), model=model, sensitive_features=['gender'],
+                        target='approved', max_memory='64KB')
+    with patch('pandas.read_csv') as read_csv, patch('pyarrow.parquet.read_table') as read_table:
+        results = auditor.run_model_audit()
+    assert not read_csv.called and not read_table.called and auditor._audit_frame is None
+    assert 'error' not in results
+    assert results['performance_metrics'] == expected['performance_metrics']
+    assert results['model_info']['test_data_shape'] == (1000, 3)
+
+    # Without recorded feature names the stage is skipped instead of loading everything
+    unnamed = LogisticRegression().fit(df[['gender', 'age', 'income']].to_numpy(), df['approved'])
+    skipped = FSAuditor(dataset=str(tmp_path / 'data.parquet'), model=unnamed, sensitive_features=['gender'],
+                        target='approved', max_memory='64KB')
+    assert 'feature_names_in_' in skipped.run_model_audit()['error'] and skipped._audit_frame is None
+
 def test_fsauditor_premium_features_without_key():
     """Test that premium FSAuditor features require API key."""
     print("\n🔒 Testing Premium FSAuditor Features (API Key Required)...")
@@ -1,7 +1,9 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
 import pandas as pd
+import pytest
 from fairsight import BiasDetector, detect_dataset_bias
 
 def demo_bias_detection():
@@ -12,6 +14,126 @@ def demo_bias_detection():
     print('BiasDetector results:', detector.detect_bias_on_dataset())
     print('detect_dataset_bias results:', detect_dataset_bias(df, ['category'], 'intent'))
 
+def test_model_prediction_metrics_match_group_masks():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        'sex': rng.integers(0, 3, 400),
+        'label': rng.integers(0, 2, 400),
+        'pred': rng.integers(0, 2, 400)
+    })
+    detector = BiasDetector(dataset=df, sensitive_features=['sex'], target='label',
+                            privileged_values={'sex': 1})
+    results = {r.metric_name: r for r in detector.detect_bias_on_model_predictions(df, 'pred', 'label')}
+
+    priv, unpriv = df[df['sex'] == 1], df[df['sex'] != 1]
+    def tpr(g):
+        return ((g['pred'] == 1) & (g['label'] == 1)).sum() / (g['label'] == 1).sum()
+    def fpr(g):
+        return ((g['pred'] == 1) & (g['label'] == 0)).sum() / (g['label'] == 0).sum()
+    def ppv(g):
+        return ((g['pred'] == 1) & (g['label'] == 1)).sum() / (g['pred'] == 1).sum()
+
+    assert np.isclose(results['Disparate Impact'].value, unpriv['pred'].mean() / priv['pred'].mean())
+    assert results['Disparate Impact'].details['privileged_count'] == len(priv)
+    assert np.isclose(results['Statistical Parity Difference'].value, unpriv['pred'].mean() - priv['pred'].mean())
+    assert np.isclose(results['Equal Opportunity Difference'].value, tpr(unpriv) - tpr(priv))
+    assert np.isclose(results['Predictive Parity Difference'].value, ppv(unpriv) - ppv(priv))
+    assert np.isclose(results['Equalized Odds (FPR)'].value, fpr(unpriv) - fpr(priv))
+
+def test_sample_weight_matches_replicated_rows():
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({
+        'sex': rng.choice(['F', 'M'], 600),
+        'label': rng.integers(0, 2, 600),
+        'w': rng.integers(1, 4, 600)
+    })
+    replicated = df.loc[df.index.repeat(df['w'])].reset_index(drop=True)
+    expected = BiasDetector(dataset=replicated, sensitive_features=['sex'], target='label',
+                            privileged_values={'sex': 'M'}).detect()
+    for kwargs in ({}, {'chunksize': 250}):
+        for weights in ('w', df['w'].to_numpy()):
+            detector = BiasDetector(dataset=df, sensitive_features=['sex'], target='label',
+                                    privileged_values={'sex': 'M'}, sample_weight=weights, **kwargs)
+            for result, reference in zip(detector.detect(), expected):
+                assert np.isclose(result.value, reference.value)
+
+    # Public helpers fall back to the detector's weights
+    detector = BiasDetector(dataset=df, sensitive_features=['sex'], target='label',
+                            privileged_values={'sex': 'M'}, sample_weight='w')
+    for result, reference in zip(detector.detect_bias_on_dataset(), expected):
+        assert np.isclose(result.value, reference.value)
+
+    with pytest.raises(ValueError, match='sample_weight'):
+        BiasDetector(dataset=df, sensitive_features=['sex'], target='label', sample_weight=df['w'].to_numpy()[:150])
+    with pytest.raises(ValueError, match='sample_weight'):
+        BiasDetector(dataset=df, sensitive_features=['sex'], target='label', chunksize=250,
+                     sample_weight=df['w'].to_numpy()[:550]).detect()
+
+def test_columnar_inputs_project_and_filter(tmp_path):
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({f'unused_{i}': rng.normal(size=300) for i in range(10)})
+    df['sex'] = rng.integers(0, 2, 300)
+    df['year'] = rng.integers(2015, 2025, 300)
+    df['label'] = rng.integers(0, 2, 300)
+    df.to_parquet(tmp_path / 'data.parquet')
+    df.to_feather(tmp_path / 'data.feather')
+
+    expected = BiasDetector(dataset=df[df['year'] >= 2020], sensitive_features=['sex'], target='label',
+                            privileged_values={'sex': 1}).detect_bias_on_dataset()
+    for name in ('data.parquet', 'data.feather'):
+        detector = BiasDetector(dataset=str(tmp_path / name), sensitive_features=['sex'], target='label',
+                                privileged_values={'sex': 1}, filters=[('year', '>=', 2020)])
+        assert list(detector.dataset.columns) == ['sex', 'label']
+        assert len(detector.dataset) == (df['year'] >= 2020).sum()
+        assert [r.value for r in detector.detect_bias_on_dataset()] == [r.value for r in expected]
+
+def test_chunked_detect_counts_missing_attribute_values():
+    rng = np.random.default_rng(6)
+    df = pd.DataFrame({'sex': rng.choice(['F', 'M', None], 900), 'label': rng.integers(0, 2, 900)})
+    full = BiasDetector(dataset=df, sensitive_features=['sex'], target='label',
+                        privileged_values={'sex': 'M'}).detect()
+    chunked = BiasDetector(dataset=df, sensitive_features=['sex'], target='label',
+                           privileged_values={'sex': 'M'}, chunksize=200).detect()
+    for result, reference in zip(chunked, full):
+        assert np.isclose(result.value, reference.value)
+    # Missing values fall in the unprivileged group, as in memory
+    assert chunked[0].details['unprivileged_count'] == full[0].details['unprivileged_count'] == (df['sex'] != 'M').sum()
+
+def test_stratified_sampler_keeps_missing_values_as_a_stratum():
+    from fairsight import StratifiedSampler
+    df = pd.DataFrame({'sex': ['F', None, 'M', np.nan] * 50, 'label': [0, 1] * 100})
+    sampler = StratifiedSampler(['sex', 'label'], 0.2, random_state=0)
+    sampler.update(df.iloc[:120]).update(df.iloc[120:])
+    sample = sampler.sample()
+    assert sorted(sample.strata, key=str) == [('F', 0), ('M', 0), (None, 1)]
+    _, weights, _ = sample.bootstrap_cells([sample.data['sex'].to_numpy()], 3, 0)
+    assert weights.sum() == sample.population_size == len(df)
+
+def test_quick_detect_reports_intervals_and_grows_sample():
+    from sklearn.linear_model import LogisticRegression
+    rng = np.random.default_rng(11)
+    n = 60000
+    sex = rng.integers(0, 2, n)
+    x = rng.normal(size=n) + 0.5 * sex
+    df = pd.DataFrame({'sex': sex, 'x': x, 'label': (x + rng.normal(size=n) > 0.3).astype(int)})
+    model = LogisticRegression().fit(df[['sex', 'x']], df['label'])
+
+    def detector():
+        return BiasDetector(dataset=df, model=model, sensitive_features=['sex'], target='label',
+                            privileged_values={'sex': 1})
+    full = detector().detect()
+    quick = detector().detect(sample_fraction=0.05, random_state=0)
+
+    assert [r.metric_name for r in quick] == [r.metric_name for r in full]
+    for expected, result in zip(full, quick):
+        low, high = result.details['confidence_interval']['value']
+        assert result.details['sample_size'] < n and result.details['population_size'] == n
+        assert low - 0.02 <= expected.value <= high + 0.02
+
+    grown = detector().detect(sample_fraction=0.01, target_half_width=0.02, random_state=0)
+    assert grown[0].details['sample_size'] > quick[0].details['sample_size'] / 5
+    assert all(np.diff(r.details['confidence_interval']['value'])[0] / 2 <= 0.02 for r in grown)
+
 if __name__ == '__main__':
     print('--- Demo: Bias Detection ---')
     demo_bias_detection() 
\ No newline at end of file
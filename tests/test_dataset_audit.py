@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 import pandas as pd
 from fairsight import DatasetAuditor
 
@@ -15,6 +17,161 @@ def demo_dataset_auditor():
     print('Fairness Metrics:', auditor.compute_fairness_metrics())
     print('Statistical Report:', auditor.generate_statistical_report())
 
+def test_chunked_audit_matches_in_memory_counts(tmp_path):
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame({
+        'age': rng.integers(18, 80, 3000).astype(float),
+        'sex': rng.choice(['M', 'F'], 3000),
+        'income': rng.normal(50, 10, 3000).round(1),
+        'label': rng.integers(0, 2, 3000)
+    })
+    df.loc[rng.choice(3000, 150, replace=False), 'age'] = np.nan
+    df = pd.concat([df, df.iloc[:250]], ignore_index=True)
+    df.to_csv(tmp_path / 'data.csv', index=False)
+
+    exact = DatasetAuditor(dataset=str(tmp_path / 'data.csv'), protected_attributes=['sex'],
+                           target_column='label', chunksize=400).audit()
+    quality = exact['data_quality']
+    assert exact['dataset_info']['original_shape'] == df.shape
+    assert quality['duplicate_analysis']['duplicate_rows'] == df.duplicated().sum()
+    assert quality['missing_analysis']['columns_with_missing'] == {'age': df['age'].isnull().sum()}
+    assert quality['protected_attribute_distributions']['sex'] == df['sex'].value_counts().to_dict()
+    assert quality['target_distribution'] == df['label'].value_counts().to_dict()
+    assert np.isclose(exact['statistical_analysis']['descriptive_statistics']['income']['std'], df['income'].std())
+
+    rates = df.groupby('sex')['label'].mean()
+    privileged = df['sex'].mode().iloc[0]
+    spd = [r for r in exact['bias_detection'] if r['metric_name'] == 'Statistical Parity Difference'][0]
+    assert np.isclose(spd['value'], rates.drop(privileged).iloc[0] - rates[privileged])
+
+    approximate = DatasetAuditor(dataset=df, protected_attributes=['sex'], target_column='label',
+                                 chunksize=400, duplicate_strategy='approximate').analyze_data_quality()
+    assert abs(approximate['duplicate_analysis']['duplicate_rows'] - df.duplicated().sum()) <= 0.02 * len(df)
+
+def test_blockwise_correlations_match_pandas():
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame(rng.normal(size=(1200, 40)), columns=[f'f{i}' for i in range(40)])
+    df['f1'] = 0.9 * df['f0'] + 0.3 * rng.normal(size=1200)
+    df['f30'] = -df['f12'] + 0.1 * rng.normal(size=1200)
+    df.loc[rng.choice(1200, 100, replace=False), 'f0'] = np.nan
+    df['label'] = (df['f5'] + rng.normal(size=1200) > 0).astype(int)
+    expected = df.drop(columns='label').corr()
+    expected_pairs = [(a, b) for i, a in enumerate(expected.columns) for b in expected.columns[i + 1:]
+                      if abs(expected.loc[a, b]) > 0.8]
+
+    auditor = DatasetAuditor(dataset=df, target_column='label')
+    auditor.task_type = 'classification'
+    report = auditor.generate_statistical_report()
+    assert [(p['feature1'], p['feature2']) for p in report['high_correlations']] == expected_pairs
+    assert np.isclose(report['correlation_matrix']['f0']['f1'], expected.loc['f0', 'f1'], atol=1e-5)
+    assert np.isclose(report['feature_importance']['f5'], abs(df['f5'].corr(df['label'])), atol=1e-5)
+
+    sparse = DatasetAuditor(dataset=df, target_column='label', correlation_output='sparse',
+                            top_k_correlations=1).generate_statistical_report()
+    assert sparse['high_correlations'][0]['feature1'] == 'f12'
+    assert set(sparse['correlation_matrix']) == {'f12', 'f30'}
+
+    streamed = DatasetAuditor(dataset=df, target_column='label', chunksize=250)
+    streamed.preprocess()
+    assert streamed.generate_statistical_report()['high_correlations'] == [
+        {**p, 'correlation': pytest.approx(p['correlation'], abs=1e-5)} for p in report['high_correlations']]
+
+def test_proxy_scan_flags_planted_proxy():
+    rng = np.random.default_rng(8)
+    sex = rng.choice(['F', 'M'], 20000)
+    df = pd.DataFrame({
+        'sex': sex,
+        'zip_code': np.where(rng.random(20000) < 0.85, sex, 'X') + rng.choice(['1', '2'], 20000),
+        'height': 165 + 10 * (sex == 'M') + rng.normal(0, 7, 20000),
+        'noise': rng.normal(size=20000),
+        'label': rng.integers(0, 2, 20000)
+    })
+    results = {r['feature']: r for r in DatasetAuditor(dataset=df, protected_attributes=['sex'],
+                                                       target_column='label').detect_proxies()}
+    assert set(results) == {'zip_code', 'height', 'noise'}
+    assert results['zip_code']['is_proxy'] and not results['noise']['is_proxy']
+
+    joint = pd.crosstab(df['sex'], df['zip_code']).to_numpy() / len(df)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = np.nansum(joint * np.log(joint / np.outer(joint.sum(1), joint.sum(0))))
+    assert np.isclose(results['zip_code']['mutual_information'], expected)
+
+    sampled = DatasetAuditor(dataset=df, protected_attributes=['sex'], target_column='label',
+                             chunksize=4000).detect_proxies(method='cramers_v', sample_size=5000, random_state=0)
+    zip_code = [r for r in sampled if r['feature'] == 'zip_code'][0]
+    low, high = zip_code['confidence_interval']['score']
+    assert low <= zip_code['score'] <= high and high - low < 0.1
+
+def test_quick_audit_weights_stratified_sample():
+    rng = np.random.default_rng(4)
+    sex = rng.choice(['F', 'M'], 30000, p=[0.2, 0.8])
+    df = pd.DataFrame({
+        'sex': sex,
+        'income': rng.normal(size=30000),
+        'label': (rng.random(30000) < np.where(sex == 'M', 0.6, 0.3)).astype(int)
+    })
+    full = DatasetAuditor(dataset=df, protected_attributes=['sex'], target_column='label').audit()
+    quick = DatasetAuditor(dataset=df, protected_attributes=['sex'], target_column='label',
+                           chunksize=7000).audit(sample_fraction=0.05, random_state=0)
+
+    assert quick['sampling']['population_size'] == len(df)
+    assert quick['sampling']['sample_size'] < len(df) / 10
+    # Strata include the target, so the weighted group rates are exact
+    for expected, result in zip(full['bias_detection'], quick['bias_detection']):
+        assert np.isclose(result['value'], expected['value'])
+        assert 'confidence_interval' in result['details']
+    parity = quick['fairness_metrics']['sex']['demographic_parity']
+    assert np.isclose(parity.difference, full['fairness_metrics']['sex']['demographic_parity'].difference)
+    assert parity.details['sample_size'] == quick['sampling']['sample_size']
+
+def test_encoder_registry_reused_across_audits(tmp_path):
+    from sklearn.preprocessing import LabelEncoder
+    from fairsight import EncoderRegistry
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({
+        'city': rng.choice(['Pune', 'Austin', 'Lagos', 'Oslo'], 5000),
+        'sex': rng.choice(['F', 'M'], 5000),
+        'label': rng.integers(0, 2, 5000)
+    })
+    auditor = DatasetAuditor(dataset=df, protected_attributes=['sex'], target_column='label')
+    info = auditor.preprocess()
+    assert auditor.df['city'].dtype == np.int8
+    assert np.array_equal(auditor.df['city'], LabelEncoder().fit_transform(df['city']))
+    assert info['categorical_memory']['after_bytes'] < info['categorical_memory']['before_bytes'] / 10
+    auditor.encoders.save(tmp_path / 'encoders.json')
+
+    nightly = df.head(100).copy()
+    nightly.loc[:9, 'city'] = 'Lima'
+    rerun = DatasetAuditor(dataset=nightly, protected_attributes=['sex'], target_column='label',
+                           encoders=EncoderRegistry.load(tmp_path / 'encoders.json'))
+    info = rerun.preprocess()
+    assert info['unseen_categories'] == {'city': 10}
+    assert (rerun.df['city'][:10] == -1).all()
+    assert np.array_equal(rerun.df['city'][10:], auditor.df['city'][10:100])
+
+def test_quick_audit_leaves_encoder_registry_unfitted():
+    rng = np.random.default_rng(8)
+    df = pd.DataFrame({
+        'city': rng.choice(['Pune', 'Austin'], 5000),
+        'sex': rng.choice(['F', 'M'], 5000),
+        'label': rng.integers(0, 2, 5000)
+    })
+    df.loc[17, 'city'] = 'rare'
+    auditor = DatasetAuditor(dataset=df, protected_attributes=['sex'], target_column='label')
+    auditor.audit(quick=True, random_state=0)
+    assert 'city' not in auditor.encoders
+    assert auditor.preprocess()['unseen_categories'] == {}
+    assert set(auditor.encoders['city'].classes_) == {'Pune', 'Austin', 'rare'}
+
+def test_category_encoder_keeps_missing_as_one_category():
+    from fairsight import EncoderRegistry
+    from fairsight.encoding import CategoryEncoder
+    encoder = CategoryEncoder()
+    codes = encoder.fit_transform(pd.Series(['b', None, 'a', np.nan, 'b']))
+    assert list(codes) == [1, 2, 0, 2, 1]
+    reloaded = EncoderRegistry.from_dict({'city': encoder.to_dict()})['city']
+    assert list(reloaded.transform(pd.Series([np.nan, 'a', 'z']))) == [2, 0, -1]
+
 if __name__ == '__main__':
     print('--- Demo: DatasetAuditor ---')
     demo_dataset_auditor() 
\ No newline at end of file
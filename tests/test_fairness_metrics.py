@@ -1,8 +1,12 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import pandas as pd
 import numpy as np
-from fairsight import FairnessMetrics, FairnessEngine, compute_demographic_parity, compute_equal_opportunity, compute_predictive_parity
+import pytest
+from fairsight import FairnessMetrics, FairnessEngine, FairnessAccumulator, compute_demographic_parity, compute_equal_opportunity, compute_predictive_parity
+from fairsight.fairness_metrics import compute_group_confusion, FairnessCube
 
 def demo_fairness_metrics():
     y_true = np.array([1, 0, 1, 0])
@@ -21,6 +25,272 @@ def demo_fairness_metrics():
     print('compute_equal_opportunity:', compute_equal_opportunity(y_true, y_pred, protected, privileged_group=0))
     print('compute_predictive_parity:', compute_predictive_parity(y_true, y_pred, protected, privileged_group=0))
 
+def test_group_confusion_matches_masks():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 200)
+    y_pred = rng.integers(0, 2, 200)
+    groups = rng.choice(['a', 'b', 'c'], 200)
+    values, confusion = compute_group_confusion(y_true, y_pred, groups)
+    assert list(values) == ['a', 'b', 'c']
+    for i, value in enumerate(values):
+        mask = groups == value
+        tp = np.sum((y_pred[mask] == 1) & (y_true[mask] == 1))
+        fp = np.sum((y_pred[mask] == 1) & (y_true[mask] == 0))
+        fn = np.sum((y_pred[mask] == 0) & (y_true[mask] == 1))
+        tn = np.sum((y_pred[mask] == 0) & (y_true[mask] == 0))
+        assert list(confusion[i]) == [tp, fp, fn, tn]
+
+def test_group_metrics_read_cached_table():
+    y_true = np.array([1, 0, 1, 0, 1, 1])
+    y_pred = np.array([1, 0, 0, 0, 1, 0])
+    protected = np.array([0, 1, 0, 1, 1, 0])
+    fm = FairnessMetrics(y_true, y_pred, protected_attr=protected, privileged_group=0)
+    metrics = fm._group_metrics(0)
+    assert metrics['size'] == 3
+    assert metrics['true_positive_rate'] == 1 / 3
+    assert fm._group_metrics(7)['size'] == 0
+    assert fm.demographic_parity().ratio == (1 / 3) / (1 / 3)
+
+def test_compare_all_groups_matches_pairwise_results():
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 2, 300)
+    y_pred = rng.integers(0, 2, 300)
+    region = rng.choice(['n', 's', 'e', 'w'], 300)
+    fm = FairnessMetrics(y_true, y_pred, protected_attr=region, privileged_group='n')
+    table = fm.compare_all_groups().set_index('group')
+    assert len(table) == 4
+    for group in ['s', 'e', 'w']:
+        mask = np.isin(region, ['n', group])
+        dp = FairnessMetrics(y_true[mask], y_pred[mask], protected_attr=region[mask],
+                             privileged_group='n').demographic_parity()
+        assert np.isclose(table.loc[group, 'demographic_parity_ratio'], dp.ratio)
+        assert table.loc[group, 'demographic_parity_threshold_met'] == dp.threshold_met
+    pairs = fm.compare_all_groups(pairwise=True)
+    assert len(pairs) == 12
+
+def test_fairness_cube_rollup_matches_direct_counts():
+    rng = np.random.default_rng(2)
+    n = 500
+    y_true = rng.integers(0, 2, n)
+    y_pred = rng.integers(0, 2, n)
+    attrs = {
+        'gender': rng.choice(['F', 'M'], n),
+        'race': rng.choice(['x', 'y', 'z'], n),
+        'age_band': rng.choice(['<30', '30-50', '>50'], n),
+    }
+    cube = FairnessCube.from_arrays(y_true, y_pred, attrs)
+    assert cube.confusion.sum() == n
+    codes, confusion = cube.rollup(['race'])
+    values, direct = compute_group_confusion(y_true, y_pred, attrs['race'])
+    assert list(cube.levels[1][codes[:, 0]]) == list(values)
+    assert (confusion == direct).all()
+
+    results = FairnessEngine().analyze_intersectional(y_true, y_pred, attrs, min_support=25)
+    assert len(results) == 7
+    cells = results[('gender', 'race', 'age_band')]
+    assert (cells['size'] >= 25).all()
+    assert cells['is_reference'].sum() == 1
+
+def test_accumulator_matches_in_memory_metrics():
+    rng = np.random.default_rng(3)
+    y_true = rng.integers(0, 2, 1000)
+    y_pred = rng.integers(0, 2, 1000)
+    y_prob = rng.random(1000)
+    protected = rng.choice(['F', 'M'], 1000)
+    expected = FairnessMetrics(y_true, y_pred, y_prob, protected, privileged_group='M').compute_all_metrics()
+
+    acc = FairnessAccumulator(privileged_group='M')
+    for start in range(0, 1000, 128):
+        end = start + 128
+        acc.update(y_true[start:end], y_pred[start:end], protected[start:end], y_prob[start:end])
+    streamed = acc.finalize()
+
+    assert acc.n_rows == 1000
+    for key in ['demographic_parity', 'equal_opportunity', 'predictive_parity', 'calibration']:
+        assert np.isclose(streamed[key].ratio, expected[key].ratio)
+        assert streamed[key].threshold_met == expected[key].threshold_met
+
+def test_accumulator_sketches_merge_exactly():
+    rng = np.random.default_rng(4)
+    y_true = rng.integers(0, 2, 600)
+    y_pred = rng.integers(0, 2, 600)
+    y_prob = rng.random(600)
+    protected = rng.choice([0, 1, 2], 600)
+    whole = FairnessAccumulator().update(y_true, y_pred, protected, y_prob)
+    left = FairnessAccumulator().update(y_true[:250], y_pred[:250], protected[:250], y_prob[:250])
+    right = FairnessAccumulator().update(y_true[250:], y_pred[250:], protected[250:], y_prob[250:])
+    merged = FairnessAccumulator.from_dict(json.loads(json.dumps(right.to_dict()))).merge(left)
+
+    for a, b in zip(whole.group_statistics(), merged.group_statistics()):
+        assert np.allclose(a, b)
+
+def test_analyze_fairness_sharded_matches_serial():
+    rng = np.random.default_rng(5)
+    y_true = rng.integers(0, 2, 400)
+    y_pred = rng.integers(0, 2, 400)
+    attrs = {'gender': rng.choice(['F', 'M'], 400)}
+    engine = FairnessEngine()
+    serial = engine.analyze_fairness(y_true, y_pred, attrs)
+    sharded = engine.analyze_fairness(y_true, y_pred, attrs, n_jobs=2)
+    assert np.isclose(serial['gender']['demographic_parity'].ratio,
+                      sharded['gender']['demographic_parity'].ratio)
+
+def test_calibration_reliability_table_and_quantile_bins():
+    rng = np.random.default_rng(6)
+    y_prob = rng.random(800)
+    y_true = (rng.random(800) < y_prob).astype(int)
+    y_pred = (y_prob > 0.5).astype(int)
+    protected = rng.choice(['a', 'b'], 800)
+    fm = FairnessMetrics(y_true, y_pred, y_prob, protected, privileged_group='a',
+                         n_bins=4, calibration_strategy='quantile')
+    result = fm.calibration()
+    assert result.details['n_bins'] == 4
+    assert result.details['privileged_max_calibration_error'] >= result.privileged_value
+    table = fm.reliability_table()
+    assert len(table) == 8
+    assert table['count'].sum() == 800
+    # Equal-frequency bins hold roughly the same number of rows
+    assert table.groupby('bin')['count'].sum().between(190, 210).all()
+
+def test_bootstrap_confidence_intervals_cover_point_estimate():
+    rng = np.random.default_rng(7)
+    y_true = rng.integers(0, 2, 2000)
+    y_pred = rng.integers(0, 2, 2000)
+    protected = rng.choice(['a', 'b'], 2000, p=[0.9, 0.1])
+    fm = FairnessMetrics(y_true, y_pred, protected_attr=protected, privileged_group='a')
+    results = fm.compute_all_metrics(n_bootstrap=500, random_state=0)
+    dp = results['demographic_parity']
+    ci = dp.details['confidence_interval']
+    assert ci['n_bootstrap'] == 500
+    assert ci['difference'][0] <= dp.difference <= ci['difference'][1]
+    assert 0.0 <= ci['threshold_met_rate'] <= 1.0
+    assert 'confidence_interval' in results['performance_gaps']['accuracy'].details
+    sizes = fm.bootstrap_confusion(10, random_state=0).sum(axis=2)
+    assert (sizes == [dp.details['privileged_group_size'], dp.details['unprivileged_group_size']]).all()
+
+def test_analyze_over_time_matches_per_bucket_metrics():
+    rng = np.random.default_rng(8)
+    n = 3000
+    timestamps = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 90 * 24, n), unit='h')
+    y_true = rng.integers(0, 2, n)
+    y_pred = rng.integers(0, 2, n)
+    sex = rng.choice(['F', 'M'], n)
+    race = rng.choice(['a', 'b', None], n)
+    table = FairnessEngine().analyze_over_time(y_true, y_pred, timestamps, {'sex': sex, 'race': race}, freq='M')
+    assert list(table['time_bucket'].unique()) == list(pd.to_datetime(['2024-01-01', '2024-02-01', '2024-03-01']))
+    # Rows missing race still count for sex
+    sizes = table.groupby('attribute')['size'].sum()
+    assert sizes['sex'] == n and sizes['race'] == np.sum(race != None)  # noqa: E711
+
+    march = (timestamps.month == 3)
+    expected = FairnessMetrics(y_true[march], y_pred[march], protected_attr=sex[march],
+                               privileged_group='M').demographic_parity()
+    row = table[(table['time_bucket'] == '2024-03-01') & (table['group'] == 'F')].iloc[0]
+    assert np.isclose(row['demographic_parity_difference'], expected.difference)
+
+    empty = FairnessEngine().analyze_over_time(y_true, y_pred, timestamps, {}, freq='M')
+    assert empty.empty and list(empty.columns) == list(table.columns)
+
+def test_threshold_sweep_matches_refit_at_each_threshold():
+    rng = np.random.default_rng(9)
+    y_prob = rng.random(2000)
+    y_true = (rng.random(2000) < y_prob).astype(int)
+    groups = rng.choice(['a', 'b', 'c'], 2000)
+    fm = FairnessMetrics(y_true, (y_prob >= 0.5).astype(int), y_prob, groups, privileged_group='a')
+    sweep = fm.threshold_sweep()
+    assert len(sweep) == 3 * len(np.unique(y_prob))
+    for threshold in [0.2, 0.5, 0.8]:
+        table = fm.threshold_sweep([threshold]).set_index('group')
+        refit = FairnessMetrics(y_true, (y_prob >= threshold).astype(int), protected_attr=groups,
+                                privileged_group='a').compare_all_groups().set_index('group')
+        for column in ['size', 'positive_rate', 'demographic_parity_ratio', 'equal_opportunity_difference',
+                       'equal_false_positive_rate_difference', 'predictive_parity_threshold_met']:
+            assert np.allclose(table[column].astype(float), refit[column].astype(float))
+    curves = FairnessEngine().threshold_sweep(y_true, y_prob, {'group': groups}, thresholds=20)['group']
+    assert curves['threshold'].nunique() == 20
+
+def test_group_thresholds_satisfy_constraint_and_match_predictions():
+    rng = np.random.default_rng(10)
+    n = 20000
+    sex = rng.choice(['F', 'M'], n, p=[0.3, 0.7])
+    base_rate = np.where(sex == 'M', 0.6, 0.35)
+    y_true = (rng.random(n) < base_rate).astype(int)
+    y_prob = np.clip(0.3 * y_true + 0.4 * base_rate + rng.normal(0, 0.15, n), 0, 1)
+    result = FairnessEngine().optimize_thresholds(y_true, y_prob, {'sex': sex}, constraint='demographic_parity')['sex']
+    assert result['constraint_satisfied']
+    assert not result['before']['demographic_parity'].threshold_met
+    assert result['after']['demographic_parity'].threshold_met
+
+    y_pred = result['optimizer'].predict(y_prob, sex)
+    refit = FairnessMetrics(y_true, y_pred, protected_attr=sex, privileged_group='M').demographic_parity()
+    assert np.isclose(refit.ratio, result['after']['demographic_parity'].ratio)
+
+def test_sample_weight_matches_replicated_rows():
+    rng = np.random.default_rng(11)
+    y_true = rng.integers(0, 2, 800)
+    y_pred = rng.integers(0, 2, 800)
+    y_prob = rng.random(800)
+    groups = rng.choice(['a', 'b'], 800)
+    weights = rng.integers(1, 5, 800)
+    rows = np.repeat(np.arange(800), weights)
+    weighted = FairnessMetrics(y_true, y_pred, y_prob, groups, privileged_group='a',
+                               sample_weight=weights.astype(float)).compute_all_metrics()
+    replicated = FairnessMetrics(y_true[rows], y_pred[rows], y_prob[rows], groups[rows],
+                                 privileged_group='a').compute_all_metrics()
+    for key in ['demographic_parity', 'equal_opportunity', 'predictive_parity', 'calibration']:
+        assert np.isclose(weighted[key].ratio, replicated[key].ratio)
+    assert weighted['demographic_parity'].details['privileged_group_size'] == (weights * (groups == 'a')).sum()
+
+    engine = FairnessEngine()
+    sweep = engine.threshold_sweep(y_true, y_prob, {'g': groups}, privileged_groups={'g': 'a'},
+                                   thresholds=[0.3, 0.6], sample_weight=weights)['g']
+    expected = engine.threshold_sweep(y_true[rows], y_prob[rows], {'g': groups[rows]},
+                                      privileged_groups={'g': 'a'}, thresholds=[0.3, 0.6])['g']
+    assert np.allclose(sweep['equalized_odds_difference'], expected['equalized_odds_difference'])
+
+def test_mitigation_simulator_matches_row_level_metrics():
+    from fairsight import MitigationSimulator, Reweighing
+    rng = np.random.default_rng(21)
+    groups = rng.choice(['F', 'M'], 2000, p=[0.4, 0.6])
+    y_true = (rng.random(2000) < np.where(groups == 'M', 0.6, 0.35)).astype(int)
+    y_prob = np.clip(0.3 * y_true + 0.7 * rng.random(2000), 0, 1)
+    simulator = MitigationSimulator.from_arrays(y_true, y_prob, groups, privileged_group='M')
+    table = simulator.evaluate(thresholds=[[0.4, 0.6]], weights=simulator.reweighing_candidates([1.0]))
+
+    # Threshold pair: same as thresholding the rows; full reweighing: same as weighted metrics
+    y_pred = (y_prob >= np.where(groups == 'M', 0.6, 0.4)).astype(int)
+    weights = Reweighing('g', 'y').compute_weights(pd.DataFrame({'g': groups, 'y': y_true}))
+    for row, kwargs in [(1, {}), (2, {'sample_weight': weights})]:
+        pred = y_pred if row == 1 else (y_prob >= 0.5).astype(int)
+        reference = FairnessMetrics(y_true, pred, None, groups, privileged_group='M', **kwargs)
+        results = reference.compute_all_metrics()
+        assert np.isclose(table.loc[row, 'disparate_impact'], results['demographic_parity'].ratio)
+        assert np.isclose(table.loc[row, 'statistical_parity_difference'], results['demographic_parity'].difference)
+        assert np.isclose(table.loc[row, 'accuracy'], np.average(pred == y_true, weights=kwargs.get('sample_weight')))
+
+    result = FairnessEngine().simulate_mitigations(y_true, y_prob, {'sex': groups}, {'sex': 'M'},
+                                                   fairness_metric='disparate_impact')['sex']
+    frontier = result['frontier']
+    assert len(result['candidates']) == 1 + 16 ** 2 + 11
+    assert frontier['unfairness'].is_monotonic_increasing and frontier['accuracy'].is_monotonic_increasing
+    ratio = result['candidates']['disparate_impact'].to_numpy()
+    unfairness = 1 - np.minimum(ratio, 1 / ratio)
+    accuracy = result['candidates']['accuracy'].to_numpy()
+    dominated = (accuracy[:, None] > frontier['accuracy'].to_numpy()) & (
+        unfairness[:, None] < frontier['unfairness'].to_numpy())
+    assert not dominated.any()
+
+def test_replicate_intervals_skip_missing_privileged_group():
+    rng = np.random.default_rng(12)
+    groups = rng.choice(['F', 'X'], 200)
+    fm = FairnessMetrics(rng.integers(0, 2, 200), rng.integers(0, 2, 200), protected_attr=groups,
+                         privileged_group='M')
+    _, confusion = fm._group_table()
+    results = fm.compute_all_metrics(replicate_confusion=np.repeat(confusion[None], 5, axis=0))
+    assert 'confidence_interval' not in results['demographic_parity'].details
+    with pytest.raises(ValueError, match='replicate_confusion'):
+        fm.compute_all_metrics(replicate_confusion=confusion)
+
 if __name__ == '__main__':
     print('--- Demo: FairnessMetrics & FairnessEngine ---')
     demo_fairness_metrics() 
\ No newline at end of file
@@ -1,9 +1,10 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
-from fairsight import ModelAuditor
+from fairsight import ModelAuditor, PredictionCache
 
 def demo_model_auditor():
     df = pd.DataFrame({
@@ -22,6 +23,89 @@ def demo_model_auditor():
     print('Explanations:', auditor.explain_model(sample_size=2, methods=['SHAP']))
     print('Feature Importance:', auditor.analyze_feature_importance())
 
+class CountingModel:
+    """Wraps a fitted model and counts inference passes."""
+
+    def __init__(self, model):
+        self.model = model
+        self.calls = 0
+
+    def __getstate__(self):
+        # Keep the call counter out of the model fingerprint
+        return {'model': self.model, 'calls': 0}
+
+    def predict(self, X):
+        self.calls += 1
+        return self.model.predict(X)
+
+    def predict_proba(self, X):
+        self.calls += 1
+        return self.model.predict_proba(X)
+
+
+def _audit_data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({'category': rng.integers(0, 2, 200), 'feature': rng.normal(size=200)})
+    y = pd.Series((X['feature'] + rng.normal(scale=0.5, size=200) > 0).astype(int), name='intent')
+    return X, y
+
+
+def test_model_audit_runs_inference_once_per_method(tmp_path):
+    X, y = _audit_data()
+    model = CountingModel(LogisticRegression().fit(X, y))
+    cache = PredictionCache(cache_dir=str(tmp_path))
+    auditor = ModelAuditor(model=model, X_test=X, y_test=y, protected_attributes=['category'],
+                           target_column='intent', prediction_cache=cache)
+    auditor.evaluate_performance()
+    auditor.detect_bias()
+    auditor.compute_fairness_metrics()
+    auditor.analyze_feature_importance()
+    assert model.calls == 2  # one predict, one predict_proba
+    assert np.array_equal(auditor._predict(), model.model.predict(X))
+
+    # A fresh cache over the same directory skips inference entirely
+    rerun = CountingModel(model.model)
+    auditor = ModelAuditor(model=rerun, X_test=X, y_test=y, protected_attributes=['category'],
+                           target_column='intent', prediction_cache=PredictionCache(cache_dir=str(tmp_path)))
+    auditor.evaluate_performance()
+    assert rerun.calls == 0
+
+def test_prediction_cache_tracks_refits_and_stays_bounded():
+    X, y = _audit_data()
+    model = LogisticRegression().fit(X, y)
+    cache = PredictionCache(max_entries=2)
+    assert np.array_equal(cache.predict(model, X), model.predict(X))
+    # Refitting in place changes the model digest, so stale predictions are not served
+    model.fit(X, 1 - y)
+    assert np.array_equal(cache.predict(model, X), model.predict(X))
+    assert cache.hits == 0
+
+    for i in range(3):
+        cache.predict(model, X.iloc[i * 50:(i + 1) * 50])
+    cache.predict(model, X.iloc[150:], memoize=False)
+    assert len(cache._entries) == 2
+
+class PickleCountingModel(CountingModel):
+    """Counts how often the model is pickled for its cache key."""
+    pickles = 0
+
+    def __getstate__(self):
+        PickleCountingModel.pickles += 1
+        return super().__getstate__()
+
+
+def test_model_audit_hits_do_not_repickle_model():
+    X, y = _audit_data()
+    model = PickleCountingModel(LogisticRegression().fit(X, y))
+    PickleCountingModel.pickles = 0
+    auditor = ModelAuditor(model=model, X_test=X, y_test=y, protected_attributes=['category'],
+                           target_column='intent')
+    auditor.evaluate_performance()
+    auditor.detect_bias()
+    auditor.compute_fairness_metrics()
+    assert PickleCountingModel.pickles == 1
+    assert model.calls == 2 and auditor.prediction_cache.hits > 0
+
 if __name__ == '__main__':
     print('--- Demo: ModelAuditor ---')
     demo_model_auditor() 
\ No newline at end of file
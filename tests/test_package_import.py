@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Cold `import fairsight` must stay well under a serverless worker's start-up budget
+IMPORT_BUDGET_SECONDS = 1.0
+HEAVY_MODULES = ['torch', 'faiss', 'sentence_transformers', 'shap', 'lime',
+                 'matplotlib', 'seaborn', 'hdbcli', 'sklearn']
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import fairsight
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "loaded": sorted(m for m in %r if m in sys.modules)}))
+""" % (HEAVY_MODULES,)
+
+
+def _probe():
+    output = subprocess.run([sys.executable, '-c', IMPORT_PROBE], cwd=PACKAGE_ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_is_lazy_and_within_budget():
+    result = _probe()
+    assert result['loaded'] == []
+    assert result['elapsed'] < IMPORT_BUDGET_SECONDS
+
+
+def test_public_names_resolve_on_access():
+    import fairsight
+    for name in fairsight.__all__:
+        assert getattr(fairsight, name) is not None
+    assert 'FairnessEngine' in dir(fairsight)
+
+
+if __name__ == '__main__':
+    print('--- Benchmark: import fairsight ---')
+    print(_probe())
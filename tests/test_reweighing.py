@@ -0,0 +1,40 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
+import pandas as pd
+from fairsight import Reweighing
+
+def test_weights_match_marginal_formula_and_decorrelate():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'sex': rng.choice(['F', 'M'], 4000, p=[0.3, 0.7]),
+        'race': rng.choice(['a', 'b', 'c'], 4000),
+    })
+    df['label'] = (rng.random(4000) < np.where(df['sex'] == 'M', 0.6, 0.3)).astype(int)
+    weights = Reweighing('sex', 'label').compute_weights(df)
+    p_sex = df['sex'].value_counts(normalize=True)
+    p_label = df['label'].value_counts(normalize=True)
+    joint = df.groupby(['sex', 'label']).size() / len(df)
+    expected = [p_sex[s] * p_label[y] / joint[(s, y)] for s, y in zip(df['sex'], df['label'])]
+    assert np.allclose(weights, expected)
+
+    # Intersectional weights make the label independent of every (sex, race) group
+    weights = Reweighing(['sex', 'race'], 'label').compute_weights(df)
+    rates = df.assign(w=weights * df['label']).groupby(['sex', 'race'])['w'].sum() / \
+        pd.Series(weights).groupby([df['sex'], df['race']]).sum()
+    assert np.allclose(rates, df['label'].mean())
+
+def test_streaming_weights_written_to_memmap(tmp_path):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({'sex': rng.choice(['F', 'M'], 5000), 'label': rng.integers(0, 2, 5000)})
+    df.loc[:9, 'sex'] = None
+    in_memory = Reweighing('sex', 'label').compute_weights(df)
+    path = tmp_path / 'data.csv'
+    df.to_csv(path, index=False)
+
+    rw = Reweighing('sex', 'label').fit(str(path), chunksize=700)
+    weights = rw.write_weights(str(path), str(tmp_path / 'weights.npy'), chunksize=700)
+    assert weights.dtype == np.float32 and rw.n_rows_ == len(df)
+    assert np.allclose(np.load(tmp_path / 'weights.npy'), in_memory)
+    assert (weights[:10] == 1.0).all()
@@ -25,6 +25,27 @@ def demo_utils():
     df3 = pd.DataFrame({'a': [1, 2], 'b': [3, 4]})
     print('create_summary_stats:', Utils.create_summary_stats(df3))
 
+def test_profile_cache_shared_and_invalidated():
+    from fairsight import DatasetProfile, column_profile
+    df = pd.DataFrame({'sex': ['M', 'F', 'M', None, 'F', 'M'], 'score': [3, 1, 2, 2, 1, 1]})
+    profile = DatasetProfile(df)
+    assert profile['sex'].missing == 1 and profile['sex'].n_unique == 2
+    assert profile['score'].mode == df['score'].mode().iloc[0] == 1
+    # Views of the same data hit the cache; imputing a column changes its digest
+    assert column_profile(df[['sex']].copy()['sex']) is profile['sex']
+    assert Utils.calculate_privilege_groups(df, ['sex']) == profile.privileged_groups(['sex']) == {'sex': 'M'}
+    filled = df['sex'].fillna('F')
+    assert column_profile(filled) is not profile['sex'] and column_profile(filled).missing == 0
+
+def test_profile_cache_sees_every_value():
+    from fairsight import column_profile
+    df = pd.DataFrame({'sex': np.where(np.arange(10_000) % 3 == 0, 'F', 'M')})
+    assert Utils.calculate_privilege_groups(df, ['sex']) == {'sex': 'M'}
+    # Rewrite only the rows between a stride of 9, keeping name, dtype, length and missing count
+    df.loc[(df.index % 9 != 0) & (df.index != len(df) - 1), 'sex'] = 'F'
+    assert column_profile(df['sex']).value_counts['F'] == (df['sex'] == 'F').sum()
+    assert Utils.calculate_privilege_groups(df, ['sex']) == {'sex': 'F'}
+
 if __name__ == '__main__':
     print('--- Demo: Utils ---')
     demo_utils() 
\ No newline at end of file